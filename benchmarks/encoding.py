@@ -0,0 +1,81 @@
+"""Benchmark encoding of a large tool result into MCP text content.
+
+Encodes a tools listing shaped like the one the stand-in docker binary
+(benchmarks/fake_docker.py) returns, FAKE_DOCKER_TOOLS tools for each of
+FAKE_DOCKER_SERVERS servers, and compares:
+
+- pretty: json.dumps(indent=2), the encoding used before compact output;
+- compact json: format_result with the standard library encoder;
+- compact <backend>: format_result with orjson or msgspec, if installed.
+
+Usage:
+    python benchmarks/encoding.py [--servers 20] [--tools 100] [--runs 50]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src"))
+
+import fake_docker  # noqa: E402
+from orchestrator import encoding  # noqa: E402
+
+
+def payload() -> dict:
+    """Build a list_active_tools-like result from the fake tools listing."""
+    tools = fake_docker.tools_ls()
+    for tool in tools:
+        tool["inputSchema"]["properties"]["query"] = {
+            "type": "string",
+            "description": f"Query for {tool['name']} of {tool['server']}",
+        }
+    return {"total_tools": len(tools), "all_tools": tools}
+
+
+def measure(label: str, encode, data: dict, runs: int):
+    """Time encoding runs and print the median and output size."""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        text = encode(data)
+        samples.append(time.perf_counter() - started)
+    size_kb = len(text.encode("utf-8")) / 1024
+    print(f"  {label:<16} {size_kb:8.0f} KB   median {statistics.median(samples) * 1000:7.2f} ms")
+
+
+def compact(data: dict) -> str:
+    return encoding.format_result(data)[0].text
+
+
+def compact_json(data: dict) -> str:
+    fast = encoding.orjson, encoding.msgspec
+    encoding.orjson = encoding.msgspec = None
+    try:
+        return compact(data)
+    finally:
+        encoding.orjson, encoding.msgspec = fast
+
+
+def main(args):
+    os.environ["FAKE_DOCKER_SERVERS"] = ",".join(f"server{i}" for i in range(args.servers))
+    os.environ["FAKE_DOCKER_TOOLS"] = str(args.tools)
+    data = payload()
+    print(f"{data['total_tools']} tools, {args.runs} runs per variant")
+
+    measure("pretty", lambda d: json.dumps(d, indent=2), data, args.runs)
+    measure("compact json", compact_json, data, args.runs)
+    if encoding.backend() != "json":
+        measure(f"compact {encoding.backend()}", compact, data, args.runs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=20, help="servers in the listing")
+    parser.add_argument("--tools", type=int, default=100, help="tools per server")
+    parser.add_argument("--runs", type=int, default=50, help="runs per variant")
+    main(parser.parse_args())
@@ -0,0 +1,96 @@
+"""Stand-in for the `docker` CLI used by the benchmarks.
+
+Handles the `docker mcp` commands the orchestrator runs:
+
+- `server ls --json`, `server enable`, `server disable` and
+  `server inspect <server>` for the servers in FAKE_DOCKER_SERVERS
+  (comma-separated, default "stub");
+- `tools ls --format=json`, listing FAKE_DOCKER_TOOLS tools per server
+  (default 1, the first one named `echo`);
+- `tools call`, by spawning the stub server and handshaking with it per
+  call, as the real CLI does with the gateway.
+
+Every command first sleeps FAKE_DOCKER_LATENCY seconds (default 0) to
+emulate CLI startup and gateway round trips.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STUB_SERVER = os.path.join(HERE, "stub_server.py")
+
+
+def install(directory: str):
+    """
+    Put a `docker` shim running this script first on PATH.
+
+    Args:
+        directory: Directory to create the shim in
+    """
+    shim = os.path.join(directory, "docker")
+    with open(shim, "w") as f:
+        f.write(f'#!/bin/sh\nexec "{sys.executable}" "{os.path.abspath(__file__)}" "$@"\n')
+    os.chmod(shim, 0o755)
+    os.environ["PATH"] = directory + os.pathsep + os.environ["PATH"]
+
+
+def servers() -> list:
+    """Names of the fake servers."""
+    return [s for s in os.environ.get("FAKE_DOCKER_SERVERS", "stub").split(",") if s]
+
+
+def tools_ls() -> list:
+    """Tools of every fake server in `tools ls` format."""
+    count = int(os.environ.get("FAKE_DOCKER_TOOLS", "1"))
+    return [
+        {
+            "name": "echo" if i == 0 else f"tool_{i}",
+            "server": server,
+            "description": f"Tool {i} of {server}",
+            "inputSchema": {"type": "object", "properties": {"q": {"type": "integer"}}},
+        }
+        for server in servers()
+        for i in range(count)
+    ]
+
+
+async def call_tool(tool_name: str, arguments: dict) -> str:
+    """Call a tool of the stub server over a fresh stdio session."""
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(command=sys.executable, args=[STUB_SERVER])
+    async with stdio_client(params) as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            result = await session.call_tool(tool_name, arguments)
+    return "\n".join(c.text for c in result.content if c.type == "text")
+
+
+def main(args: list) -> int:
+    time.sleep(float(os.environ.get("FAKE_DOCKER_LATENCY", "0")))
+    if args[:3] == ["mcp", "server", "ls"]:
+        print(json.dumps([{"name": server} for server in servers()]))
+        return 0
+    if args[:3] in (["mcp", "server", "enable"], ["mcp", "server", "disable"]):
+        return 0
+    if args[:3] == ["mcp", "server", "inspect"]:
+        print(json.dumps({"name": args[3], "prompt": f"Use {args[3]} for stub tasks."}))
+        return 0
+    if args[:3] == ["mcp", "tools", "ls"]:
+        print(json.dumps(tools_ls()))
+        return 0
+    if args[:3] == ["mcp", "tools", "call"]:
+        arguments = json.loads(args[args.index("--arguments") + 1]) if "--arguments" in args else {}
+        print(asyncio.run(call_tool(args[3], arguments)))
+        return 0
+    print(f"unsupported: docker {' '.join(args)}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,73 @@
+"""Benchmark peak memory of capturing a large command output.
+
+Compares buffering everything with communicate() and decoding it, as
+run_command used to, with streaming capture capped at max_output_bytes
+(run_command_output), which spills the rest to a temp file.
+
+Usage:
+    python benchmarks/output_memory.py [--size-mb 200] [--cap-mb 10]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from orchestrator.utils import run_command_output  # noqa: E402
+
+
+def writer_command(size_mb: int) -> list:
+    """Command writing size_mb MB to stdout in 1 MB chunks."""
+    script = (
+        "import sys\n"
+        "chunk = b'x' * (1024 * 1024)\n"
+        f"for _ in range({size_mb}):\n"
+        "    sys.stdout.buffer.write(chunk)\n"
+    )
+    return [sys.executable, "-c", script]
+
+
+async def communicate(cmd: list) -> int:
+    """Capture output the old way: buffer all of it, then decode."""
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, _ = await process.communicate()
+    return len(stdout.decode("utf-8"))
+
+
+async def streaming(cmd: list, cap: int) -> int:
+    """Capture output with run_command_output, capped in memory."""
+    output, _ = await run_command_output(cmd, max_output_bytes=cap)
+    output.discard()
+    return output.total_bytes
+
+
+def measure(label: str, coro) -> None:
+    """Run a capture and print its peak traced memory and duration."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = asyncio.run(coro)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {label:<22} peak {peak / 2**20:8.1f} MB   {elapsed:5.2f} s   "
+        f"({size / 2**20:.0f} MB read)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=200, help="output size in MB")
+    parser.add_argument("--cap-mb", type=int, default=10, help="max_output_bytes in MB")
+    args = parser.parse_args()
+
+    cmd = writer_command(args.size_mb)
+    print(f"{args.size_mb} MB of stdout")
+    measure("communicate + decode", communicate(cmd))
+    measure(f"streaming, {args.cap_mb} MB cap", streaming(cmd, args.cap_mb * 1024 * 1024))
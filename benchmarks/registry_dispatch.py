@@ -0,0 +1,67 @@
+"""Benchmark tool handler dispatch: registry dict vs if/elif chain.
+
+Loads the real tool registry and binds its handlers, then times how long
+it takes to resolve a tool name to its handler:
+
+- registry: one lookup in the dict returned by bind_handlers, as
+  handle_tool_call does;
+- elif chain: an if/elif chain over the same names in listing order, as
+  handle_tool_call did before the registry.
+
+The first, middle and last tool of the listing are timed, since the cost
+of the chain grows with the position of the tool.
+
+Usage:
+    python benchmarks/registry_dispatch.py [--number 200000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src"))
+
+from orchestrator.tools.registry import bind_handlers, load_tools  # noqa: E402
+
+DEPENDENCIES = ("docker_client", "cache", "proxy", "prompt_manager")
+
+
+def elif_chain(names: list, handlers: dict):
+    """Build a resolver with one if/elif branch per tool name."""
+    lines = ["def resolve(name):"]
+    for i, name in enumerate(names):
+        lines.append(f"    {'if' if i == 0 else 'elif'} name == {name!r}:")
+        lines.append(f"        return handlers[{name!r}]")
+    lines.append("    return None")
+    namespace = {"handlers": handlers}
+    exec("\n".join(lines), namespace)
+    return namespace["resolve"]
+
+
+def main(args):
+    registrations = load_tools()
+    handlers = bind_handlers(registrations, {dep: None for dep in DEPENDENCIES})
+    names = [registration.name for registration in registrations]
+    resolve = elif_chain(names, handlers)
+    print(f"{len(names)} tools, {args.number} lookups per variant (ns per lookup)")
+
+    for label, name in (
+        ("first", names[0]),
+        ("middle", names[len(names) // 2]),
+        ("last", names[-1]),
+    ):
+        namespace = {"handlers": handlers, "resolve": resolve, "name": name}
+        registry_ns = timeit.timeit("handlers.get(name)", globals=namespace, number=args.number)
+        chain_ns = timeit.timeit("resolve(name)", globals=namespace, number=args.number)
+        print(
+            f"  {label:<7} {name:<24} registry {registry_ns / args.number * 1e9:6.0f}   "
+            f"elif chain {chain_ns / args.number * 1e9:6.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200000, help="lookups per variant")
+    main(parser.parse_args())
@@ -0,0 +1,77 @@
+"""Benchmark tool call latency over a long-lived MCP session vs the CLI.
+
+Both paths call the `echo` tool of a local stub MCP server
+(benchmarks/stub_server.py). The CLI path goes through a stand-in `docker`
+binary (benchmarks/fake_docker.py) that spawns and handshakes with the
+stub server on every call, like `docker mcp tools call` does.
+
+Usage:
+    python benchmarks/session_vs_cli.py [--calls 50]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src"))
+
+import fake_docker  # noqa: E402
+from orchestrator.connection_pool import MCPConnectionPool  # noqa: E402
+from orchestrator.docker_client import DockerMCPClient  # noqa: E402
+
+
+def percentiles(samples: list) -> str:
+    """Format p50/p99 of latency samples in milliseconds."""
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50 {statistics.median(ordered) * 1000:8.1f} ms   p99 {p99 * 1000:8.1f} ms"
+
+
+async def measure(pool: MCPConnectionPool, calls: int) -> list:
+    """Time sequential calls through the pool."""
+    samples = []
+    for i in range(calls):
+        started = time.perf_counter()
+        result = await pool.call_tool("echo", {"q": i}, "stub")
+        samples.append(time.perf_counter() - started)
+        assert result == {"q": i}, result
+    return samples
+
+
+async def main(calls: int):
+    docker_client = DockerMCPClient()
+
+    session_pool = MCPConnectionPool(
+        docker_client,
+        session_command=[sys.executable, os.path.join(HERE, "stub_server.py")],
+        session_open_wait=30,
+    )
+    # Open the session and list active servers up front so only calls are measured
+    await session_pool.get_session("stub")
+    await session_pool.get_server_info("stub")
+    try:
+        session = await measure(session_pool, calls)
+    finally:
+        await session_pool.close_all_sessions()
+
+    cli_pool = MCPConnectionPool(docker_client, use_sessions=False)
+    await cli_pool.get_server_info("stub")
+    cli = await measure(cli_pool, calls)
+
+    print(f"{calls} sequential calls")
+    print(f"  session  {percentiles(session)}")
+    print(f"  cli      {percentiles(cli)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50, help="calls per path")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as shim_dir:
+        fake_docker.install(shim_dir)
+        asyncio.run(main(args.calls))
@@ -0,0 +1,97 @@
+"""Benchmark start_servers with concurrent vs sequential discovery.
+
+Runs the start_servers handler against the stand-in docker binary
+(benchmarks/fake_docker.py), where every CLI command takes --latency
+seconds. The sequential baseline runs the same CLI commands one after
+another: enable, one tools listing, then one inspect per server.
+
+Usage:
+    python benchmarks/start_servers.py [--servers 8] [--latency 0.3] [--runs 3]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src"))
+
+import fake_docker  # noqa: E402
+from orchestrator.cache import MetadataCache  # noqa: E402
+from orchestrator.connection_pool import MCPConnectionPool  # noqa: E402
+from orchestrator.docker_client import DockerMCPClient  # noqa: E402
+from orchestrator.prompt_manager import PromptManager  # noqa: E402
+from orchestrator.proxy import ToolProxy  # noqa: E402
+from orchestrator.tools.servers.start import handle_tool  # noqa: E402
+
+
+def components(max_parallel: int):
+    """Build fresh (cold cache) components."""
+    docker_client = DockerMCPClient()
+    cache = MetadataCache()
+    proxy = ToolProxy(MCPConnectionPool(docker_client, use_sessions=False))
+    prompt_manager = PromptManager(cache, docker_client, max_parallel=max_parallel)
+    return docker_client, cache, proxy, prompt_manager
+
+
+async def concurrent(servers: list, max_parallel: int) -> dict:
+    """Start servers with the start_servers handler."""
+    docker_client, cache, proxy, prompt_manager = components(max_parallel)
+    return await handle_tool(
+        {"servers": servers},
+        docker_client=docker_client,
+        cache=cache,
+        proxy=proxy,
+        prompt_manager=prompt_manager,
+    )
+
+
+async def sequential(servers: list, max_parallel: int) -> dict:
+    """Start servers running each discovery step after the previous one."""
+    docker_client, cache, proxy, prompt_manager = components(max_parallel)
+    await docker_client.enable_servers(servers)
+    tools_by_server = await cache.get_tools_for_servers(servers, docker_client.get_tools_index)
+    prompts = {}
+    for server in servers:
+        await proxy.register_server(server, tools_by_server[server])
+        prompts[server] = await prompt_manager.get_server_prompt(server)
+    return {"servers": servers, "prompts": prompts}
+
+
+async def measure(label: str, start, servers: list, max_parallel: int, runs: int):
+    """Time start_servers runs and print the median."""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = await start(servers, max_parallel)
+        samples.append(time.perf_counter() - started)
+        assert len(result["prompts"]) == len(servers), result
+    print(f"  {label:<12} median {statistics.median(samples):6.2f} s   min {min(samples):6.2f} s")
+
+
+async def main(args):
+    servers = [f"server{i}" for i in range(args.servers)]
+    os.environ["FAKE_DOCKER_SERVERS"] = ",".join(servers)
+    os.environ["FAKE_DOCKER_LATENCY"] = str(args.latency)
+    print(
+        f"{args.servers} servers, {args.latency * 1000:.0f} ms per CLI command, "
+        f"max_parallel_discovery={args.max_parallel}"
+    )
+    await measure("concurrent", concurrent, servers, args.max_parallel, args.runs)
+    await measure("sequential", sequential, servers, args.max_parallel, args.runs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=8, help="servers to start")
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds per CLI command")
+    parser.add_argument("--max-parallel", type=int, default=8, help="max_parallel_discovery")
+    parser.add_argument("--runs", type=int, default=3, help="runs per variant")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as shim_dir:
+        fake_docker.install(shim_dir)
+        asyncio.run(main(args))
@@ -0,0 +1,23 @@
+"""Minimal stdio MCP server used by the benchmarks.
+
+Set STUB_START_DELAY to delay startup by that many seconds, e.g. to emulate
+a slow gateway.
+"""
+
+import os
+import time
+
+from mcp.server.fastmcp import FastMCP
+
+mcp = FastMCP("stub", log_level="WARNING")
+
+
+@mcp.tool()
+def echo(q: int = 0) -> dict:
+    """Return the arguments back."""
+    return {"q": q}
+
+
+if __name__ == "__main__":
+    time.sleep(float(os.environ.get("STUB_START_DELAY", "0")))
+    mcp.run()
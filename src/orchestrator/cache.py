@@ -1,12 +1,160 @@
 """Metadata cache manager."""
 
+import asyncio
+import json
 import logging
-from typing import Any, Dict, Optional
-
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .disk_cache import DiskCache
+from .metrics import (
+    cache_evictions,
+    cache_fetch_duration,
+    cache_hits,
+    cache_misses,
+    cache_stale_hits,
+)
 from .models import CachedItem, ServerMetadata, Tool
 
 logger = logging.getLogger(__name__)
 
+# Cache category of each fetch key prefix, for metrics
+_FETCH_KEY_CATEGORIES = {
+    "servers": "servers",
+    "metadata": "server_metadata",
+    "tools_index": "tools",
+    "prompts": "prompts",
+}
+
+
+def _fetch_key_category(fetch_key: str) -> str:
+    """Get cache category of a fetch key."""
+    return _FETCH_KEY_CATEGORIES.get(fetch_key.split(":", 1)[0], "other")
+
+
+def estimate_size(data: Any) -> int:
+    """
+    Estimate memory footprint of cached data by its serialized size.
+
+    Args:
+        data: Cached data
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(data, BaseModel):
+        return len(data.model_dump_json())
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    if isinstance(data, (list, tuple)):
+        return sum(estimate_size(item) for item in data) + 2
+    if isinstance(data, dict):
+        return sum(len(str(k)) + estimate_size(v) for k, v in data.items()) + 2
+    try:
+        return len(json.dumps(data, default=str))
+    except (TypeError, ValueError):
+        return len(repr(data))
+
+
+class LRUCacheMap:
+    """Mapping of cache items bounded by entry count and total size, evicting LRU items."""
+
+    def __init__(
+        self,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        on_evict: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Initialize LRU map.
+
+        Args:
+            max_entries: Max number of entries (0 = unbounded)
+            max_bytes: Max estimated size of all entries in bytes (0 = unbounded)
+            on_evict: Called with the key of each evicted entry
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self.evictions = 0
+        self.bytes = 0
+
+        self._items: "OrderedDict[str, CachedItem]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[CachedItem]:
+        """Get an item, marking it as recently used."""
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+        return item
+
+    def __setitem__(self, key: str, item: CachedItem):
+        self.pop(key, None)
+        size = estimate_size(item.data)
+        self._items[key] = item
+        self._sizes[key] = size
+        self.bytes += size
+        self._evict()
+
+    def peek(self, key: str) -> Optional[CachedItem]:
+        """Get an item without marking it as recently used."""
+        return self._items.get(key)
+
+    def setdefault(self, key: str, item: CachedItem) -> CachedItem:
+        """Set an item unless the key is present, returning the current item."""
+        if key in self._items:
+            return self._items[key]
+        self[key] = item
+        return item
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove an item, returning it or default."""
+        item = self._items.pop(key, None)
+        if item is None:
+            return default
+        self.bytes -= self._sizes.pop(key, 0)
+        return item
+
+    def clear(self):
+        """Remove all items."""
+        self._items.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    def keys(self) -> List[str]:
+        """Get keys, least recently used first."""
+        return list(self._items.keys())
+
+    def values(self) -> List[CachedItem]:
+        """Get items, least recently used first."""
+        return list(self._items.values())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._items.keys()))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _evict(self):
+        """Evict least recently used items until within bounds."""
+        while self._items and (
+            (self.max_entries and len(self._items) > self.max_entries)
+            or (self.max_bytes and self.bytes > self.max_bytes)
+        ):
+            key, _ = self._items.popitem(last=False)
+            self.bytes -= self._sizes.pop(key, 0)
+            self.evictions += 1
+            logger.debug(f"Evicted cache entry: {key}")
+            if self.on_evict:
+                self.on_evict(key)
+
 
 class MetadataCache:
     """Cache manager for server metadata and tools."""
@@ -16,23 +164,64 @@ class MetadataCache:
         servers_ttl: int = 300,
         tools_ttl: int = 600,
         prompts_ttl: int = 0,  # 0 = never expire
+        servers_hard_ttl: int = 0,
+        tools_hard_ttl: int = 0,
+        disk_cache: Optional[DiskCache] = None,
+        limits: Optional[Dict[str, Dict[str, int]]] = None,
     ):
         """
         Initialize cache manager.
 
+        Entries older than their TTL but younger than their hard TTL are
+        served stale while a background task refreshes them.
+
         Args:
             servers_ttl: TTL for servers cache in seconds
             tools_ttl: TTL for tools cache in seconds
             prompts_ttl: TTL for prompts cache in seconds (0 = permanent)
+            servers_hard_ttl: Max age of stale servers entries in seconds (0 = no stale serving)
+            tools_hard_ttl: Max age of stale tools entries in seconds (0 = no stale serving)
+            disk_cache: Optional persistent layer, loaded on first access and
+                written in the background
+            limits: LRU bounds per category ("servers", "tools", "prompts",
+                "server_metadata"), each with max_entries and max_bytes (0 = unbounded)
         """
         self.servers_ttl = servers_ttl
         self.tools_ttl = tools_ttl
         self.prompts_ttl = prompts_ttl
-
-        self._servers_cache: Dict[str, CachedItem] = {}
-        self._tools_cache: Dict[str, CachedItem] = {}
-        self._prompts_cache: Dict[str, CachedItem] = {}
-        self._server_metadata_cache: Dict[str, CachedItem] = {}
+        self.servers_hard_ttl = servers_hard_ttl
+        self.tools_hard_ttl = tools_hard_ttl
+
+        self._disk_cache = disk_cache
+
+        limits = limits or {}
+        self._caches: Dict[str, LRUCacheMap] = {}
+        for category in ("servers", "tools", "prompts", "server_metadata"):
+            category_limits = limits.get(category) or {}
+            self._caches[category] = LRUCacheMap(
+                max_entries=category_limits.get("max_entries", 0),
+                max_bytes=category_limits.get("max_bytes", 0),
+                on_evict=lambda key, category=category: self._on_evict(category, key),
+            )
+        self._servers_cache = self._caches["servers"]
+        self._tools_cache = self._caches["tools"]
+        self._prompts_cache = self._caches["prompts"]
+        self._server_metadata_cache = self._caches["server_metadata"]
+
+        self._disk_loaded = disk_cache is None
+        self._disk_lock = asyncio.Lock()
+        if disk_cache:
+            disk_cache.live_entries = self._live_entries
+
+        # In-flight fetches by key, shared by concurrent misses
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._coalesced = 0
+
+        # Fetchers kept warm by the refresh loop: key -> (fetch_func, store, ttl)
+        self._refreshers: Dict[str, Tuple[Callable[[], Awaitable[Any]], Callable, int]] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._stale_served = 0
+        self._background_refreshes = 0
 
     async def get_servers(self, catalog: str, fetch_func) -> list[ServerMetadata]:
         """
@@ -45,17 +234,27 @@ class MetadataCache:
         Returns:
             List of server metadata
         """
+        await self._ensure_loaded()
         cache_key = f"catalog:{catalog}"
-        cached = self._servers_cache.get(cache_key)
+        fetch_key = f"servers:{cache_key}"
 
-        if cached and not cached.is_expired():
+        def store(servers):
+            self._set(
+                "servers",
+                cache_key,
+                CachedItem(data=servers, ttl=self.servers_ttl, hard_ttl=self.servers_hard_ttl),
+            )
+
+        # Catalogs are kept warm by the refresh loop
+        self._refreshers[fetch_key] = (fetch_func, store, self.servers_ttl)
+
+        cached = self._servers_cache.get(cache_key)
+        if self._serve(cached, fetch_key, fetch_func, store):
             logger.debug(f"Cache hit for servers: {cache_key}")
             return cached.data
 
         logger.debug(f"Cache miss for servers: {cache_key}, fetching...")
-        servers = await fetch_func()
-        self._servers_cache[cache_key] = CachedItem(data=servers, ttl=self.servers_ttl)
-        return servers
+        return await self._fetch_once(fetch_key, fetch_func, store)
 
     async def get_server_metadata(self, server: str, fetch_func) -> Optional[ServerMetadata]:
         """
@@ -68,41 +267,78 @@ class MetadataCache:
         Returns:
             Server metadata or None
         """
-        cached = self._server_metadata_cache.get(server)
+        await self._ensure_loaded()
+        fetch_key = f"metadata:{server}"
 
-        if cached and not cached.is_expired():
+        def store(metadata):
+            if metadata:
+                self._set(
+                    "server_metadata",
+                    server,
+                    CachedItem(data=metadata, ttl=self.servers_ttl, hard_ttl=self.servers_hard_ttl),
+                )
+
+        cached = self._server_metadata_cache.get(server)
+        if self._serve(cached, fetch_key, fetch_func, store):
             logger.debug(f"Cache hit for server metadata: {server}")
             return cached.data
 
         logger.debug(f"Cache miss for server metadata: {server}, fetching...")
-        metadata = await fetch_func()
-        if metadata:
-            self._server_metadata_cache[server] = CachedItem(
-                data=metadata, ttl=self.servers_ttl
-            )
-        return metadata
+        return await self._fetch_once(fetch_key, fetch_func, store)
 
-    async def get_server_tools(self, server: str, fetch_func) -> list[Tool]:
+    async def get_tools_for_servers(
+        self, servers: List[str], fetch_index_func
+    ) -> Dict[str, List[Tool]]:
         """
-        Get cached server tools or fetch if expired.
+        Get cached tools for several servers, fetching all of them at once on a miss.
+
+        A single fetch returns tools of every server; all of them are cached,
+        not only the requested ones.
 
         Args:
-            server: Server name
-            fetch_func: Async function to fetch tools if cache expired
+            servers: Server names
+            fetch_index_func: Async function returning a server -> tools index
 
         Returns:
-            List of tools
+            Dictionary mapping each requested server to its tools
         """
-        cached = self._tools_cache.get(server)
-
-        if cached and not cached.is_expired():
-            logger.debug(f"Cache hit for server tools: {server}")
-            return cached.data
-
-        logger.debug(f"Cache miss for server tools: {server}, fetching...")
-        tools = await fetch_func()
-        self._tools_cache[server] = CachedItem(data=tools, ttl=self.tools_ttl)
-        return tools
+        await self._ensure_loaded()
+        fetch_key = "tools_index"
+
+        def store(tools_index):
+            # Servers absent from the listing are not cached: they may just have
+            # been enabled and show up in the next listing. Their old entries are
+            # dropped too, or they would never be refreshed and keep the refresh
+            # loop listing tools on every tick.
+            for server in self._tools_cache.keys():
+                if server not in tools_index:
+                    self._pop("tools", server)
+            for server, tools in tools_index.items():
+                self._set(
+                    "tools",
+                    server,
+                    CachedItem(data=tools, ttl=self.tools_ttl, hard_ttl=self.tools_hard_ttl),
+                )
+
+        # Tools of active servers are kept warm by the refresh loop
+        self._refreshers[fetch_key] = (fetch_index_func, store, self.tools_ttl)
+
+        cached_tools: Dict[str, List[Tool]] = {}
+        for server in servers:
+            cached = self._tools_cache.get(server)
+            if self._serve(cached, fetch_key, fetch_index_func, store):
+                cached_tools[server] = cached.data
+
+        missing = [server for server in servers if server not in cached_tools]
+        if not missing:
+            logger.debug(f"Cache hit for tools of servers: {servers}")
+            return cached_tools
+
+        logger.debug(f"Cache miss for tools of servers: {missing}, fetching index...")
+        tools_index = await self._fetch_once(fetch_key, fetch_index_func, store)
+        for server in missing:
+            cached_tools[server] = tools_index.get(server, [])
+        return {server: cached_tools[server] for server in servers}
 
     async def get_server_prompt(self, server: str, fetch_func) -> Optional[str]:
         """
@@ -115,17 +351,231 @@ class MetadataCache:
         Returns:
             Prompt string or None
         """
+        await self._ensure_loaded()
         cached = self._prompts_cache.get(server)
 
         if cached and (self.prompts_ttl == 0 or not cached.is_expired()):
+            cache_hits.inc(category="prompts")
             logger.debug(f"Cache hit for server prompt: {server}")
             return cached.data
 
+        cache_misses.inc(category="prompts")
         logger.debug(f"Cache miss for server prompt: {server}, fetching...")
-        prompt = await fetch_func()
-        if prompt:
-            self._prompts_cache[server] = CachedItem(data=prompt, ttl=self.prompts_ttl)
-        return prompt
+
+        def store(prompt):
+            if prompt:
+                self._set("prompts", server, CachedItem(data=prompt, ttl=self.prompts_ttl))
+
+        return await self._fetch_once(f"prompts:{server}", fetch_func, store)
+
+    def _set(self, category: str, key: str, item: CachedItem):
+        """Store an item in a category, persisting it if a disk cache is set."""
+        self._caches[category][key] = item
+        if self._disk_cache:
+            self._disk_cache.write(category, key, item)
+
+    def _pop(self, category: str, key: str):
+        """Remove an item from a category, including from the disk cache."""
+        if self._caches[category].pop(key, None) is not None and self._disk_cache:
+            self._disk_cache.delete(category, key)
+
+    def _on_evict(self, category: str, key: str):
+        """Drop an evicted entry from the disk cache as well."""
+        cache_evictions.inc(category=category)
+        if self._disk_cache:
+            self._disk_cache.delete(category, key)
+
+    async def _ensure_loaded(self):
+        """Load persisted entries on first access."""
+        if self._disk_loaded:
+            return
+        async with self._disk_lock:
+            if self._disk_loaded:
+                return
+            entries = await self._disk_cache.load()
+            for (category, key), item in entries.items():
+                if category in self._caches:
+                    # Entries fetched meanwhile are fresher than persisted ones
+                    self._caches[category].setdefault(key, item)
+            self._disk_loaded = True
+
+    def _live_entries(self) -> Optional[Dict[Tuple[str, str], CachedItem]]:
+        """Get usable entries of all categories, or None until persisted ones are loaded."""
+        if not self._disk_loaded:
+            return None
+        # ttl 0 marks permanent entries (prompts)
+        return {
+            (category, key): item
+            for category, cache in self._caches.items()
+            for key, item in zip(cache.keys(), cache.values())
+            if item.ttl == 0 or item.is_usable()
+        }
+
+    async def flush(self):
+        """Write pending entries to the disk cache, if any."""
+        if self._disk_cache:
+            await self._disk_cache.flush()
+
+    def _serve(
+        self,
+        cached: Optional[CachedItem],
+        fetch_key: str,
+        fetch_func: Callable[[], Awaitable[Any]],
+        store: Callable[[Any], None],
+    ) -> bool:
+        """
+        Check whether a cached item can be served.
+
+        A fresh item is served as is. An expired item still within its hard
+        TTL is served stale and refreshed in the background.
+
+        Returns:
+            True if the cached item can be served
+        """
+        category = _fetch_key_category(fetch_key)
+        if cached and not cached.is_expired():
+            cache_hits.inc(category=category)
+            return True
+        if cached and cached.is_usable():
+            self._stale_served += 1
+            cache_stale_hits.inc(category=category)
+            self._refresh_in_background(fetch_key, fetch_func, store)
+            return True
+        cache_misses.inc(category=category)
+        return False
+
+    def _refresh_in_background(
+        self,
+        fetch_key: str,
+        fetch_func: Callable[[], Awaitable[Any]],
+        store: Callable[[Any], None],
+    ):
+        """Start a background refresh unless one is already in flight."""
+        if fetch_key in self._inflight:
+            return
+        self._background_refreshes += 1
+        logger.debug(f"Refreshing in background: {fetch_key}")
+        task = asyncio.ensure_future(self._fetch_once(fetch_key, fetch_func, store))
+
+        def done(completed: asyncio.Future):
+            if not completed.cancelled() and completed.exception():
+                logger.warning(f"Background refresh of {fetch_key} failed: {completed.exception()}")
+
+        task.add_done_callback(done)
+
+    async def _fetch_once(
+        self,
+        key: str,
+        fetch_func: Callable[[], Awaitable[Any]],
+        store: Callable[[Any], None],
+    ) -> Any:
+        """
+        Fetch a value, sharing one in-flight fetch between concurrent misses.
+
+        The fetch runs as its own task, so a cancelled caller does not cancel
+        it for the others. Failures propagate to every waiter and nothing is
+        cached.
+
+        Args:
+            key: In-flight key (category and cache key)
+            fetch_func: Async function fetching the value
+            store: Function caching a successfully fetched value
+
+        Returns:
+            Fetched value
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self._coalesced += 1
+            logger.debug(f"Joining in-flight fetch: {key}")
+            return await asyncio.shield(future)
+
+        async def fetch_and_store():
+            started = time.perf_counter()
+            status = "error"
+            try:
+                value = await fetch_func()
+                status = "ok"
+            finally:
+                cache_fetch_duration.observe(
+                    time.perf_counter() - started,
+                    category=_fetch_key_category(key),
+                    status=status,
+                )
+            store(value)
+            return value
+
+        future = asyncio.ensure_future(fetch_and_store())
+        self._inflight[key] = future
+
+        def done(completed: asyncio.Future):
+            if self._inflight.get(key) is completed:
+                self._inflight.pop(key, None)
+            if not completed.cancelled():
+                # Mark the exception as retrieved even if every waiter is gone
+                completed.exception()
+
+        future.add_done_callback(done)
+        return await asyncio.shield(future)
+
+    def start_refresh_loop(self, interval: int):
+        """
+        Start refreshing catalogs and tools before they expire.
+
+        Every interval seconds, each catalog and the tools index that would
+        expire before the next check is refreshed in the background.
+
+        Args:
+            interval: Check interval in seconds (0 = disabled)
+        """
+        if interval <= 0 or (self._refresh_task and not self._refresh_task.done()):
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_loop(interval))
+
+    async def stop_refresh_loop(self):
+        """Stop the background refresh loop."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_loop(self, interval: int):
+        """Refresh entries due to expire before the next check."""
+        while True:
+            await asyncio.sleep(interval)
+            for fetch_key, (fetch_func, store, ttl) in list(self._refreshers.items()):
+                age = self._refresher_age(fetch_key)
+                if age is not None and age + interval >= ttl:
+                    self._refresh_in_background(fetch_key, fetch_func, store)
+
+    def _refresher_age(self, fetch_key: str) -> Optional[float]:
+        """Get age of the entry behind a refresher, or None if it is not cached."""
+        if fetch_key == "tools_index":
+            ages = [cached.age() for cached in self._tools_cache.values()]
+            return max(ages) if ages else None
+        cached = self._servers_cache.peek(fetch_key.removeprefix("servers:"))
+        return cached.age() if cached else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry counts, sizes, evictions, coalesced fetches
+            and stale serving counters
+        """
+        return {
+            "entries": {category: len(cache) for category, cache in self._caches.items()},
+            "bytes": {category: cache.bytes for category, cache in self._caches.items()},
+            "evictions": {category: cache.evictions for category, cache in self._caches.items()},
+            "inflight": len(self._inflight),
+            "coalesced": self._coalesced,
+            "stale_served": self._stale_served,
+            "background_refreshes": self._background_refreshes,
+        }
 
     def invalidate_servers(self, catalog: Optional[str] = None):
         """
@@ -136,9 +586,13 @@ class MetadataCache:
         """
         if catalog:
             cache_key = f"catalog:{catalog}"
-            self._servers_cache.pop(cache_key, None)
+            self._pop("servers", cache_key)
+            self._refreshers.pop(f"servers:{cache_key}", None)
         else:
-            self._servers_cache.clear()
+            for cache_key in list(self._servers_cache.keys()):
+                self._pop("servers", cache_key)
+            for fetch_key in [k for k in self._refreshers if k.startswith("servers:")]:
+                self._refreshers.pop(fetch_key, None)
 
     def invalidate_server(self, server: str):
         """
@@ -147,13 +601,23 @@ class MetadataCache:
         Args:
             server: Server name
         """
-        self._server_metadata_cache.pop(server, None)
-        self._tools_cache.pop(server, None)
-        self._prompts_cache.pop(server, None)
+        self._pop("server_metadata", server)
+        self._pop("tools", server)
+        self._pop("prompts", server)
+
+    def invalidate_server_tools(self, server: str):
+        """
+        Invalidate cached tools for a specific server.
+
+        Args:
+            server: Server name
+        """
+        self._pop("tools", server)
 
     def clear(self):
         """Clear all caches."""
-        self._servers_cache.clear()
-        self._tools_cache.clear()
-        self._prompts_cache.clear()
-        self._server_metadata_cache.clear()
+        for cache in self._caches.values():
+            cache.clear()
+        self._refreshers.clear()
+        if self._disk_cache:
+            self._disk_cache.clear()
@@ -0,0 +1,122 @@
+"""Lookup index over catalog servers."""
+
+from typing import Dict, List, Optional, Tuple
+
+from .models import ServerMetadata
+from .search import SearchIndex
+
+# Field weights for ranking servers: name and keywords matter most
+SEARCH_FIELD_WEIGHTS = {"name": 3.0, "keywords": 2.0, "tools": 1.5, "description": 1.0}
+
+
+class CatalogIndex:
+    """Index of a catalog's servers by name, keyword and previewed tool name."""
+
+    def __init__(self, catalog: str, servers: List[ServerMetadata]):
+        """
+        Build index.
+
+        Args:
+            catalog: Catalog name
+            servers: Servers of the catalog, in catalog order
+        """
+        self.catalog = catalog
+        self.servers = servers
+
+        self._by_name: Dict[str, ServerMetadata] = {}
+        self._by_keyword: Dict[str, List[str]] = {}
+        self._by_tool: Dict[str, List[str]] = {}
+        self._search_index: Optional[SearchIndex] = None
+
+        for server in servers:
+            self._by_name[server.name] = server
+            for keyword in server.keywords:
+                self._by_keyword.setdefault(keyword.lower(), []).append(server.name)
+            for tool_name in server.tools_preview:
+                self._by_tool.setdefault(tool_name, []).append(server.name)
+
+    def get(self, name: str) -> Optional[ServerMetadata]:
+        """
+        Get server by name.
+
+        Args:
+            name: Server name
+
+        Returns:
+            Server metadata or None if not in catalog
+        """
+        return self._by_name.get(name)
+
+    def names(self) -> List[str]:
+        """Get server names in catalog order."""
+        return [server.name for server in self.servers]
+
+    def servers_with_keyword(self, keyword: str) -> List[str]:
+        """
+        Get names of servers tagged with a keyword (case-insensitive).
+
+        Args:
+            keyword: Keyword
+
+        Returns:
+            Server names
+        """
+        return self._by_keyword.get(keyword.lower(), [])
+
+    def servers_for_tool(self, tool_name: str) -> List[str]:
+        """
+        Get names of servers whose tool preview lists a tool.
+
+        Args:
+            tool_name: Tool name
+
+        Returns:
+            Server names
+        """
+        return self._by_tool.get(tool_name, [])
+
+    def search(
+        self, query: str, keywords: Optional[List[str]] = None
+    ) -> List[Tuple[ServerMetadata, float]]:
+        """
+        Full-text search over server names, descriptions, keywords and tool previews.
+
+        Args:
+            query: Query text
+            keywords: Only return servers tagged with all of these keywords
+
+        Returns:
+            List of (server, score), best match first
+        """
+        if self._search_index is None:
+            # Built on first search, most catalog fetches are never searched
+            self._search_index = SearchIndex(SEARCH_FIELD_WEIGHTS)
+            for server in self.servers:
+                self._search_index.add(
+                    server.name,
+                    {
+                        "name": server.name,
+                        "keywords": " ".join(server.keywords),
+                        "tools": " ".join(server.tools_preview),
+                        "description": server.description or "",
+                    },
+                )
+
+        filter_func = None
+        if keywords:
+            required = {keyword.lower() for keyword in keywords}
+
+            def filter_func(name: str) -> bool:
+                server_keywords = {keyword.lower() for keyword in self._by_name[name].keywords}
+                return required <= server_keywords
+
+        return [
+            (self._by_name[name], score)
+            for name, score in self._search_index.search(query, filter_func)
+        ]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __len__(self) -> int:
+        return len(self.servers)
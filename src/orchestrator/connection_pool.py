@@ -1,14 +1,32 @@
-"""MCP Connection Pool for managing server state and CLI tool calls."""
+"""MCP Connection Pool for managing server state, MCP sessions and CLI tool calls."""
 
 import asyncio
+import json
 import logging
-from typing import Any, Dict, Optional
+import os
+import time
+from datetime import timedelta
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from mcp import ClientSession, McpError, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.types import CallToolResult, TextContent
 
 from .docker_client import DockerMCPClient
-from .exceptions import ConnectionError, ServerNotFoundError, ToolNotFoundError
+from .events import ServerEvent
+from .exceptions import (
+    ConnectionError,
+    DockerMCPError,
+    ServerNotFoundError,
+    TimeoutError,
+    ToolNotFoundError,
+)
+from .metrics import tool_call_transport
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SESSION_COMMAND = ["docker", "mcp", "gateway", "run", "--servers", "{server}"]
+
 
 class ServerInfo:
     """Information about a server."""
@@ -26,8 +44,144 @@ class ServerInfo:
         self.last_checked: Optional[float] = None
 
 
+class ActiveServersSnapshot:
+    """Immutable set of active servers as of one `server ls`."""
+
+    def __init__(self, servers: FrozenSet[str], checked_at: float):
+        """
+        Initialize snapshot.
+
+        Args:
+            servers: Names of active servers
+            checked_at: Time the listing was started
+        """
+        self.servers = servers
+        self.checked_at = checked_at
+
+
+class MCPSession:
+    """Long-lived MCP client session to a server over stdio."""
+
+    def __init__(self, server: str, params: StdioServerParameters, connection_timeout: int = 30):
+        """
+        Initialize session.
+
+        Args:
+            server: Server name
+            params: Parameters of the stdio process to spawn
+            connection_timeout: Timeout for opening the session in seconds
+        """
+        self.server = server
+        self.params = params
+        self.connection_timeout = connection_timeout
+
+        self._session: Optional[ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: Optional[BaseException] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the session is initialized and can serve calls."""
+        return (
+            self._session is not None
+            and not self._closing.is_set()
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def open(self):
+        """
+        Spawn the stdio process and initialize the MCP session.
+
+        Raises:
+            ConnectionError: If the session cannot be opened
+        """
+        # The stdio transport must be entered and exited in the same task,
+        # so a dedicated task owns it for the lifetime of the session.
+        self._task = asyncio.create_task(self._run(), name=f"mcp-session-{self.server}")
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=self.connection_timeout)
+        except asyncio.TimeoutError:
+            await self._abort()
+            raise ConnectionError(
+                self.server,
+                reason=f"Session initialization timed out after {self.connection_timeout} seconds",
+            )
+        except BaseException:
+            # Cancelled while opening: don't leave the stdio process behind
+            await asyncio.shield(self._abort())
+            raise
+
+        if not self.is_open:
+            await self.close()
+            raise ConnectionError(
+                self.server,
+                reason=f"Failed to open MCP session: {self._error or 'session closed'}",
+            )
+
+    async def _run(self):
+        """Own the stdio transport and session until close() is requested."""
+        try:
+            async with stdio_client(self.params) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    self._session = session
+                    self._ready.set()
+                    await self._closing.wait()
+        except Exception as e:
+            self._error = e
+            logger.warning(f"MCP session for server {self.server} terminated: {e}")
+        finally:
+            self._session = None
+            self._ready.set()
+
+    async def call_tool(
+        self, tool_name: str, arguments: Dict[str, Any], timeout: int
+    ) -> CallToolResult:
+        """
+        Call a tool over the session.
+
+        Args:
+            tool_name: Tool name
+            arguments: Tool arguments
+            timeout: Read timeout in seconds
+
+        Returns:
+            Raw MCP tool result
+
+        Raises:
+            ConnectionError: If the session is not open
+        """
+        session = self._session
+        if session is None or not self.is_open:
+            raise ConnectionError(self.server, reason="MCP session is not open")
+        return await session.call_tool(
+            tool_name, arguments, read_timeout_seconds=timedelta(seconds=timeout)
+        )
+
+    async def _abort(self):
+        """Cancel a session that is still opening and wait for its process to exit."""
+        self._closing.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.wait({self._task})
+
+    async def close(self):
+        """Close the session and terminate the stdio process."""
+        self._closing.set()
+        if self._task and not self._task.done():
+            try:
+                await asyncio.wait_for(self._task, timeout=self.connection_timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._task.cancel()
+            except Exception as e:
+                logger.debug(f"Error closing MCP session for server {self.server}: {e}")
+
+
 class MCPConnectionPool:
-    """Pool for managing server state and CLI tool calls."""
+    """Pool for managing server state, MCP sessions and CLI tool calls."""
 
     def __init__(
         self,
@@ -36,6 +190,11 @@ class MCPConnectionPool:
         reconnect_attempts: int = 3,
         reconnect_delay: int = 1,
         status_check_ttl: int = 30,
+        use_sessions: bool = True,
+        session_command: Optional[List[str]] = None,
+        session_retry_interval: int = 60,
+        call_timeout: int = 30,
+        session_open_wait: float = 5,
     ):
         """
         Initialize connection pool.
@@ -46,21 +205,50 @@ class MCPConnectionPool:
             reconnect_attempts: Number of reconnection attempts
             reconnect_delay: Delay between reconnection attempts in seconds
             status_check_ttl: TTL for server status cache in seconds
+            use_sessions: Whether to reuse long-lived MCP sessions for tool calls
+            session_command: Command spawning a stdio MCP endpoint for a server,
+                "{server}" is replaced with the server name
+            session_retry_interval: Seconds to wait before retrying a failed session
+                (calls use the CLI in the meantime)
+            call_timeout: Tool call timeout over a session in seconds
+            session_open_wait: Seconds a call waits for a session that is being
+                opened before using the CLI; the session keeps opening in the
+                background for later calls
         """
         self.docker_client = docker_client
         self.connection_timeout = connection_timeout
         self.reconnect_attempts = reconnect_attempts
         self.reconnect_delay = reconnect_delay
         self.status_check_ttl = status_check_ttl
-
-        # Cache server status information
-        self._server_info: Dict[str, ServerInfo] = {}
-        self._lock = asyncio.Lock()
+        self.use_sessions = use_sessions
+        self.session_command = session_command or DEFAULT_SESSION_COMMAND
+        self.session_retry_interval = session_retry_interval
+        self.call_timeout = call_timeout
+        self.session_open_wait = session_open_wait
+
+        # Shared active-set snapshot, replaced as a whole by a single
+        # in-flight `server ls`; reads never take a lock
+        self._active_snapshot: Optional[ActiveServersSnapshot] = None
+        self._snapshot_refresh: Optional[asyncio.Future] = None
+        # Servers whose status changed after a given time (e.g. just started)
+        self._invalidated_at: Dict[str, float] = {}
+        # While a server event stream is connected, the snapshot doesn't
+        # expire: events invalidate affected servers instead
+        self.status_from_events = False
+
+        # Long-lived MCP sessions by server name
+        self._sessions: Dict[str, MCPSession] = {}
+        # Sessions being opened in the background, outside any call's deadline
+        self._session_opens: Dict[str, asyncio.Task] = {}
+        self._session_failures: Dict[str, float] = {}
 
     async def get_server_info(self, server: str) -> Optional[ServerInfo]:
         """
         Get information about a server, checking status if needed.
 
+        Served from the shared active-set snapshot while it is fresh; all
+        servers share one `server ls` when it needs refreshing.
+
         Args:
             server: Server name
 
@@ -68,51 +256,77 @@ class MCPConnectionPool:
             ServerInfo or None if server not found
 
         Raises:
-            ServerNotFoundError: If server is not found
+            ServerNotFoundError: If server status cannot be determined
         """
-        async with self._lock:
-            # Check cache first
-            if server in self._server_info:
-                info = self._server_info[server]
-                # Check if cache is still valid
-                import time
-
-                if info.last_checked and (time.time() - info.last_checked) < self.status_check_ttl:
-                    return info
-
-            # Check server status
-            is_active = await self._check_server_status(server)
-            if is_active is None:
-                # Server not found
-                if server in self._server_info:
-                    # Remove from cache
-                    self._server_info.pop(server, None)
-                raise ServerNotFoundError(server)
+        snapshot = self._active_snapshot
+        if not self._is_fresh(snapshot, server):
+            snapshot = await self._refresh_active_snapshot()
+            # Invalidated while the listing was already running: list again
+            if snapshot and self._invalidated_at.get(server, 0.0) >= snapshot.checked_at:
+                snapshot = await self._refresh_active_snapshot()
+        if snapshot is None:
+            raise ServerNotFoundError(server)
+
+        info = ServerInfo(server, is_active=server in snapshot.servers)
+        info.last_checked = snapshot.checked_at
+        return info
+
+    def _is_fresh(self, snapshot: Optional[ActiveServersSnapshot], server: str) -> bool:
+        """Check whether a snapshot can answer for a server."""
+        if snapshot is None:
+            return False
+        expired = time.time() - snapshot.checked_at >= self.status_check_ttl
+        if expired and not self.status_from_events:
+            return False
+        return self._invalidated_at.get(server, 0.0) < snapshot.checked_at
 
-            # Update cache
-            import time
+    async def _refresh_active_snapshot(self) -> Optional[ActiveServersSnapshot]:
+        """
+        Refresh the active-set snapshot, joining a listing already in flight.
 
-            info = ServerInfo(server, is_active=is_active)
-            info.last_checked = time.time()
-            self._server_info[server] = info
+        Returns:
+            New snapshot, or None if the listing failed
+        """
+        if self._snapshot_refresh is None:
+            self._snapshot_refresh = asyncio.ensure_future(self._load_active_snapshot())
+            self._snapshot_refresh.add_done_callback(self._clear_snapshot_refresh)
+        return await asyncio.shield(self._snapshot_refresh)
+
+    def _clear_snapshot_refresh(self, future: asyncio.Future):
+        """Forget a finished snapshot refresh."""
+        if self._snapshot_refresh is future:
+            self._snapshot_refresh = None
+
+    async def _load_active_snapshot(self) -> Optional[ActiveServersSnapshot]:
+        """Run `server ls` and swap in the resulting snapshot."""
+        checked_at = time.time()
+        try:
+            active_servers = await self.docker_client.get_active_servers()
+        except Exception as e:
+            logger.error(f"Error checking active servers: {e}")
+            return None
 
-            return info
+        snapshot = ActiveServersSnapshot(frozenset(active_servers), checked_at)
+        self._active_snapshot = snapshot
+        self._invalidated_at = {
+            server: at for server, at in self._invalidated_at.items() if at >= checked_at
+        }
+        return snapshot
 
     async def _check_server_status(self, server: str) -> Optional[bool]:
         """
-        Check if a server is active.
+        Check if a server is active, bypassing the snapshot TTL.
 
         Args:
             server: Server name
 
         Returns:
-            True if active, False if inactive, None if not found
+            True if active, False if inactive, None if status is unknown
         """
+        await self.invalidate_server_cache(server)
         try:
-            active_servers = await self.docker_client.get_active_servers()
-            return server in active_servers
-        except Exception as e:
-            logger.error(f"Error checking server status for {server}: {e}")
+            return (await self.get_server_info(server)).is_active
+        except ServerNotFoundError:
             return None
 
     async def call_tool_via_cli(self, tool_name: str, arguments: Dict[str, Any], server: str) -> Any:
@@ -155,20 +369,296 @@ class MCPConnectionPool:
                 ) from e
             raise
 
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        server: str,
+        cli_fallback: bool = True,
+    ) -> Any:
+        """
+        Call a tool, preferring a long-lived MCP session over the CLI.
+
+        Falls back to call_tool_via_cli() when sessions are disabled or a
+        session to the server cannot be opened. `docker mcp tools call`
+        takes only a tool name and the gateway picks the server, so the
+        fallback must be disabled for tools that several servers provide.
+
+        Args:
+            tool_name: Tool name
+            arguments: Tool arguments
+            server: Server name
+            cli_fallback: Whether the CLI may serve the call without a session
+
+        Returns:
+            Tool result
+
+        Raises:
+            ConnectionError: If server is not active, or no session is
+                available and cli_fallback is False
+            ToolNotFoundError: If tool is not found
+        """
+        server_info = await self.get_server_info(server)
+        if not server_info or not server_info.is_active:
+            raise ConnectionError(
+                server,
+                reason="Server is not active. Use start_servers() to enable it.",
+            )
+
+        session = await self.get_session(server) if self.use_sessions else None
+        if session is None:
+            self._check_cli_fallback(tool_name, server, cli_fallback)
+            tool_call_transport.inc(transport="cli")
+            return await self.call_tool_via_cli(tool_name, arguments, server)
+
+        tool_call_transport.inc(transport="session")
+        try:
+            result = await session.call_tool(tool_name, arguments, timeout=self.call_timeout)
+        except McpError as e:
+            message = e.error.message
+            if "not found" in message.lower() or "unknown tool" in message.lower():
+                raise ToolNotFoundError(tool_name, server=server, details={"error": message}) from e
+            if "timed out" in message.lower():
+                raise TimeoutError(f"call_tool {tool_name}", self.call_timeout) from e
+            raise DockerMCPError(
+                f"Tool '{tool_name}' failed on server '{server}': {message}",
+                details={"tool_name": tool_name, "server": server, "code": e.error.code},
+            ) from e
+        except Exception as e:
+            if session.is_open:
+                raise
+            # Transport died underneath the call; drop the session and use the CLI
+            logger.warning(f"MCP session for server {server} lost, falling back to CLI: {e}")
+            await self._discard_session(server, failed=True)
+            self._check_cli_fallback(tool_name, server, cli_fallback)
+            tool_call_transport.inc(transport="cli")
+            return await self.call_tool_via_cli(tool_name, arguments, server)
+
+        return await self._parse_session_result(tool_name, server, result)
+
+    def _check_cli_fallback(self, tool_name: str, server: str, cli_fallback: bool):
+        """Refuse a CLI call that the gateway could route to another server."""
+        if not cli_fallback:
+            raise ConnectionError(
+                server,
+                reason=(
+                    f"Tool '{tool_name}' is provided by several active servers and "
+                    f"`docker mcp tools call` cannot target one; "
+                    f"an MCP session to the server is required"
+                ),
+                details={"tool_name": tool_name},
+            )
+
+    async def get_session(self, server: str) -> Optional[MCPSession]:
+        """
+        Get an open MCP session for a server, opening one if needed.
+
+        Sessions are opened in a background task, so a slow gateway start is
+        not bound by (or cancelled with) the calling tool call's deadline.
+        The call waits at most session_open_wait seconds for it.
+
+        Args:
+            server: Server name
+
+        Returns:
+            Open session, or None if a session is not available right now
+        """
+        session = self._sessions.get(server)
+        if session and session.is_open:
+            return session
+
+        opening = self._session_opens.get(server)
+        if opening is None:
+            if session:
+                await self._discard_session(server)
+            failed_at = self._session_failures.get(server)
+            if failed_at and (time.time() - failed_at) < self.session_retry_interval:
+                return None
+            opening = asyncio.create_task(
+                self._open_session(server), name=f"mcp-session-open-{server}"
+            )
+            self._session_opens[server] = opening
+
+        # asyncio.wait() neither raises nor cancels the open when the call gives up
+        await asyncio.wait({opening}, timeout=self.session_open_wait)
+        if not opening.done():
+            logger.debug(f"MCP session for server {server} still opening, using CLI")
+            return None
+        return None if opening.cancelled() else opening.result()
+
+    async def _open_session(self, server: str) -> Optional[MCPSession]:
+        """
+        Open a session to a server, retrying, and record the outcome.
+
+        Args:
+            server: Server name
+
+        Returns:
+            Open session, or None if it could not be opened
+        """
+        try:
+            for attempt in range(self.reconnect_attempts):
+                session = MCPSession(
+                    server, self._session_params(server), self.connection_timeout
+                )
+                try:
+                    await session.open()
+                    self._sessions[server] = session
+                    self._session_failures.pop(server, None)
+                    logger.info(f"Opened MCP session for server {server}")
+                    return session
+                except ConnectionError as e:
+                    logger.warning(
+                        f"Failed to open MCP session for server {server} "
+                        f"(attempt {attempt + 1}/{self.reconnect_attempts}): {e}"
+                    )
+                    if attempt < self.reconnect_attempts - 1:
+                        await asyncio.sleep(self.reconnect_delay)
+
+            self._session_failures[server] = time.time()
+            logger.warning(f"Using CLI for server {server}: MCP session unavailable")
+            return None
+        finally:
+            if self._session_opens.get(server) is asyncio.current_task():
+                del self._session_opens[server]
+
+    async def close_session(self, server: str):
+        """
+        Close the MCP session for a server, if any.
+
+        Args:
+            server: Server name
+        """
+        await self._cancel_session_open(server)
+        await self._discard_session(server)
+        self._session_failures.pop(server, None)
+
+    async def close_all_sessions(self):
+        """Close all MCP sessions, including ones still opening."""
+        for server in list(self._session_opens.keys()):
+            await self._cancel_session_open(server)
+        for server in list(self._sessions.keys()):
+            await self._discard_session(server)
+        self._session_failures.clear()
+
+    async def _cancel_session_open(self, server: str):
+        """Cancel a background session open and wait for its process to exit."""
+        opening = self._session_opens.pop(server, None)
+        if opening and not opening.done():
+            opening.cancel()
+            await asyncio.wait({opening})
+
+    async def _discard_session(self, server: str, failed: bool = False):
+        """Remove a session from the pool and close it."""
+        session = self._sessions.pop(server, None)
+        if failed:
+            self._session_failures[server] = time.time()
+        if session:
+            await session.close()
+
+    def _session_params(self, server: str) -> StdioServerParameters:
+        """Build stdio parameters for a server's session command."""
+        cmd = [part.replace("{server}", server) for part in self.session_command]
+        # Keep the full environment so the docker CLI finds its context and config
+        return StdioServerParameters(command=cmd[0], args=cmd[1:], env=dict(os.environ))
+
+    async def _parse_session_result(
+        self, tool_name: str, server: str, result: CallToolResult
+    ) -> Dict[str, Any]:
+        """
+        Convert an MCP tool result to the same shape as the CLI path returns.
+
+        Text output over the client's max_output_bytes is spilled to a file
+        and returned as a preview, as on the CLI path.
+
+        Raises:
+            ToolNotFoundError: If the server reports an unknown tool
+            DockerMCPError: If the tool returned an error
+        """
+        texts = [c.text for c in result.content if isinstance(c, TextContent)]
+
+        if result.isError:
+            error_msg = "\n".join(texts) or "Unknown error"
+            if "not found" in error_msg.lower() or "unknown tool" in error_msg.lower():
+                raise ToolNotFoundError(tool_name, server=server, details={"error": error_msg})
+            raise DockerMCPError(
+                f"Tool '{tool_name}' failed on server '{server}': {error_msg}",
+                details={"tool_name": tool_name, "server": server},
+            )
+
+        capped = await self.docker_client.cap_output("\n".join(texts))
+        if capped is not None:
+            return capped
+
+        if result.structuredContent is not None:
+            return result.structuredContent
+
+        if len(texts) == len(result.content) and len(texts) == 1:
+            try:
+                data = json.loads(texts[0])
+            except json.JSONDecodeError:
+                return {"result": texts[0].strip(), "type": "text"}
+            if isinstance(data, dict):
+                return data
+            elif isinstance(data, list):
+                return {"results": data, "type": "list"}
+            return {"result": data, "type": "primitive"}
+
+        return {
+            "content": [c.model_dump(mode="json", exclude_none=True) for c in result.content],
+            "type": "content",
+        }
+
     async def invalidate_server_cache(self, server: str):
         """
         Invalidate cache for a server.
 
+        The next status read for the server triggers a fresh listing; other
+        servers keep using the current snapshot.
+
         Args:
             server: Server name
         """
-        async with self._lock:
-            self._server_info.pop(server, None)
+        self._invalidated_at[server] = time.time()
+
+    async def handle_server_event(self, event: ServerEvent):
+        """
+        Invalidate a server's status when a container event may have changed it.
+
+        Starts of servers the snapshot already lists as active and clean
+        exits (containers also exit between calls) leave the status as is.
+
+        Args:
+            event: Server event
+        """
+        if event.action == "start":
+            if self.is_server_active(event.server):
+                return
+        elif not event.failed:
+            return
+        await self.invalidate_server_cache(event.server)
+
+    async def handle_event_stream(self, connected: bool):
+        """
+        Switch between event-driven status and TTL polling.
+
+        Events may have been missed while the stream was down, so the
+        snapshot is dropped whenever the stream (re)connects.
+
+        Args:
+            connected: Whether the event stream is connected
+        """
+        if connected:
+            await self.invalidate_all_cache()
+        self.status_from_events = connected
+        if connected:
+            logger.info("Server status is now event-driven")
+        else:
+            logger.info("Server status falls back to TTL polling")
 
     async def invalidate_all_cache(self):
         """Invalidate all server caches."""
-        async with self._lock:
-            self._server_info.clear()
+        self._active_snapshot = None
 
     def is_server_active(self, server: str) -> bool:
         """
@@ -180,9 +670,8 @@ class MCPConnectionPool:
         Returns:
             True if active (cached), False otherwise
         """
-        if server not in self._server_info:
-            return False
-        return self._server_info[server].is_active
+        snapshot = self._active_snapshot
+        return snapshot is not None and server in snapshot.servers
 
     async def ensure_server_active(self, server: str) -> bool:
         """
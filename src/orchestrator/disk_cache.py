@@ -0,0 +1,197 @@
+"""Persistent on-disk layer for the metadata cache."""
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiofiles
+
+from .models import CachedItem, ServerMetadata, Tool
+
+logger = logging.getLogger(__name__)
+
+EntriesSource = Callable[[], Optional[Dict[Tuple[str, str], CachedItem]]]
+
+
+class DiskCache:
+    """
+    Append-only JSON lines store for cache entries.
+
+    Each line records one entry (or a deletion) of a cache category. On load
+    the last record per key wins; the file is compacted when it holds many
+    more records than live entries, at load and after flushes.
+    """
+
+    FILENAME = "metadata_cache.jsonl"
+
+    def __init__(self, directory: str, compact_ratio: int = 4):
+        """
+        Initialize disk cache.
+
+        Args:
+            directory: Directory to store the cache file in
+            compact_ratio: Compact the file once it holds this many records per live entry
+        """
+        self.path = Path(directory).expanduser() / self.FILENAME
+        self.compact_ratio = compact_ratio
+
+        self._pending: List[str] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._records = 0
+        # Serializes appends and compaction, which replaces the file
+        self._file_lock = asyncio.Lock()
+        # Returns the live entries to compact from after a flush, or None
+        # while they aren't known yet (set by the owning cache)
+        self.live_entries: Optional[EntriesSource] = None
+
+    async def load(self) -> Dict[Tuple[str, str], CachedItem]:
+        """
+        Load entries from disk.
+
+        Returns:
+            Dictionary mapping (category, key) to cached items still usable
+        """
+        if not self.path.exists():
+            return {}
+
+        entries: Dict[Tuple[str, str], Optional[CachedItem]] = {}
+        records = 0
+        try:
+            async with aiofiles.open(self.path, "r", encoding="utf-8") as f:
+                async for line in f:
+                    if not line.strip():
+                        continue
+                    records += 1
+                    try:
+                        record = json.loads(line)
+                        if record.get("op") == "clear":
+                            entries.clear()
+                            continue
+                        key = (record["category"], record["key"])
+                        if record.get("deleted"):
+                            entries[key] = None
+                        else:
+                            entries[key] = self._decode(record)
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.debug(f"Skipping corrupt disk cache record: {e}")
+        except OSError as e:
+            logger.warning(f"Failed to read disk cache {self.path}: {e}")
+            return {}
+
+        # ttl 0 marks permanent entries (prompts)
+        loaded = {
+            key: item
+            for key, item in entries.items()
+            if item is not None and (item.ttl == 0 or item.is_usable())
+        }
+        self._records = records
+        logger.info(f"Loaded {len(loaded)} cache entries from {self.path}")
+
+        if self._needs_compaction(len(loaded)):
+            await self.compact(loaded)
+        return loaded
+
+    def write(self, category: str, key: str, item: CachedItem):
+        """
+        Schedule an entry to be written.
+
+        Args:
+            category: Cache category
+            key: Cache key
+            item: Cached item
+        """
+        record = item.model_dump(mode="json")
+        record.update({"category": category, "key": key})
+        self._append(record)
+
+    def delete(self, category: str, key: str):
+        """
+        Schedule an entry deletion to be written.
+
+        Args:
+            category: Cache category
+            key: Cache key
+        """
+        self._append({"category": category, "key": key, "deleted": True})
+
+    def clear(self):
+        """Schedule removal of all entries."""
+        self._append({"op": "clear"})
+
+    async def compact(self, entries: Dict[Tuple[str, str], CachedItem]):
+        """
+        Rewrite the file with live entries only.
+
+        Args:
+            entries: Live entries by (category, key)
+        """
+        async with self._file_lock:
+            await self._compact(entries)
+
+    async def _compact(self, entries: Dict[Tuple[str, str], CachedItem]):
+        """Rewrite the file with live entries, holding the file lock."""
+        lines = []
+        for (category, key), item in entries.items():
+            record = item.model_dump(mode="json")
+            record.update({"category": category, "key": key})
+            lines.append(json.dumps(record) + "\n")
+
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
+                await f.write("".join(lines))
+            os.replace(tmp_path, self.path)
+            self._records = len(lines)
+            logger.debug(f"Compacted disk cache to {len(lines)} records")
+        except OSError as e:
+            logger.warning(f"Failed to compact disk cache {self.path}: {e}")
+
+    async def flush(self):
+        """Write all pending records, compacting the file if it grew too large."""
+        async with self._file_lock:
+            while self._pending:
+                lines, self._pending = self._pending, []
+                try:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    async with aiofiles.open(self.path, "a", encoding="utf-8") as f:
+                        await f.write("".join(lines))
+                    self._records += len(lines)
+                except OSError as e:
+                    logger.warning(f"Failed to write disk cache {self.path}: {e}")
+
+            # Refreshes rewrite the same keys over and over; compact from the
+            # in-memory entries instead of letting the file grow without bound
+            entries = self.live_entries() if self.live_entries else None
+            if entries is not None and self._needs_compaction(len(entries)):
+                await self._compact(entries)
+
+    def _needs_compaction(self, live: int) -> bool:
+        """Check whether the file holds too many records per live entry."""
+        return self._records > self.compact_ratio * max(live, 1)
+
+    def _append(self, record: Dict[str, Any]):
+        """Queue a record and make sure a flush is scheduled."""
+        self._pending.append(json.dumps(record) + "\n")
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self.flush())
+
+    @staticmethod
+    def _decode(record: Dict[str, Any]) -> CachedItem:
+        """Rebuild a cached item, restoring model types of its category."""
+        category = record["category"]
+        data = record["data"]
+        if category == "servers":
+            data = [ServerMetadata.model_validate(s) for s in data]
+        elif category == "server_metadata":
+            data = ServerMetadata.model_validate(data)
+        elif category == "tools":
+            data = [Tool.model_validate(t) for t in data]
+        return CachedItem(
+            data=data,
+            timestamp=record["timestamp"],
+            ttl=record["ttl"],
+            hard_ttl=record.get("hard_ttl", 0),
+        )
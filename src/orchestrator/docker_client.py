@@ -2,11 +2,22 @@
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import os
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
+from .catalog_index import CatalogIndex
 from .exceptions import CommandError, ParseError, ServerNotFoundError, ToolNotFoundError
 from .models import Server, ServerMetadata, Tool
-from .utils import parse_json_output, run_command
+from .utils import (
+    CapturedOutput,
+    parse_json_output,
+    prune_spill_files,
+    remove_file,
+    run_command,
+    run_command_output,
+    spill_output,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +25,42 @@ logger = logging.getLogger(__name__)
 class DockerMCPClient:
     """Client for interacting with Docker MCP Toolkit."""
 
-    def __init__(self, catalog: str = "docker-mcp", command_timeout: int = 30):
+    def __init__(
+        self,
+        catalog: str = "docker-mcp",
+        command_timeout: int = 30,
+        max_output_bytes: int = 0,
+        output_preview_bytes: int = 65536,
+        spill_dir: Optional[str] = None,
+        spill_max_files: int = 20,
+        spill_max_age: int = 3600,
+    ):
         """
         Initialize Docker MCP Client.
 
         Args:
             catalog: Default catalog name
             command_timeout: Command timeout in seconds
+            max_output_bytes: Max tool call output held in memory; larger
+                output is spilled to a temp file (0 = unbounded)
+            output_preview_bytes: Bytes of spilled output returned as a preview
+            spill_dir: Directory for spilled output (system temp dir if None)
+            spill_max_files: Max spill files kept; the oldest are deleted
+                first (0 = unbounded)
+            spill_max_age: Seconds a spill file is kept (0 = until shutdown)
         """
         self.catalog = catalog
         self.command_timeout = command_timeout
+        self.max_output_bytes = max_output_bytes
+        self.output_preview_bytes = output_preview_bytes
+        self.spill_dir = os.path.expanduser(spill_dir) if spill_dir else None
+        self.spill_max_files = spill_max_files
+        self.spill_max_age = spill_max_age
+        # Spill files handed out in results, oldest first
+        self._spill_files: Deque[str] = deque()
+
+        # Index of the last fetch of each catalog, shared by lookups
+        self._catalog_indexes: Dict[str, CatalogIndex] = {}
 
     async def get_catalog_servers(self, catalog: Optional[str] = None) -> List[ServerMetadata]:
         """
@@ -92,18 +129,53 @@ class DockerMCPClient:
                 details={"data": data},
             ) from e
 
+        self.index_catalog(catalog_name, servers)
         return servers
 
-    async def get_installed_servers(self) -> List[str]:
+    def index_catalog(self, catalog: str, servers: List[ServerMetadata]) -> CatalogIndex:
         """
-        Get list of installed server names.
+        Get lookup index for a catalog's servers, building it if they changed.
+
+        Lets callers holding a cached server list reuse (or refresh) the
+        shared index without running the catalog command.
+
+        Args:
+            catalog: Catalog name
+            servers: Servers of the catalog
+
+        Returns:
+            Catalog index
+        """
+        index = self._catalog_indexes.get(catalog)
+        if index is None or index.servers is not servers:
+            index = CatalogIndex(catalog, servers)
+            self._catalog_indexes[catalog] = index
+        return index
+
+    async def get_catalog_index(self, catalog: Optional[str] = None) -> CatalogIndex:
+        """
+        Get lookup index of a catalog.
+
+        The index is rebuilt on every get_catalog_servers() call, so it stays
+        as fresh as the cached catalog; the catalog is only fetched here if it
+        was never fetched before.
+
+        Args:
+            catalog: Catalog name (uses default if None)
 
         Returns:
-            List of installed server names
+            Catalog index
+
+        Raises:
+            CommandError: If command fails
+            ParseError: If parsing fails
         """
-        # Get servers from catalog (installed servers are in catalog)
-        servers = await self.get_catalog_servers()
-        return [s.name for s in servers]
+        catalog_name = catalog or self.catalog
+        index = self._catalog_indexes.get(catalog_name)
+        if index is None:
+            await self.get_catalog_servers(catalog_name)
+            index = self._catalog_indexes[catalog_name]
+        return index
 
     async def get_active_servers(self) -> List[str]:
         """
@@ -227,15 +299,14 @@ class DockerMCPClient:
 
         return True
 
-    async def get_server_tools(self, server: str) -> List[Tool]:
+    async def get_tools_index(self) -> Dict[str, List[Tool]]:
         """
-        Get tools from a specific server.
+        Get tools of all servers, grouped by server.
 
-        Args:
-            server: Server name
+        Runs `docker mcp tools ls` once and parses it into a server -> tools index.
 
         Returns:
-            List of tools
+            Dictionary mapping server names to their tools
 
         Raises:
             CommandError: If command fails
@@ -246,56 +317,37 @@ class DockerMCPClient:
 
         if return_code != 0:
             error_msg = stdout if stdout else "Unknown error"
-            raise CommandError(cmd, return_code, stderr=error_msg, details={"server": server})
+            raise CommandError(cmd, return_code, stderr=error_msg)
 
         data = parse_json_output(stdout)
         if not data:
             # Empty list is valid - no tools
-            return []
+            return {}
 
-        tools = []
+        if isinstance(data, list):
+            items = data
+        elif isinstance(data, dict):
+            items = data.get("tools") or data.get("items") or []
+        else:
+            items = []
+
+        tools_index: Dict[str, List[Tool]] = {}
         try:
-            # Filter tools by server
-            if isinstance(data, list):
-                for tool_data in data:
-                    if isinstance(tool_data, dict):
-                        # Try different possible keys for server name
-                        tool_server = (
-                            tool_data.get("server")
-                            or tool_data.get("serverName")
-                            or tool_data.get("server_name")
-                        )
-                        if tool_server == server:
-                            tools.append(self._parse_tool(tool_data))
-            elif isinstance(data, dict):
-                if "tools" in data:
-                    for tool_data in data["tools"]:
-                        if isinstance(tool_data, dict):
-                            tool_server = (
-                                tool_data.get("server")
-                                or tool_data.get("serverName")
-                                or tool_data.get("server_name")
-                            )
-                            if tool_server == server:
-                                tools.append(self._parse_tool(tool_data))
-                elif "items" in data:
-                    for tool_data in data["items"]:
-                        if isinstance(tool_data, dict):
-                            tool_server = (
-                                tool_data.get("server")
-                                or tool_data.get("serverName")
-                                or tool_data.get("server_name")
-                            )
-                            if tool_server == server:
-                                tools.append(self._parse_tool(tool_data))
+            for tool_data in items:
+                if not isinstance(tool_data, dict):
+                    continue
+                # Try different possible keys for server name
+                tool_server = (
+                    tool_data.get("server")
+                    or tool_data.get("serverName")
+                    or tool_data.get("server_name")
+                )
+                if tool_server:
+                    tools_index.setdefault(tool_server, []).append(self._parse_tool(tool_data))
         except Exception as e:
-            raise ParseError(
-                "tools ls output",
-                reason=str(e),
-                details={"server": server, "data": data},
-            ) from e
+            raise ParseError("tools ls output", reason=str(e), details={"data": data}) from e
 
-        return tools
+        return tools_index
 
     async def get_server_info(self, server: str) -> Optional[ServerMetadata]:
         """
@@ -329,15 +381,11 @@ class DockerMCPClient:
 
         # Fallback to catalog (don't raise error if inspect fails, try catalog)
         try:
-            servers = await self.get_catalog_servers()
-            for s in servers:
-                if s.name == server:
-                    return s
+            index = await self.get_catalog_index()
+            return index.get(server)
         except Exception:
             # If catalog lookup also fails, return None
-            pass
-
-        return None
+            return None
 
     async def config_read(self) -> Dict[str, Any]:
         """
@@ -524,10 +572,16 @@ class DockerMCPClient:
         # Build command: docker mcp tools call <tool_name> --arguments <json>
         cmd = ["docker", "mcp", "tools", "call", tool_name, "--arguments", arguments_json]
 
-        stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
+        output, return_code = await run_command_output(
+            cmd,
+            timeout=self.command_timeout,
+            max_output_bytes=self.max_output_bytes,
+            preview_bytes=self.output_preview_bytes,
+            spill_dir=self.spill_dir,
+        )
 
         if return_code != 0:
-            error_msg = stdout if stdout else "Unknown error"
+            error_msg = output.text or "Unknown error"
             # Check if tool not found
             if "not found" in error_msg.lower() or "unknown tool" in error_msg.lower():
                 raise ToolNotFoundError(
@@ -541,7 +595,12 @@ class DockerMCPClient:
                 details={"tool_name": tool_name, "arguments": arguments},
             )
 
+        if output.truncated:
+            # Too large to parse in memory: return a preview and where the rest is
+            return self._truncated_result(output)
+
         # Parse JSON response
+        stdout = output.text
         data = parse_json_output(stdout)
         if data is None:
             # Try to parse as plain text if JSON parsing fails
@@ -579,6 +638,52 @@ class DockerMCPClient:
             # Primitive value
             return {"result": data, "type": "primitive"}
 
+    async def cap_output(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Spill tool output received in memory (e.g. over a session) if over max_output_bytes.
+
+        Args:
+            text: Tool output
+
+        Returns:
+            Result with a preview and the spill file, like call_tool returns
+            for large output, or None if the output is within the cap
+        """
+        if not self.max_output_bytes:
+            return None
+        data = text.encode("utf-8")
+        if len(data) <= self.max_output_bytes:
+            return None
+        logger.warning(f"Tool output exceeded {self.max_output_bytes} bytes, spilling to a file")
+        output = await spill_output(data, self.output_preview_bytes, self.spill_dir)
+        return self._truncated_result(output)
+
+    def _truncated_result(self, output: CapturedOutput) -> Dict[str, Any]:
+        """Build the result of spilled output, keeping its file for the caller."""
+        self._keep_spill_file(output.spill_path)
+        return {
+            "result": output.text,
+            "type": "text",
+            "truncated": True,
+            "size_bytes": output.total_bytes,
+            "output_file": output.spill_path,
+        }
+
+    def _keep_spill_file(self, path: str):
+        """Track a spill file handed out in a result, deleting expired ones."""
+        self._spill_files.append(path)
+        while self.spill_max_files and len(self._spill_files) > self.spill_max_files:
+            remove_file(self._spill_files.popleft())
+        if self.spill_max_age:
+            # Also covers files left behind by earlier runs
+            if prune_spill_files(self.spill_dir, self.spill_max_age):
+                self._spill_files = deque(p for p in self._spill_files if os.path.exists(p))
+
+    def cleanup_spill_files(self):
+        """Delete all spill files handed out in results."""
+        while self._spill_files:
+            remove_file(self._spill_files.popleft())
+
     def _parse_server_metadata(self, name: str, data: Dict[str, Any]) -> ServerMetadata:
         """Parse server metadata from catalog data."""
         return ServerMetadata(
@@ -599,6 +704,7 @@ class DockerMCPClient:
             name=data.get("name", ""),
             description=data.get("description"),
             inputSchema=data.get("inputSchema"),
+            annotations=data.get("annotations"),
         )
 
 
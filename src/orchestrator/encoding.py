@@ -0,0 +1,102 @@
+"""Encoding of tool results into MCP text content."""
+
+import json
+import logging
+from typing import Any, List
+
+from mcp.types import TextContent
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ("compact", "pretty")
+
+
+def _default(value: Any) -> Any:
+    """Convert values the JSON encoders don't handle natively."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json", exclude_none=True)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def backend() -> str:
+    """
+    Get the name of the JSON encoder in use.
+
+    Returns:
+        "orjson", "msgspec" or "json"
+    """
+    if orjson is not None:
+        return "orjson"
+    if msgspec is not None:
+        return "msgspec"
+    return "json"
+
+
+def dumps(data: Any, pretty: bool = False) -> str:
+    """
+    Encode data as JSON, using orjson or msgspec when installed.
+
+    Falls back to the standard library for inputs the fast encoders
+    reject (e.g. non-string dict keys or integers over 64 bits).
+
+    Args:
+        data: Data to encode
+        pretty: Indent output by 2 spaces instead of compact separators
+
+    Returns:
+        JSON string
+    """
+    try:
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(data, default=_default, option=option).decode()
+        if msgspec is not None:
+            encoded = msgspec.json.encode(data, enc_hook=_default)
+            if pretty:
+                encoded = msgspec.json.format(encoded, indent=2)
+            return encoded.decode()
+    except (TypeError, ValueError, OverflowError) as e:
+        logger.debug(f"Fast JSON encoder failed, falling back to json: {e}")
+
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=_default)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def format_result(
+    result: Any, output_format: str = "compact", single_block: bool = True
+) -> List[TextContent]:
+    """
+    Format a tool handler result as MCP text content.
+
+    Args:
+        result: Handler result (dict, list or scalar)
+        output_format: "compact" or "pretty" JSON
+        single_block: Encode the whole result as one content block instead of
+            one block per list item
+
+    Returns:
+        List of text content blocks
+    """
+    pretty = output_format == "pretty"
+
+    def encode(item: Any) -> str:
+        if isinstance(item, (dict, list)):
+            return dumps(item, pretty=pretty)
+        return str(item)
+
+    if isinstance(result, list) and not single_block:
+        return [TextContent(type="text", text=encode(item)) for item in result]
+    return [TextContent(type="text", text=encode(result))]
@@ -0,0 +1,238 @@
+"""Watching server container events to keep server status current."""
+
+import asyncio
+import json
+import logging
+import time
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Container label carrying the MCP server name
+DEFAULT_SERVER_LABEL = "docker-mcp-name"
+
+# Container actions that change a server's status ("stop" is always followed by "die")
+SERVER_EVENT_ACTIONS = ("start", "die")
+
+EventSource = Callable[[], AsyncIterator["ServerEvent"]]
+EventHandler = Callable[["ServerEvent"], Awaitable[None]]
+
+
+class ServerEvent:
+    """A status change of an MCP server's container."""
+
+    def __init__(
+        self,
+        server: str,
+        action: str,
+        timestamp: Optional[float] = None,
+        exit_code: Optional[int] = None,
+    ):
+        """
+        Initialize event.
+
+        Args:
+            server: Server name
+            action: Container action ("start" or "die")
+            timestamp: Event time (now if None)
+            exit_code: Exit code of the container for "die" (None if unknown)
+        """
+        self.server = server
+        self.action = action
+        self.timestamp = timestamp if timestamp is not None else time.time()
+        self.exit_code = exit_code
+
+    @property
+    def failed(self) -> bool:
+        """
+        Whether the server's container exited abnormally.
+
+        Containers of enabled servers also exit cleanly between calls; a
+        non-zero (or unknown) exit code is what disabling a server leaves.
+        """
+        return self.action == "die" and self.exit_code != 0
+
+    def __repr__(self) -> str:
+        return f"ServerEvent({self.server!r}, {self.action!r})"
+
+
+def parse_docker_event(line: str, label: str = DEFAULT_SERVER_LABEL) -> Optional[ServerEvent]:
+    """
+    Parse one line of `docker events --format '{{json .}}'`.
+
+    Args:
+        line: JSON event line
+        label: Container label carrying the server name
+
+    Returns:
+        ServerEvent, or None if the line is not a relevant server event
+    """
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError:
+        logger.debug(f"Skipping malformed docker event: {line[:200]}")
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    action = data.get("Action") or data.get("status")
+    attributes = (data.get("Actor") or {}).get("Attributes") or {}
+    server = attributes.get(label)
+    if not server or action not in SERVER_EVENT_ACTIONS:
+        return None
+    try:
+        exit_code = int(attributes["exitCode"])
+    except (KeyError, TypeError, ValueError):
+        exit_code = None
+    return ServerEvent(server, action, data.get("time"), exit_code)
+
+
+class DockerEventSource:
+    """Event source streaming `docker events` for MCP server containers."""
+
+    def __init__(self, label: str = DEFAULT_SERVER_LABEL):
+        """
+        Initialize event source.
+
+        Args:
+            label: Container label carrying the server name
+        """
+        self.label = label
+
+    def command(self) -> List[str]:
+        """Build the `docker events` command."""
+        cmd = ["docker", "events", "--format", "{{json .}}", "--filter", "type=container"]
+        cmd += ["--filter", f"label={self.label}"]
+        for action in SERVER_EVENT_ACTIONS:
+            cmd += ["--filter", f"event={action}"]
+        return cmd
+
+    async def __call__(self) -> AsyncIterator[ServerEvent]:
+        """
+        Stream server events until `docker events` exits.
+
+        Yields:
+            Server events
+        """
+        process = await asyncio.create_subprocess_exec(
+            *self.command(),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            async for raw in process.stdout:
+                event = parse_docker_event(raw.decode("utf-8", errors="replace"), self.label)
+                if event:
+                    yield event
+        finally:
+            if process.returncode is None:
+                process.terminate()
+                await process.wait()
+
+
+class ServerEventWatcher:
+    """Long-running watcher pushing server events to subscribers."""
+
+    def __init__(self, source: EventSource, reconnect_delay: float = 5, stable_after: float = 2):
+        """
+        Initialize watcher.
+
+        Args:
+            source: Callable returning an async iterator of server events,
+                e.g. DockerEventSource or a scripted stream in tests
+            reconnect_delay: Seconds to wait before restarting a source that
+                ended or failed
+            stable_after: Seconds a (re)started source must keep running
+                before subscribers are told it is connected, so a source
+                that keeps failing never flips them to event-driven status
+        """
+        self.source = source
+        self.reconnect_delay = reconnect_delay
+        self.stable_after = stable_after
+        self.connected = False
+        self._handlers: List[EventHandler] = []
+        self._on_connect: List[Callable[[bool], Awaitable[None]]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(
+        self,
+        handler: EventHandler,
+        on_connect: Optional[Callable[[bool], Awaitable[None]]] = None,
+    ):
+        """
+        Subscribe to server events.
+
+        Args:
+            handler: Async function called for each event, in subscription order
+            on_connect: Async function called with True once the source has
+                been streaming for stable_after seconds, and False when it
+                stops after that
+        """
+        self._handlers.append(handler)
+        if on_connect:
+            self._on_connect.append(on_connect)
+
+    def start(self):
+        """Start watching in the background."""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        """Stop watching."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _watch(self):
+        """Consume the source, restarting it when it ends or fails."""
+        while True:
+            established = asyncio.create_task(self._connect_when_stable())
+            try:
+                async for event in self.source():
+                    await self._dispatch(event)
+                logger.warning("Server event stream ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Server event stream failed: {e}")
+            finally:
+                await asyncio.shield(self._disconnect(established))
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _connect_when_stable(self):
+        """Signal connected once the source has kept running for stable_after."""
+        await asyncio.sleep(self.stable_after)
+        await self._set_connected(True)
+
+    async def _disconnect(self, established: asyncio.Task):
+        """Signal disconnected if the stream that stopped was signalled connected."""
+        if not self.connected:
+            established.cancel()
+        # A connect signal in progress completes before the disconnect
+        await asyncio.gather(established, return_exceptions=True)
+        await self._set_connected(False)
+
+    async def _dispatch(self, event: ServerEvent):
+        """Deliver an event to every handler, isolating handler failures."""
+        logger.debug(f"Server event: {event}")
+        for handler in self._handlers:
+            try:
+                await handler(event)
+            except Exception as e:
+                logger.error(f"Error handling {event}: {e}", exc_info=True)
+
+    async def _set_connected(self, connected: bool):
+        """Notify subscribers that the stream state changed."""
+        if connected == self.connected:
+            return
+        self.connected = connected
+        for callback in self._on_connect:
+            try:
+                await callback(connected)
+            except Exception as e:
+                logger.error(f"Error handling event stream state: {e}", exc_info=True)
@@ -136,3 +136,59 @@ class TimeoutError(DockerMCPError):
         self.operation = operation
         self.timeout = timeout
 
+
+class AmbiguousToolError(DockerMCPError):
+    """Raised when a tool name is provided by more than one active server."""
+
+    def __init__(self, tool_name: str, candidates: list[str], details: dict | None = None):
+        """
+        Initialize error.
+
+        Args:
+            tool_name: Ambiguous tool name
+            candidates: Qualified names that resolve the ambiguity (empty if
+                the name is already qualified)
+            details: Additional error details
+        """
+        message = f"Tool '{tool_name}' is provided by several active servers"
+        if candidates:
+            message += f", use a qualified name: {', '.join(candidates)}"
+        super().__init__(message, details)
+        self.tool_name = tool_name
+        self.candidates = candidates
+
+
+class QueueFullError(DockerMCPError):
+    """Raised when the tool call queue is full."""
+
+    def __init__(self, max_depth: int, details: dict | None = None):
+        """
+        Initialize error.
+
+        Args:
+            max_depth: Maximum number of queued calls
+            details: Additional error details
+        """
+        message = f"Tool call queue is full ({max_depth} calls waiting), try again later"
+        super().__init__(message, details)
+        self.max_depth = max_depth
+
+
+class InvalidArgumentError(DockerMCPError):
+    """Raised when a tool argument is invalid."""
+
+    def __init__(self, argument: str, value: object, reason: str, details: dict | None = None):
+        """
+        Initialize error.
+
+        Args:
+            argument: Argument name
+            value: Invalid value
+            reason: Why the value is invalid
+            details: Additional error details
+        """
+        message = f"Invalid {argument} {value!r}: {reason}"
+        super().__init__(message, details)
+        self.argument = argument
+        self.value = value
+        self.reason = reason
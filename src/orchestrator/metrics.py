@@ -0,0 +1,235 @@
+"""In-process metrics: counters and latency histograms."""
+
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import aiofiles
+
+logger = logging.getLogger(__name__)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    """Build a hashable key from labels."""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    """Format labels in Prometheus text format."""
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _percentile(samples: List[float], p: float) -> float:
+    """Get the p-th percentile of sorted samples."""
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name: str, description: str):
+        """
+        Initialize counter.
+
+        Args:
+            name: Metric name
+            description: Metric description
+        """
+        self.name = name
+        self.description = description
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any):
+        """Increment counter for labels."""
+        key = _label_key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Get values per label set."""
+        return [{**dict(key), "value": value} for key, value in sorted(self._values.items())]
+
+    def to_prometheus(self) -> List[str]:
+        """Render counter in Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(key)} {value}")
+        return lines
+
+
+class _Series:
+    """Observations of a histogram for one label set."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.bucket_counts = [0] * len(buckets)
+        self.samples: Deque[float] = deque(maxlen=1000)
+
+
+class Histogram:
+    """Histogram of durations (seconds) with labels and recent-sample percentiles."""
+
+    def __init__(self, name: str, description: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize histogram.
+
+        Args:
+            name: Metric name
+            description: Metric description
+            buckets: Upper bounds of histogram buckets
+        """
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        self._series: Dict[LabelKey, _Series] = {}
+
+    def observe(self, value: float, **labels: Any):
+        """Record an observation for labels."""
+        key = _label_key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(self.buckets)
+        series.count += 1
+        series.sum += value
+        series.max = max(series.max, value)
+        series.samples.append(value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series.bucket_counts[i] += 1
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Get count, sum and latency percentiles (ms) per label set."""
+        result = []
+        for key, series in sorted(self._series.items()):
+            samples = sorted(series.samples)
+            result.append(
+                {
+                    **dict(key),
+                    "count": series.count,
+                    "sum_ms": series.sum * 1000,
+                    "avg_ms": series.sum / series.count * 1000,
+                    "p50_ms": _percentile(samples, 0.5) * 1000,
+                    "p99_ms": _percentile(samples, 0.99) * 1000,
+                    "max_ms": series.max * 1000,
+                }
+            )
+        return result
+
+    def to_prometheus(self) -> List[str]:
+        """Render histogram in Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        for key, series in sorted(self._series.items()):
+            for bound, count in zip(self.buckets, series.bucket_counts):
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', str(bound)))} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {series.count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {series.sum}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {series.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Registry of named counters and histograms."""
+
+    def __init__(self):
+        """Initialize registry."""
+        self._metrics: Dict[str, Any] = {}
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        """Get or create a counter."""
+        if name not in self._metrics:
+            self._metrics[name] = Counter(name, description)
+        return self._metrics[name]
+
+    def histogram(self, name: str, description: str = "") -> Histogram:
+        """Get or create a histogram."""
+        if name not in self._metrics:
+            self._metrics[name] = Histogram(name, description)
+        return self._metrics[name]
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get all metric values.
+
+        Returns:
+            Dictionary mapping metric names to their values per label set
+        """
+        return {name: metric.snapshot() for name, metric in sorted(self._metrics.items())}
+
+    def to_prometheus(self) -> str:
+        """
+        Render all metrics in Prometheus text exposition format.
+
+        Returns:
+            Metrics text
+        """
+        lines = []
+        for _, metric in sorted(self._metrics.items()):
+            lines.extend(metric.to_prometheus())
+        return "\n".join(lines) + "\n"
+
+    async def write_prometheus(self, path: str):
+        """
+        Write metrics in Prometheus text format to a file.
+
+        The file can be picked up by node_exporter's textfile collector.
+
+        Args:
+            path: Target file path
+        """
+        target = Path(path).expanduser()
+        tmp_path = target.with_suffix(target.suffix + ".tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
+                await f.write(self.to_prometheus())
+            os.replace(tmp_path, target)
+        except OSError as e:
+            logger.warning(f"Failed to write metrics to {target}: {e}")
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
+
+cache_hits = metrics.counter("orchestrator_cache_hits_total", "Metadata cache hits")
+cache_misses = metrics.counter("orchestrator_cache_misses_total", "Metadata cache misses")
+cache_stale_hits = metrics.counter(
+    "orchestrator_cache_stale_hits_total", "Stale metadata cache entries served while refreshing"
+)
+cache_evictions = metrics.counter("orchestrator_cache_evictions_total", "Metadata cache evictions")
+cache_fetch_duration = metrics.histogram(
+    "orchestrator_cache_fetch_duration_seconds", "Duration of metadata cache fetches"
+)
+command_duration = metrics.histogram(
+    "orchestrator_command_duration_seconds", "Duration of docker mcp subprocesses"
+)
+proxy_call_duration = metrics.histogram(
+    "orchestrator_proxy_call_duration_seconds", "Duration of proxied tool calls"
+)
+result_cache_hits = metrics.counter(
+    "orchestrator_result_cache_hits_total", "Tool calls answered from the result cache"
+)
+result_cache_misses = metrics.counter(
+    "orchestrator_result_cache_misses_total", "Cacheable tool calls that ran on the server"
+)
+tool_call_deduplicated = metrics.counter(
+    "orchestrator_tool_call_deduplicated_total",
+    "Tool calls attached to an identical call already in flight",
+)
+tool_call_transport = metrics.counter(
+    "orchestrator_tool_call_transport_total", "Tool calls by transport (session or cli)"
+)
@@ -22,6 +22,9 @@ class Tool(BaseModel):
     name: str = Field(..., description="Tool name")
     description: Optional[str] = Field(None, description="Tool description")
     inputSchema: Optional[Dict[str, Any]] = Field(None, description="Tool input schema")
+    annotations: Optional[Dict[str, Any]] = Field(
+        None, description="Tool annotations (e.g. readOnlyHint)"
+    )
 
 
 class ServerPrompt(BaseModel):
@@ -71,11 +74,21 @@ class CachedItem(BaseModel):
     data: Any = Field(..., description="Cached data")
     timestamp: datetime = Field(default_factory=datetime.now, description="Cache timestamp")
     ttl: int = Field(300, description="Time to live in seconds")
+    hard_ttl: int = Field(
+        0, description="Max age in seconds a stale item may still be served (0 = same as ttl)"
+    )
+
+    def age(self) -> float:
+        """Get age of cache item in seconds."""
+        return (datetime.now() - self.timestamp).total_seconds()
 
     def is_expired(self) -> bool:
         """Check if cache item is expired."""
-        age = (datetime.now() - self.timestamp).total_seconds()
-        return age > self.ttl
+        return self.age() > self.ttl
+
+    def is_usable(self) -> bool:
+        """Check if cache item may still be served, possibly stale."""
+        return self.age() <= max(self.ttl, self.hard_ttl)
 
 
 class StartServersResult(BaseModel):
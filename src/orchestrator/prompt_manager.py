@@ -5,6 +5,7 @@ from typing import Dict, List, Optional
 
 from .cache import MetadataCache
 from .docker_client import DockerMCPClient
+from .utils import gather_limited
 
 logger = logging.getLogger(__name__)
 
@@ -12,16 +13,20 @@ logger = logging.getLogger(__name__)
 class PromptManager:
     """Manager for server prompts."""
 
-    def __init__(self, cache: MetadataCache, docker_client: DockerMCPClient):
+    def __init__(
+        self, cache: MetadataCache, docker_client: DockerMCPClient, max_parallel: int = 4
+    ):
         """
         Initialize prompt manager.
 
         Args:
             cache: MetadataCache instance
             docker_client: DockerMCPClient instance
+            max_parallel: Max prompts fetched at once
         """
         self._cache = cache
         self._docker_client = docker_client
+        self.max_parallel = max_parallel
 
     async def get_server_prompt(self, server: str) -> Optional[str]:
         """
@@ -33,8 +38,12 @@ class PromptManager:
         Returns:
             Prompt string or None if not available
         """
+        async def fetch_info():
+            return await self._docker_client.get_server_info(server)
+
         async def fetch_prompt():
-            metadata = await self._docker_client.get_server_info(server)
+            # Shares the metadata cache (and its in-flight fetch) with get_server_info
+            metadata = await self._cache.get_server_metadata(server, fetch_info)
             if metadata and metadata.prompt:
                 return metadata.prompt
             return None
@@ -52,10 +61,16 @@ class PromptManager:
         Returns:
             Dictionary mapping server names to their prompts
         """
+        results = await gather_limited(
+            [lambda server=server: self.get_server_prompt(server) for server in servers],
+            limit=self.max_parallel,
+        )
+
         prompts = {}
-        for server in servers:
-            prompt = await self.get_server_prompt(server)
-            if prompt:
+        for server, prompt in zip(servers, results):
+            if isinstance(prompt, Exception):
+                logger.warning(f"Failed to get prompt for server {server}: {prompt}")
+            elif prompt:
                 prompts[server] = prompt
                 logger.debug(f"Found prompt for server {server}")
             else:
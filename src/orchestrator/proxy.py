@@ -1,92 +1,504 @@
 """Proxy layer for routing tool calls to MCP servers."""
 
+import asyncio
 import logging
+import time
 from typing import Any, Dict, List, Optional
 
-from .exceptions import ConnectionError, ToolNotFoundError
+from mcp.types import Tool as MCPTool
+
+from .exceptions import (
+    AmbiguousToolError,
+    ConnectionError,
+    QueueFullError,
+    ServerNotFoundError,
+    TimeoutError,
+    ToolNotFoundError,
+)
+from .cache import MetadataCache
+from .events import ServerEvent
+from .metrics import proxy_call_duration, tool_call_deduplicated
 from .models import Tool
+from .result_cache import ResultCache, ToolMatcher, call_key
+from .scheduler import ToolCallScheduler
+from .search import SearchIndex
 
 logger = logging.getLogger(__name__)
 
+# Field weights for ranking active tools
+TOOL_SEARCH_FIELD_WEIGHTS = {"name": 3.0, "description": 1.0}
+
+# Separator between server and tool name in exposed tool names
+DEFAULT_NAMESPACE_SEPARATOR = "__"
+
 
 class ToolProxy:
     """Proxy for routing tool calls to appropriate MCP servers."""
 
-    def __init__(self, connection_pool):
+    def __init__(
+        self,
+        connection_pool,
+        scheduler: Optional[ToolCallScheduler] = None,
+        expose_tools: bool = False,
+        namespace_separator: str = DEFAULT_NAMESPACE_SEPARATOR,
+        cache: Optional[MetadataCache] = None,
+        drain_timeout: float = 10,
+        result_cache: Optional[ResultCache] = None,
+        dedup: Optional[ToolMatcher] = None,
+    ):
         """
         Initialize tool proxy.
 
         Args:
             connection_pool: MCPConnectionPool instance
+            scheduler: Scheduler bounding concurrent tool calls (default limits if None)
+            expose_tools: Publish active tools as namespaced MCP tools
+                (e.g. github__create_issue)
+            namespace_separator: Separator between server and tool name in
+                qualified and exposed names
+            cache: Metadata cache whose server tools are dropped on unregister
+            drain_timeout: Max seconds to wait for in-flight calls when
+                unregistering a server
+            result_cache: Cache of results of idempotent tools (disabled if None)
+            dedup: Selects tools safe to share one in-flight call between
+                identical concurrent requests (disabled if None)
         """
         self._pool = connection_pool
-        self._tool_to_server: Dict[str, str] = {}
+        self._scheduler = scheduler or ToolCallScheduler()
+        # Tool name -> servers providing it (insertion-ordered set)
+        self._tool_to_servers: Dict[str, Dict[str, None]] = {}
         self._server_tools: Dict[str, List[Tool]] = {}
+        # Search index over active tools, keyed by (server, tool name)
+        self._tool_index = SearchIndex(TOOL_SEARCH_FIELD_WEIGHTS)
+        self._indexed_tools: Dict[tuple[str, str], Tool] = {}
+        # Bumped whenever the set of active tools changes
+        self._version = 0
+        # Qualified names (server__tool) -> (server, tool) routes, maintained
+        # on register/unregister; exposed tools are published only if enabled.
+        # Names can collide (a__b + c vs a + b__c), so each maps to a set
+        self.expose_tools = expose_tools
+        self.namespace_separator = namespace_separator
+        self._qualified_routes: Dict[str, Dict[tuple[str, str], None]] = {}
+        self._exposed_tools: Dict[str, MCPTool] = {}
+        # Server lifecycle: register/unregister are serialized, and
+        # unregister waits for the server's in-flight calls to finish
+        self._cache = cache
+        self.drain_timeout = drain_timeout
+        self._lifecycle_lock = asyncio.Lock()
+        self._inflight: Dict[str, int] = {}
+        self._drained: Dict[str, asyncio.Event] = {}
+        self._result_cache = result_cache
+        # Identical in-flight calls of safe tools, by call key
+        self._dedup = dedup
+        self._pending_calls: Dict[str, asyncio.Future] = {}
+        self._deduplicated = 0
 
-    def register_tools(self, server: str, tools: List[Tool]):
+    @property
+    def version(self) -> int:
+        """Version of the active tool set, bumped on every change."""
+        return self._version
+
+    async def register_server(self, server: str, tools: List[Tool]):
         """
-        Register tools for a server.
+        Register a started server and its tools.
+
+        Routing is replaced in one step, so calls see either the old or the
+        new tool set. The pool's cached status for the server is dropped so
+        the first call re-checks it instead of trusting a stale "inactive".
 
         Args:
             server: Server name
             tools: List of tools provided by the server
         """
-        self._server_tools[server] = tools
-        for tool in tools:
-            self._tool_to_server[tool.name] = server
-        logger.info(f"Registered {len(tools)} tools for server {server}")
+        async with self._lifecycle_lock:
+            for tool in self._server_tools.get(server, []):
+                self._remove_route(server, tool.name)
+            self._server_tools[server] = tools
+            for tool in tools:
+                self._add_route(server, tool)
+            self._version += 1
+            await self._pool.invalidate_server_cache(server)
+            if self._result_cache:
+                self._result_cache.invalidate_server(server)
+            logger.info(f"Registered {len(tools)} tools for server {server}")
 
-    def unregister_server(self, server: str):
+    async def unregister_server(self, server: str):
         """
-        Unregister all tools for a server.
+        Unregister a server, releasing everything held for it.
+
+        Routes are removed first so no new calls reach the server. Calls
+        already in flight get up to drain_timeout seconds to finish before
+        the server's pool status and session are dropped and its cached
+        tools are invalidated. The drain runs outside the lifecycle lock,
+        so other servers can be registered or unregistered meanwhile.
 
         Args:
             server: Server name
         """
-        if server in self._server_tools:
-            tools = self._server_tools[server]
-            for tool in tools:
-                self._tool_to_server.pop(tool.name, None)
-            self._server_tools.pop(server, None)
-            # Invalidate server cache
-            self._pool.invalidate_server_cache(server)
+        async with self._lifecycle_lock:
+            if server not in self._server_tools:
+                return
+            for tool in self._server_tools.pop(server):
+                self._remove_route(server, tool.name)
+            self._version += 1
+
+        await self._drain(server)
+        async with self._lifecycle_lock:
+            if server in self._server_tools:
+                # Registered again while draining; its session is in use
+                logger.info(f"Server {server} was registered again while unregistering")
+                return
+            await self._pool.invalidate_server_cache(server)
+            await self._pool.close_session(server)
+            if self._cache:
+                self._cache.invalidate_server_tools(server)
+            if self._result_cache:
+                self._result_cache.invalidate_server(server)
             logger.info(f"Unregistered server {server}")
 
+    async def handle_server_event(self, event: ServerEvent):
+        """
+        Unregister a server whose container failed and that is no longer active.
+
+        Containers also exit between calls, so only abnormal exits are
+        checked, and the server is only dropped once the (already
+        invalidated) status confirms it was disabled.
+
+        Args:
+            event: Server event
+        """
+        if not event.failed or event.server not in self._server_tools:
+            return
+        try:
+            active = await self._pool.ensure_server_active(event.server)
+        except ServerNotFoundError:
+            # Status unknown; keep the server until calls prove otherwise
+            return
+        if not active:
+            logger.info(f"Server {event.server} is no longer active, unregistering")
+            await self.unregister_server(event.server)
+
+    async def _drain(self, server: str):
+        """Wait for a server's in-flight calls, up to drain_timeout."""
+        if not self._inflight.get(server):
+            return
+        event = self._drained.setdefault(server, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), self.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"{self._inflight.get(server, 0)} calls to server {server} still "
+                f"running after {self.drain_timeout}s, unregistering anyway"
+            )
+
+    def exposed_name(self, server: str, tool_name: str) -> str:
+        """
+        Get the namespaced name a server tool is published under.
+
+        Args:
+            server: Server name
+            tool_name: Tool name
+
+        Returns:
+            Namespaced tool name
+        """
+        return f"{server}{self.namespace_separator}{tool_name}"
+
+    def _add_route(self, server: str, tool: Tool):
+        """Add a server tool to the routing, search and exposure indexes."""
+        self._tool_to_servers.setdefault(tool.name, {})[server] = None
+        self._indexed_tools[(server, tool.name)] = tool
+        self._tool_index.add(
+            (server, tool.name),
+            {"name": tool.name, "description": tool.description or ""},
+        )
+
+        name = self.exposed_name(server, tool.name)
+        routes = self._qualified_routes.setdefault(name, {})
+        routes[(server, tool.name)] = None
+        if len(routes) > 1:
+            logger.warning(
+                f"Qualified name {name} matches tools of servers "
+                f"{', '.join(s for s, _ in routes)}; calls to it are ambiguous"
+            )
+        elif self.expose_tools:
+            self._expose(name, server, tool)
+
+    def _remove_route(self, server: str, tool_name: str):
+        """Remove a server tool from the routing, search and exposure indexes."""
+        servers = self._tool_to_servers.get(tool_name)
+        if servers is not None:
+            servers.pop(server, None)
+            if not servers:
+                del self._tool_to_servers[tool_name]
+        self._indexed_tools.pop((server, tool_name), None)
+        self._tool_index.remove((server, tool_name))
+
+        name = self.exposed_name(server, tool_name)
+        routes = self._qualified_routes.get(name)
+        if routes is None:
+            return
+        routes.pop((server, tool_name), None)
+        if not routes:
+            del self._qualified_routes[name]
+            self._exposed_tools.pop(name, None)
+        elif self.expose_tools:
+            # Publish the colliding tool that is left
+            route = next(iter(routes))
+            self._expose(name, route[0], self._indexed_tools[route])
+
+    def _expose(self, name: str, server: str, tool: Tool):
+        """Publish a server tool under its namespaced name."""
+        description = f"[{server}] {tool.description}" if tool.description else f"[{server}]"
+        self._exposed_tools[name] = MCPTool(
+            name=name,
+            description=description,
+            inputSchema=tool.inputSchema or {"type": "object", "properties": {}},
+            annotations=tool.annotations,
+        )
+
+    def _resolve_qualified(self, name: str) -> Optional[tuple[str, str]]:
+        """
+        Resolve a qualified name to its server and tool.
+
+        Raises:
+            AmbiguousToolError: If the name matches tools of several servers
+        """
+        routes = self._qualified_routes.get(name)
+        if not routes:
+            return None
+        if len(routes) > 1:
+            raise AmbiguousToolError(
+                name, [], details={"servers": [server for server, _ in routes]}
+            )
+        return next(iter(routes))
+
+    def get_exposed_tools(self) -> List[MCPTool]:
+        """
+        Get active tools published under namespaced names.
+
+        Returns:
+            List of MCP tool definitions (empty unless expose_tools is on)
+        """
+        return list(self._exposed_tools.values())
+
+    def resolve_exposed_tool(self, name: str) -> Optional[tuple[str, str]]:
+        """
+        Resolve a namespaced tool name to its server and tool.
+
+        Args:
+            name: Namespaced tool name
+
+        Returns:
+            Tuple of (server, tool_name) or None if not exposed
+
+        Raises:
+            AmbiguousToolError: If the name matches tools of several servers
+        """
+        if not self.expose_tools:
+            return None
+        return self._resolve_qualified(name)
+
+    def resolve_tool(self, tool_name: str) -> tuple[str, str]:
+        """
+        Resolve a plain or qualified (server__tool) tool name.
+
+        A plain name resolves only if exactly one active server provides it.
+
+        Args:
+            tool_name: Tool name or qualified name
+
+        Returns:
+            Tuple of (server, tool_name)
+
+        Raises:
+            ToolNotFoundError: If no active server provides the tool
+            AmbiguousToolError: If several active servers provide the tool
+        """
+        servers = self._tool_to_servers.get(tool_name)
+        if servers:
+            if len(servers) == 1:
+                return next(iter(servers)), tool_name
+            raise AmbiguousToolError(
+                tool_name,
+                [self.exposed_name(server, tool_name) for server in servers],
+                details={"servers": list(servers)},
+            )
+
+        route = self._resolve_qualified(tool_name)
+        if route:
+            return route
+        raise ToolNotFoundError(tool_name)
+
     def get_server_for_tool(self, tool_name: str) -> Optional[str]:
         """
         Get server that provides a specific tool.
 
         Args:
-            tool_name: Tool name
+            tool_name: Tool name or qualified name
 
         Returns:
-            Server name or None if not found
+            Server name or None if not found or ambiguous
         """
-        return self._tool_to_server.get(tool_name)
+        try:
+            return self.resolve_tool(tool_name)[0]
+        except (ToolNotFoundError, AmbiguousToolError):
+            return None
 
     async def call_tool(
-        self, tool_name: str, arguments: Dict[str, Any]
+        self, tool_name: str, arguments: Dict[str, Any], bypass_cache: bool = False
     ) -> tuple[Any, Optional[str]]:
         """
         Call a tool through proxy.
 
         Args:
-            tool_name: Tool name
+            tool_name: Tool name or qualified name (server__tool)
             arguments: Tool arguments
+            bypass_cache: Skip the result cache (the fresh result is still cached)
 
         Returns:
             Tuple of (result, error_message)
         """
-        server = self.get_server_for_tool(tool_name)
-        if not server:
-            error = f"Tool {tool_name} not found in any active server"
+        try:
+            server, tool_name = self.resolve_tool(tool_name)
+        except (ToolNotFoundError, AmbiguousToolError) as e:
+            error = str(e)
             logger.error(error)
             return None, error
 
+        return await self.call_server_tool(server, tool_name, arguments, bypass_cache)
+
+    async def call_server_tool(
+        self,
+        server: str,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        bypass_cache: bool = False,
+    ) -> tuple[Any, Optional[str]]:
+        """
+        Call a tool on a known server, skipping name resolution.
+
+        Results of cacheable tools are served from the result cache while
+        fresh; only successful results are cached. Identical concurrent
+        calls of dedup-safe tools share one call to the server.
+
+        Args:
+            server: Server name
+            tool_name: Tool name
+            arguments: Tool arguments
+            bypass_cache: Skip the result cache (the fresh result is still cached)
+
+        Returns:
+            Tuple of (result, error_message)
+        """
+        tool = self._indexed_tools.get((server, tool_name))
+        cache_key = None
+        if self._result_cache and self._result_cache.is_cacheable(server, tool_name, tool):
+            cache_key = call_key(server, tool_name, arguments)
+            if not bypass_cache:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    return cached.data, None
+
+        self._inflight[server] = self._inflight.get(server, 0) + 1
         try:
-            # Call tool through CLI via connection pool
-            result = await self._pool.call_tool_via_cli(tool_name, arguments, server)
+            if self._dedup and self._dedup.matches(server, tool_name, tool):
+                result, error = await self._call_once(
+                    cache_key or call_key(server, tool_name, arguments),
+                    server,
+                    tool_name,
+                    arguments,
+                )
+            else:
+                result, error = await self._timed_call(server, tool_name, arguments)
+        finally:
+            self._inflight[server] -= 1
+            if not self._inflight[server]:
+                del self._inflight[server]
+                event = self._drained.pop(server, None)
+                if event:
+                    event.set()
+
+        if cache_key and not error:
+            self._result_cache.set(cache_key, result)
+        return result, error
+
+    async def _call_once(
+        self, key: str, server: str, tool_name: str, arguments: Dict[str, Any]
+    ) -> tuple[Any, Optional[str]]:
+        """
+        Call a tool, attaching to an identical call already in flight.
+
+        The call runs in its own task, so a caller being cancelled doesn't
+        cancel it for the others.
+
+        Args:
+            key: Call key
+            server: Server name
+            tool_name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Tuple of (result, error_message)
+        """
+        pending = self._pending_calls.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._timed_call(server, tool_name, arguments))
+            self._pending_calls[key] = pending
+            pending.add_done_callback(lambda done: self._forget_call(key, done))
+        else:
+            self._deduplicated += 1
+            tool_call_deduplicated.inc(server=server)
+            logger.debug(f"Attached to in-flight call {tool_name} on server {server}")
+        return await asyncio.shield(pending)
+
+    def _forget_call(self, key: str, future: asyncio.Future):
+        """Forget a finished in-flight call."""
+        if self._pending_calls.get(key) is future:
+            del self._pending_calls[key]
+
+    async def _timed_call(
+        self, server: str, tool_name: str, arguments: Dict[str, Any]
+    ) -> tuple[Any, Optional[str]]:
+        """Call a tool on a server, recording its duration."""
+        started = time.perf_counter()
+        result, error = await self._call_server_tool(server, tool_name, arguments)
+        proxy_call_duration.observe(
+            time.perf_counter() - started,
+            server=server,
+            tool=tool_name,
+            status="error" if error else "ok",
+        )
+        return result, error
+
+    async def _call_server_tool(
+        self, server: str, tool_name: str, arguments: Dict[str, Any]
+    ) -> tuple[Any, Optional[str]]:
+        """
+        Call a tool on a known server through the scheduler and pool.
+
+        Args:
+            server: Server name
+            tool_name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Tuple of (result, error_message)
+        """
+        # The CLI fallback can't target a server: only use it for unique names
+        cli_fallback = len(self._tool_to_servers.get(tool_name, ())) <= 1
+        try:
+            # Call tool through a pooled MCP session (or CLI fallback)
+            result = await self._scheduler.run(
+                server,
+                lambda: self._pool.call_tool(tool_name, arguments, server, cli_fallback),
+                operation=f"call_tool {tool_name}",
+            )
             return result, None
+        except (QueueFullError, TimeoutError) as e:
+            error = str(e)
+            logger.warning(error)
+            return None, error
         except ToolNotFoundError as e:
             error = str(e)
             logger.error(error)
@@ -102,6 +514,35 @@ class ToolProxy:
             logger.error(error, exc_info=True)
             return None, error
 
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """
+        Get tool call scheduler metrics.
+
+        Returns:
+            Dictionary with scheduler counters and queue wait times
+        """
+        return self._scheduler.get_stats()
+
+    def get_result_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get result cache statistics.
+
+        Returns:
+            Dictionary with result cache stats, or None if disabled
+        """
+        return self._result_cache.get_stats() if self._result_cache else None
+
+    def get_dedup_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get in-flight deduplication statistics.
+
+        Returns:
+            Dictionary with in-flight and deduplicated call counts, or None if disabled
+        """
+        if not self._dedup:
+            return None
+        return {"inflight": len(self._pending_calls), "deduplicated": self._deduplicated}
+
     def list_active_tools(self) -> List[Tool]:
         """
         List all active tools from all registered servers.
@@ -114,6 +555,22 @@ class ToolProxy:
             all_tools.extend(tools)
         return all_tools
 
+    def search_tools(self, query: str, limit: int = 10) -> List[tuple[str, Tool, float]]:
+        """
+        Search active tools by name and description.
+
+        Args:
+            query: Query text
+            limit: Max results
+
+        Returns:
+            List of (server, tool, score), best match first
+        """
+        return [
+            (server, self._indexed_tools[(server, tool_name)], score)
+            for (server, tool_name), score in self._tool_index.search(query)[:limit]
+        ]
+
     def get_server_tools(self, server: str) -> List[Tool]:
         """
         Get tools for a specific server.
@@ -0,0 +1,181 @@
+"""Cache of results of idempotent tool calls."""
+
+import copy
+import fnmatch
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from .cache import LRUCacheMap
+from .metrics import result_cache_hits, result_cache_misses
+from .models import CachedItem, Tool
+from .utils import arguments_hash
+
+logger = logging.getLogger(__name__)
+
+
+def call_key(server: str, tool_name: str, arguments: Optional[Dict[str, Any]]) -> str:
+    """
+    Build a key identifying a call by server, tool and canonical arguments.
+
+    Args:
+        server: Server name
+        tool_name: Tool name
+        arguments: Tool arguments
+
+    Returns:
+        Call key
+    """
+    return f"{server}:{tool_name}:{arguments_hash(arguments)}"
+
+
+class ToolMatcher:
+    """Selects tools by qualified-name patterns or the readOnlyHint annotation."""
+
+    def __init__(
+        self,
+        patterns: Optional[List[str]] = None,
+        read_only_hint: bool = True,
+        namespace_separator: str = "__",
+    ):
+        """
+        Initialize matcher.
+
+        Args:
+            patterns: Glob patterns of qualified tool names,
+                e.g. "github__list_*" or "*__get_*"
+            read_only_hint: Also match tools annotated with readOnlyHint
+            namespace_separator: Separator between server and tool name in
+                qualified names
+        """
+        self.patterns = list(patterns or [])
+        self.read_only_hint = read_only_hint
+        self.namespace_separator = namespace_separator
+        self._pattern = (
+            re.compile("|".join(fnmatch.translate(p) for p in self.patterns))
+            if self.patterns
+            else None
+        )
+
+    def matches(self, server: str, tool_name: str, tool: Optional[Tool] = None) -> bool:
+        """
+        Check whether a tool is selected.
+
+        Args:
+            server: Server name
+            tool_name: Tool name
+            tool: Tool definition, for its annotations
+
+        Returns:
+            True if the tool matches a pattern or is annotated read-only
+        """
+        if self._pattern and self._pattern.match(f"{server}{self.namespace_separator}{tool_name}"):
+            return True
+        if not (self.read_only_hint and tool and tool.annotations):
+            return False
+        return bool(tool.annotations.get("readOnlyHint"))
+
+
+class ResultCache:
+    """TTL and size bounded cache of tool call results, opt-in per tool."""
+
+    def __init__(
+        self,
+        ttl: int = 60,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        patterns: Optional[List[str]] = None,
+        read_only_hint: bool = True,
+        namespace_separator: str = "__",
+    ):
+        """
+        Initialize result cache.
+
+        Args:
+            ttl: Seconds a result is served from cache
+            max_entries: Max cached results (0 = unbounded)
+            max_bytes: Max estimated size of cached results in bytes (0 = unbounded)
+            patterns: Glob patterns of qualified tool names to cache,
+                e.g. "github__list_*" or "*__get_*"
+            read_only_hint: Also cache tools annotated with readOnlyHint
+            namespace_separator: Separator between server and tool name in
+                qualified names
+        """
+        self.ttl = ttl
+        self.matcher = ToolMatcher(patterns, read_only_hint, namespace_separator)
+        self._results = LRUCacheMap(max_entries, max_bytes)
+
+    def is_cacheable(self, server: str, tool_name: str, tool: Optional[Tool] = None) -> bool:
+        """
+        Check whether results of a tool may be cached.
+
+        Args:
+            server: Server name
+            tool_name: Tool name
+            tool: Tool definition, for its annotations
+
+        Returns:
+            True if the tool matches a pattern or is annotated read-only
+        """
+        return self.matcher.matches(server, tool_name, tool)
+
+    def get(self, key: str) -> Optional[CachedItem]:
+        """
+        Get a cached result that has not expired.
+
+        The item holds a copy of the result, so callers may modify it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached item or None
+        """
+        server = key.split(":", 1)[0]
+        item = self._results.get(key)
+        if item is not None and item.is_expired():
+            self._results.pop(key)
+            item = None
+        if item is None:
+            result_cache_misses.inc(server=server)
+            return None
+        result_cache_hits.inc(server=server)
+        return item.model_copy(update={"data": copy.deepcopy(item.data)})
+
+    def set(self, key: str, result: Any):
+        """
+        Cache a copy of a result.
+
+        Args:
+            key: Cache key
+            result: Tool result
+        """
+        self._results[key] = CachedItem(data=copy.deepcopy(result), ttl=self.ttl)
+
+    def invalidate_server(self, server: str):
+        """
+        Drop cached results of a server.
+
+        Args:
+            server: Server name
+        """
+        prefix = f"{server}:"
+        for key in self._results.keys():
+            if key.startswith(prefix):
+                self._results.pop(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get result cache statistics.
+
+        Returns:
+            Dictionary with entries, size and evictions
+        """
+        return {
+            "entries": len(self._results),
+            "bytes": self._results.bytes,
+            "evictions": self._results.evictions,
+            "ttl": self.ttl,
+            "patterns": self.matcher.patterns,
+            "read_only_hint": self.matcher.read_only_hint,
+        }
@@ -0,0 +1,208 @@
+"""Bounded scheduler for concurrent tool calls."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from .exceptions import QueueFullError, TimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Waiter:
+    """A queued call waiting for a slot."""
+
+    def __init__(self, server: str, future: asyncio.Future):
+        self.server = server
+        self.future = future
+
+
+class ToolCallScheduler:
+    """
+    Scheduler limiting concurrent tool calls globally and per server.
+
+    Calls that cannot start immediately wait in a FIFO queue of bounded depth.
+    A waiting call is skipped only while its own server is saturated, so one
+    busy server does not block calls to other servers.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 5,
+        max_per_server: int = 10,
+        max_queue_depth: int = 100,
+        call_timeout: int = 30,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrent: Max tool calls running at once across all servers
+            max_per_server: Max tool calls running at once per server
+            max_queue_depth: Max calls waiting for a slot (0 = unbounded)
+            call_timeout: Deadline for a call including queue wait, in seconds (0 = none)
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_per_server = max(1, max_per_server)
+        self.max_queue_depth = max_queue_depth
+        self.call_timeout = call_timeout
+
+        self._waiters: Deque[_Waiter] = deque()
+        self._active = 0
+        self._active_by_server: Dict[str, int] = {}
+
+        # Metrics
+        self._calls = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._queued = 0
+        self._wait_count = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_samples: Deque[float] = deque(maxlen=1000)
+
+    async def run(
+        self,
+        server: str,
+        func: Callable[[], Awaitable[T]],
+        operation: Optional[str] = None,
+    ) -> T:
+        """
+        Run a call once a slot is available, within the call deadline.
+
+        Args:
+            server: Server the call goes to
+            func: Async function performing the call
+            operation: Operation name for timeout errors
+
+        Returns:
+            Result of func
+
+        Raises:
+            QueueFullError: If the wait queue is full
+            TimeoutError: If the call does not finish before its deadline
+        """
+        self._calls += 1
+        timeout = self.call_timeout if self.call_timeout > 0 else None
+        try:
+            async with asyncio.timeout(timeout):
+                await self._acquire(server)
+                try:
+                    return await func()
+                finally:
+                    self._release(server)
+        except asyncio.TimeoutError as e:
+            self._timed_out += 1
+            raise TimeoutError(operation or f"tool call on {server}", self.call_timeout) from e
+
+    async def _acquire(self, server: str):
+        """Take a slot for server, waiting in the queue if needed."""
+        if not self._waiters and self._has_capacity(server):
+            self._take(server)
+            self._record_wait(0.0)
+            return
+
+        if self.max_queue_depth and len(self._waiters) >= self.max_queue_depth:
+            self._rejected += 1
+            raise QueueFullError(
+                self.max_queue_depth,
+                details={"server": server, "active": self._active},
+            )
+
+        waiter = _Waiter(server, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        self._queued += 1
+        # Queued only behind other waiters: start now if this server is idle
+        self._dispatch()
+        started = time.monotonic()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Slot was granted right before cancellation; hand it on
+                self._release(server)
+            else:
+                self._waiters.remove(waiter)
+                self._dispatch()
+            raise
+        self._record_wait(time.monotonic() - started)
+
+    def _release(self, server: str):
+        """Return a slot for server and wake eligible waiters."""
+        self._active -= 1
+        remaining = self._active_by_server.get(server, 1) - 1
+        if remaining > 0:
+            self._active_by_server[server] = remaining
+        else:
+            self._active_by_server.pop(server, None)
+        self._dispatch()
+
+    def _dispatch(self):
+        """Grant slots to queued calls in FIFO order."""
+        for waiter in list(self._waiters):
+            if self._active >= self.max_concurrent:
+                break
+            if waiter.future.done() or not self._has_capacity(waiter.server):
+                continue
+            self._waiters.remove(waiter)
+            self._take(waiter.server)
+            waiter.future.set_result(None)
+
+    def _has_capacity(self, server: str) -> bool:
+        """Check whether a call to server may start now."""
+        return (
+            self._active < self.max_concurrent
+            and self._active_by_server.get(server, 0) < self.max_per_server
+        )
+
+    def _take(self, server: str):
+        """Mark a slot as used by server."""
+        self._active += 1
+        self._active_by_server[server] = self._active_by_server.get(server, 0) + 1
+
+    def _record_wait(self, wait: float):
+        """Record time a call spent waiting for a slot."""
+        self._wait_count += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+        self._wait_samples.append(wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler metrics.
+
+        Returns:
+            Dictionary with call counters, current load and queue wait times (ms)
+        """
+        samples = sorted(self._wait_samples)
+
+        def percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(len(samples) * p))] * 1000
+
+        return {
+            "calls": self._calls,
+            "queued": self._queued,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+            "active": self._active,
+            "active_by_server": dict(self._active_by_server),
+            "waiting": len(self._waiters),
+            "limits": {
+                "max_concurrent": self.max_concurrent,
+                "max_per_server": self.max_per_server,
+                "max_queue_depth": self.max_queue_depth,
+                "call_timeout": self.call_timeout,
+            },
+            "queue_wait_ms": {
+                "avg": (self._wait_total / self._wait_count * 1000) if self._wait_count else 0.0,
+                "p50": percentile(0.5),
+                "p99": percentile(0.99),
+                "max": self._wait_max * 1000,
+            },
+        }
@@ -0,0 +1,140 @@
+"""Incremental BM25 full-text search index."""
+
+import math
+import re
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase alphanumeric tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SearchIndex:
+    """
+    BM25 ranked search over documents made of weighted text fields.
+
+    Documents can be added and removed at any time; statistics are kept
+    up to date incrementally, so there is no rebuild step.
+    """
+
+    def __init__(
+        self,
+        field_weights: Optional[Dict[str, float]] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            field_weights: Weight of each field's term frequencies (default 1.0)
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.field_weights = field_weights or {}
+        self.k1 = k1
+        self.b = b
+
+        self._postings: Dict[str, Dict[Hashable, float]] = {}
+        self._doc_terms: Dict[Hashable, Dict[str, float]] = {}
+        self._doc_lengths: Dict[Hashable, float] = {}
+        self._total_length = 0.0
+
+    def add(self, doc_id: Hashable, fields: Dict[str, str]):
+        """
+        Add or replace a document.
+
+        Args:
+            doc_id: Document identifier
+            fields: Text of each field
+        """
+        self.remove(doc_id)
+
+        terms: Dict[str, float] = {}
+        length = 0.0
+        for field, text in fields.items():
+            weight = self.field_weights.get(field, 1.0)
+            for token in tokenize(text or ""):
+                terms[token] = terms.get(token, 0.0) + weight
+                length += weight
+
+        self._doc_terms[doc_id] = terms
+        self._doc_lengths[doc_id] = length
+        self._total_length += length
+        for token, frequency in terms.items():
+            self._postings.setdefault(token, {})[doc_id] = frequency
+
+    def remove(self, doc_id: Hashable):
+        """
+        Remove a document if present.
+
+        Args:
+            doc_id: Document identifier
+        """
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        self._total_length -= self._doc_lengths.pop(doc_id, 0.0)
+        for token in terms:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[token]
+
+    def search(
+        self,
+        query: str,
+        filter_func: Optional[Callable[[Hashable], bool]] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Rank documents matching any query term.
+
+        Args:
+            query: Query text
+            filter_func: Optional predicate documents must satisfy
+
+        Returns:
+            List of (doc_id, score), best first
+        """
+        doc_count = len(self._doc_terms)
+        if not doc_count:
+            return []
+        avg_length = self._total_length / doc_count or 1.0
+
+        scores: Dict[Hashable, float] = {}
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = 1 - self.b + self.b * self._doc_lengths[doc_id] / avg_length
+                score = idf * frequency * (self.k1 + 1) / (frequency + self.k1 * norm)
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+        results = [
+            (doc_id, score)
+            for doc_id, score in scores.items()
+            if filter_func is None or filter_func(doc_id)
+        ]
+        # Ties are broken by id so pagination over results is stable
+        results.sort(key=lambda item: (-item[1], str(item[0])))
+        return results
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._doc_terms
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
@@ -2,49 +2,25 @@
 
 import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from mcp.server import Server
-from mcp.types import Tool
+from mcp.server import NotificationOptions, Server
+from mcp.types import TextContent, Tool
 
 from .cache import MetadataCache
 from .connection_pool import MCPConnectionPool
+from .disk_cache import DiskCache
 from .docker_client import DockerMCPClient
+from .encoding import OUTPUT_FORMATS, backend, dumps, format_result
+from .events import DockerEventSource, ServerEventWatcher
 from .exceptions import DockerMCPError
+from .metrics import metrics
 from .prompt_manager import PromptManager
 from .proxy import ToolProxy
-
-# Import all tools
-from .tools.config.config_get import get_tool as config_get_tool, handle_tool as handle_config_get
-from .tools.config.config_set import get_tool as config_set_tool, handle_tool as handle_config_set
-from .tools.config.secret_list import get_tool as secret_list_tool, handle_tool as handle_secret_list
-from .tools.config.secret_remove import (
-    get_tool as secret_remove_tool,
-    handle_tool as handle_secret_remove,
-)
-from .tools.config.secret_set import get_tool as secret_set_tool, handle_tool as handle_secret_set
-from .tools.info.get_info import get_tool as get_info_tool, handle_tool as handle_get_info
-from .tools.info.get_tools import get_tool as get_tools_tool, handle_tool as handle_get_tools
-from .tools.proxy.call_tool import get_tool as call_tool_tool, handle_tool as handle_call_tool
-from .tools.proxy.list_active_tools import (
-    get_tool as list_active_tools_tool,
-    handle_tool as handle_list_active_tools,
-)
-from .tools.servers.get_active import (
-    get_tool as get_active_tool,
-    handle_tool as handle_get_active,
-)
-from .tools.servers.list_catalog import (
-    get_tool as list_catalog_tool,
-    handle_tool as handle_list_catalog,
-)
-from .tools.servers.list_installed import (
-    get_tool as list_installed_tool,
-    handle_tool as handle_list_installed,
-)
-from .tools.servers.start import get_tool as start_tool, handle_tool as handle_start
-from .tools.servers.stop import get_tool as stop_tool, handle_tool as handle_stop
+from .result_cache import ResultCache, ToolMatcher
+from .scheduler import ToolCallScheduler
+from .tools.registry import bind_handlers, load_tools
 
 logger = logging.getLogger(__name__)
 
@@ -64,29 +40,112 @@ class OrchestratorServer:
 
         # Initialize components
         cache_config = self.config.get("orchestrator", {}).get("cache", {})
+        persist_dir = cache_config.get("persist_dir")
         self.cache = MetadataCache(
             servers_ttl=cache_config.get("servers_ttl", 300),
             tools_ttl=cache_config.get("tools_ttl", 600),
             prompts_ttl=cache_config.get("prompts_ttl", 0),
+            servers_hard_ttl=cache_config.get("servers_hard_ttl", 0),
+            tools_hard_ttl=cache_config.get("tools_hard_ttl", 0),
+            disk_cache=DiskCache(persist_dir) if persist_dir else None,
+            limits=cache_config.get("limits"),
         )
+        self.cache_refresh_interval = cache_config.get("refresh_interval", 0)
+
+        metrics_config = self.config.get("orchestrator", {}).get("metrics", {})
+        self.prometheus_file = metrics_config.get("prometheus_file")
+        self.prometheus_interval = metrics_config.get("prometheus_interval", 60)
+
+        output_config = self.config.get("orchestrator", {}).get("output", {})
+        self.output_format = output_config.get("format", "compact")
+        if self.output_format not in OUTPUT_FORMATS:
+            logger.warning(f"Unknown output format {self.output_format!r}, using compact")
+            self.output_format = "compact"
+        self.output_single_block = output_config.get("single_block", True)
+        logger.info(f"Encoding tool results as {self.output_format} JSON via {backend()}")
 
         docker_config = self.config.get("orchestrator", {}).get("docker_mcp", {})
         self.docker_client = DockerMCPClient(
             catalog=docker_config.get("catalog", "docker-mcp"),
             command_timeout=docker_config.get("command_timeout", 30),
+            max_output_bytes=docker_config.get("max_output_bytes", 0),
+            output_preview_bytes=docker_config.get("output_preview_bytes", 65536),
+            spill_dir=docker_config.get("spill_dir"),
+            spill_max_files=docker_config.get("spill_max_files", 20),
+            spill_max_age=docker_config.get("spill_max_age", 3600),
         )
 
         proxy_config = self.config.get("orchestrator", {}).get("proxy", {})
+        performance_config = self.config.get("orchestrator", {}).get("performance", {})
         self.connection_pool = MCPConnectionPool(
             docker_client=self.docker_client,
             connection_timeout=proxy_config.get("connection_timeout", 30),
             reconnect_attempts=proxy_config.get("reconnect_attempts", 3),
             reconnect_delay=proxy_config.get("reconnect_delay", 1),
             status_check_ttl=proxy_config.get("status_check_ttl", 30),
+            use_sessions=proxy_config.get("use_sessions", True),
+            session_command=proxy_config.get("session_command"),
+            session_retry_interval=proxy_config.get("session_retry_interval", 60),
+            session_open_wait=proxy_config.get("session_open_wait", 5),
+            call_timeout=performance_config.get("tool_call_timeout", 30),
         )
 
-        self.proxy = ToolProxy(self.connection_pool)
-        self.prompt_manager = PromptManager(self.cache, self.docker_client)
+        self.scheduler = ToolCallScheduler(
+            max_concurrent=performance_config.get("max_concurrent_tools", 5),
+            max_per_server=proxy_config.get("connection_pool_size", 10),
+            max_queue_depth=performance_config.get("max_queue_depth", 100),
+            call_timeout=performance_config.get("tool_call_timeout", 30),
+        )
+        result_cache_config = self.config.get("orchestrator", {}).get("result_cache", {})
+        result_cache = None
+        if result_cache_config.get("enabled", False):
+            result_cache = ResultCache(
+                ttl=result_cache_config.get("ttl", 60),
+                max_entries=result_cache_config.get("max_entries", 1024),
+                max_bytes=result_cache_config.get("max_bytes", 16 * 1024 * 1024),
+                patterns=result_cache_config.get("patterns"),
+                read_only_hint=result_cache_config.get("read_only_hint", True),
+                namespace_separator=proxy_config.get("namespace_separator", "__"),
+            )
+
+        dedup_config = self.config.get("orchestrator", {}).get("dedup", {})
+        dedup = None
+        if dedup_config.get("enabled", False):
+            dedup = ToolMatcher(
+                patterns=dedup_config.get("patterns"),
+                read_only_hint=dedup_config.get("read_only_hint", True),
+                namespace_separator=proxy_config.get("namespace_separator", "__"),
+            )
+
+        self.proxy = ToolProxy(
+            self.connection_pool,
+            self.scheduler,
+            expose_tools=proxy_config.get("expose_tools", False),
+            namespace_separator=proxy_config.get("namespace_separator", "__"),
+            cache=self.cache,
+            drain_timeout=proxy_config.get("drain_timeout", 10),
+            result_cache=result_cache,
+            dedup=dedup,
+        )
+        events_config = self.config.get("orchestrator", {}).get("events", {})
+        self.event_watcher: Optional[ServerEventWatcher] = None
+        if events_config.get("enabled", False):
+            self.event_watcher = ServerEventWatcher(
+                DockerEventSource(events_config.get("label", "docker-mcp-name")),
+                reconnect_delay=events_config.get("reconnect_delay", 5),
+                stable_after=events_config.get("stable_after", 2),
+            )
+            self.event_watcher.subscribe(
+                self.connection_pool.handle_server_event,
+                self.connection_pool.handle_event_stream,
+            )
+            self.event_watcher.subscribe(self.proxy.handle_server_event)
+
+        self.prompt_manager = PromptManager(
+            self.cache,
+            self.docker_client,
+            max_parallel=performance_config.get("max_parallel_discovery", 4),
+        )
 
         # Initialize MCP Server
         self.server = Server("docker-mcp-orchestrator")
@@ -94,6 +153,12 @@ class OrchestratorServer:
         # Register tools
         self._register_tools()
 
+        # The published list is rebuilt only when the proxy's active tool set changes
+        self._tool_list: List[Tool] = list(self._static_tools)
+        self._tool_list_source = self.proxy.version
+        self.tools_version = 0
+        self._notified_tools_version = 0
+
         # Register handlers
         self._register_handlers()
 
@@ -109,10 +174,61 @@ class OrchestratorServer:
             logger.error(f"Error loading config: {e}")
             return {}
 
+    def _dynamic_tools(self) -> List[Tool]:
+        """
+        Get tools published in addition to the orchestrator's own.
+
+        Returns:
+            Namespaced tools of active servers (empty unless proxy.expose_tools is on)
+        """
+        return self.proxy.get_exposed_tools()
+
+    def _current_tools(self) -> List[Tool]:
+        """
+        Get the published tool list, rebuilding it if the active set changed.
+
+        Bumps tools_version when the rebuilt list differs from the previous one.
+
+        Returns:
+            List of tools
+        """
+        if self._tool_list_source != self.proxy.version:
+            self._tool_list_source = self.proxy.version
+            tools = list(self._static_tools) + self._dynamic_tools()
+            if tools != self._tool_list:
+                self._tool_list = tools
+                self.tools_version += 1
+                logger.info(f"Tool list changed (version {self.tools_version}, {len(tools)} tools)")
+        return self._tool_list
+
+    async def _notify_tools_changed(self):
+        """Send tools/list_changed to the client if the tool list changed."""
+        self._current_tools()
+        if self._notified_tools_version == self.tools_version:
+            return
+        try:
+            await self.server.request_context.session.send_tool_list_changed()
+            self._notified_tools_version = self.tools_version
+        except LookupError:
+            # Not inside a request; notify on the next call
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to send tools/list_changed: {e}")
+
     def _register_tools(self):
-        """Register all tools with MCP server."""
-        # Tools will be registered via handlers
-        pass
+        """Load tool modules and bind their handlers to dependencies."""
+        # Tool definitions are built once, at module import
+        registrations = load_tools()
+        self._static_tools: Tuple[Tool, ...] = tuple(r.tool for r in registrations)
+        self._handlers = bind_handlers(
+            registrations,
+            {
+                "docker_client": self.docker_client,
+                "cache": self.cache,
+                "proxy": self.proxy,
+                "prompt_manager": self.prompt_manager,
+            },
+        )
 
     def _register_handlers(self):
         """Register tool handlers."""
@@ -120,153 +236,100 @@ class OrchestratorServer:
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List all available tools."""
-            return [
-                # Server management
-                list_installed_tool(),
-                list_catalog_tool(),
-                start_tool(),
-                stop_tool(),
-                get_active_tool(),
-                # Information
-                get_tools_tool(),
-                get_info_tool(),
-                # Configuration
-                config_set_tool(),
-                config_get_tool(),
-                secret_set_tool(),
-                secret_list_tool(),
-                secret_remove_tool(),
-                # Proxy
-                call_tool_tool(),
-                list_active_tools_tool(),
-            ]
+            return self._current_tools()
 
         @self.server.call_tool()
-        async def handle_tool_call(name: str, arguments: Dict[str, Any]) -> list[dict[str, Any]]:
+        async def handle_tool_call(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
             """Handle tool calls."""
             try:
-                # Route to appropriate handler
-                if name == "list_installed_servers":
-                    result = await handle_list_installed(
-                        arguments, self.docker_client, self.cache
-                    )
-                elif name == "list_catalog_servers":
-                    result = await handle_list_catalog(
-                        arguments, self.docker_client, self.cache
-                    )
-                elif name == "start_servers":
-                    result = await handle_start(
-                        arguments,
-                        self.docker_client,
-                        self.cache,
-                        self.proxy,
-                        self.prompt_manager,
+                # Namespaced pass-through tools go straight to their server
+                route = self.proxy.resolve_exposed_tool(name)
+                if route:
+                    server, tool_name = route
+                    result, error = await self.proxy.call_server_tool(
+                        server, tool_name, arguments
                     )
-                elif name == "stop_servers":
-                    result = await handle_stop(arguments, self.docker_client, self.proxy)
-                elif name == "get_active_servers":
-                    result = await handle_get_active(
-                        arguments, self.docker_client, self.proxy
-                    )
-                elif name == "get_server_tools":
-                    result = await handle_get_tools(
-                        arguments, self.docker_client, self.cache
-                    )
-                elif name == "get_server_info":
-                    result = await handle_get_info(
-                        arguments, self.docker_client, self.cache
-                    )
-                elif name == "config_set":
-                    result = await handle_config_set(arguments, self.docker_client)
-                elif name == "config_get":
-                    result = await handle_config_get(arguments, self.docker_client)
-                elif name == "secret_set":
-                    result = await handle_secret_set(arguments, self.docker_client)
-                elif name == "secret_list":
-                    result = await handle_secret_list(arguments, self.docker_client)
-                elif name == "secret_remove":
-                    result = await handle_secret_remove(arguments, self.docker_client)
-                elif name == "call_tool":
-                    result = await handle_call_tool(arguments, self.proxy)
-                elif name == "list_active_tools":
-                    result = await handle_list_active_tools(arguments, self.proxy)
+                    if error:
+                        raise DockerMCPError(error, {"server": server, "tool": tool_name})
                 else:
-                    return [
-                        {
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": f"Unknown tool: {name}",
-                                }
-                            ],
-                            "isError": True,
-                        }
-                    ]
-
-                # Format result for MCP
-                import json
-                from mcp.types import TextContent
-
-                # MCP expects list of CallToolResult with content array
-                if isinstance(result, list):
-                    # Convert list items to JSON strings
-                    formatted = []
-                    for item in result:
-                        text = json.dumps(item, indent=2) if isinstance(item, (dict, list)) else str(item)
-                        formatted.append(
-                            {
-                                "content": [{"type": "text", "text": text}],
-                                "isError": False,
-                            }
-                        )
-                    return formatted
-                elif isinstance(result, dict):
-                    # Convert dict to JSON string
-                    text = json.dumps(result, indent=2)
-                    return [
-                        {
-                            "content": [{"type": "text", "text": text}],
-                            "isError": False,
-                        }
-                    ]
-                else:
-                    return [
-                        {
-                            "content": [{"type": "text", "text": str(result)}],
-                            "isError": False,
-                        }
-                    ]
+                    handler = self._handlers.get(name)
+                    if handler is None:
+                        raise DockerMCPError(f"Unknown tool: {name}")
+                    result = await handler(arguments)
+
+                await self._notify_tools_changed()
+                return format_result(result, self.output_format, self.output_single_block)
 
             except DockerMCPError as e:
-                # Custom exceptions with details
+                # Custom exceptions with details; raising marks the MCP result as isError
                 error_msg = str(e)
                 if e.details:
-                    error_msg += f"\nDetails: {json.dumps(e.details, indent=2)}"
+                    error_msg += f"\nDetails: {dumps(e.details, pretty=True)}"
                 logger.error(f"Error handling tool {name}: {error_msg}", exc_info=True)
-                return [
-                    {
-                        "content": [{"type": "text", "text": error_msg}],
-                        "isError": True,
-                    }
-                ]
+                raise DockerMCPError(error_msg) from e
             except Exception as e:
                 logger.error(f"Error handling tool {name}: {e}", exc_info=True)
-                return [
-                    {
-                        "content": [{"type": "text", "text": f"Error: {str(e)}"}],
-                        "isError": True,
-                    }
-                ]
+                raise DockerMCPError(f"Error: {str(e)}") from e
+
+    async def _prewarm_cache(self):
+        """Load the default catalog and tools of active servers into the cache."""
+        catalog = self.docker_client.catalog
+        try:
+            await self.cache.get_servers(
+                catalog, lambda: self.docker_client.get_catalog_servers(catalog)
+            )
+            active_servers = await self.docker_client.get_active_servers()
+            await self.cache.get_tools_for_servers(
+                active_servers, self.docker_client.get_tools_index
+            )
+        except Exception as e:
+            logger.warning(f"Failed to prewarm cache: {e}")
+
+    async def _dump_metrics_loop(self):
+        """Periodically write metrics in Prometheus text format."""
+        while True:
+            await asyncio.sleep(self.prometheus_interval)
+            await metrics.write_prometheus(self.prometheus_file)
 
     async def run(self):
         """Run the server."""
         from mcp.server.stdio import stdio_server
 
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-            )
+        metrics_task = None
+        if self.prometheus_file:
+            metrics_task = asyncio.create_task(self._dump_metrics_loop())
+
+        if self.event_watcher:
+            self.event_watcher.start()
+
+        prewarm_task = None
+        if self.cache_refresh_interval > 0:
+            prewarm_task = asyncio.create_task(self._prewarm_cache())
+            self.cache.start_refresh_loop(self.cache_refresh_interval)
+
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(
+                        NotificationOptions(tools_changed=True)
+                    ),
+                )
+        finally:
+            if metrics_task:
+                metrics_task.cancel()
+                await asyncio.gather(metrics_task, return_exceptions=True)
+                await metrics.write_prometheus(self.prometheus_file)
+            if self.event_watcher:
+                await self.event_watcher.stop()
+            if prewarm_task:
+                prewarm_task.cancel()
+                await asyncio.gather(prewarm_task, return_exceptions=True)
+            await self.cache.stop_refresh_loop()
+            await self.cache.flush()
+            await self.connection_pool.close_all_sessions()
+            self.docker_client.cleanup_spill_files()
 
 
 async def main():
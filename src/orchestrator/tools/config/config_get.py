@@ -5,6 +5,7 @@ from typing import Any
 from mcp.types import Tool
 
 from ...docker_client import DockerMCPClient
+from ..registry import register
 
 
 def get_tool() -> Tool:
@@ -51,3 +52,6 @@ async def handle_tool(
         }
     else:
         return {"config": config}
+
+
+register(get_tool, handle_tool, "docker_client")
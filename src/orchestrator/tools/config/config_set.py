@@ -7,6 +7,7 @@ from mcp.types import Tool
 
 from ...docker_client import DockerMCPClient
 from ...exceptions import CommandError
+from ..registry import register
 
 logger = logging.getLogger(__name__)
 
@@ -74,3 +75,6 @@ async def handle_tool(
             "status": "error",
             "error": f"Unexpected error: {str(e)}",
         }
+
+
+register(get_tool, handle_tool, "docker_client")
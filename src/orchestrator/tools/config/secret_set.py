@@ -5,6 +5,7 @@ from typing import Any
 from mcp.types import Tool
 
 from ...docker_client import DockerMCPClient
+from ..registry import register
 
 
 def get_tool() -> Tool:
@@ -61,3 +62,6 @@ async def handle_tool(
             "status": "error",
             "error": "Failed to set secret",
         }
+
+
+register(get_tool, handle_tool, "docker_client")
@@ -6,6 +6,7 @@ from mcp.types import Tool
 
 from ...cache import MetadataCache
 from ...docker_client import DockerMCPClient
+from ..registry import register
 
 
 def get_tool() -> Tool:
@@ -65,3 +66,6 @@ async def handle_tool(
         "has_prompt": metadata.prompt is not None,
         "config_requirements": metadata.config_requirements,
     }
+
+
+register(get_tool, handle_tool, "docker_client", "cache")
@@ -0,0 +1,64 @@
+"""Get orchestrator stats tool."""
+
+from typing import Any
+
+from mcp.types import Tool
+
+from ...cache import MetadataCache
+from ...metrics import metrics
+from ...proxy import ToolProxy
+from ..registry import register
+
+
+def get_tool() -> Tool:
+    """Get get_orchestrator_stats tool definition."""
+    return Tool(
+        name="get_orchestrator_stats",
+        description=(
+            "Get Orchestrator performance metrics: cache hits/misses/evictions and fetch "
+            "latency, docker mcp subprocess counts and durations, proxied tool call latency, "
+            "result cache, call deduplication and scheduler queue stats"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "format": {
+                    "type": "string",
+                    "enum": ["json", "prometheus"],
+                    "description": "Output format (default: json)",
+                    "default": "json",
+                }
+            },
+        },
+    )
+
+
+async def handle_tool(
+    arguments: dict[str, Any],
+    cache: MetadataCache,
+    proxy: ToolProxy,
+) -> dict[str, Any] | str:
+    """
+    Handle get_orchestrator_stats tool call.
+
+    Args:
+        arguments: Tool arguments
+        cache: Metadata cache
+        proxy: Tool proxy
+
+    Returns:
+        Dictionary with metrics, or Prometheus text
+    """
+    if arguments.get("format") == "prometheus":
+        return metrics.to_prometheus()
+
+    return {
+        "metrics": metrics.snapshot(),
+        "cache": cache.get_stats(),
+        "scheduler": proxy.get_scheduler_stats(),
+        "result_cache": proxy.get_result_cache_stats(),
+        "dedup": proxy.get_dedup_stats(),
+    }
+
+
+register(get_tool, handle_tool, "cache", "proxy")
@@ -6,6 +6,8 @@ from mcp.types import Tool
 
 from ...cache import MetadataCache
 from ...docker_client import DockerMCPClient
+from ...utils import get_fields, paginate, pagination_schema, project, wants_page
+from ..registry import register
 
 
 def get_tool() -> Tool:
@@ -19,7 +21,8 @@ def get_tool() -> Tool:
                 "server": {
                     "type": "string",
                     "description": "Server name",
-                }
+                },
+                **pagination_schema(),
             },
             "required": ["server"],
         },
@@ -46,20 +49,33 @@ async def handle_tool(
     if not server:
         return {"error": "Server name is required"}
 
-    async def fetch_tools():
-        return await docker_client.get_server_tools(server)
-
-    tools = await cache.get_server_tools(server, fetch_tools)
+    tools_by_server = await cache.get_tools_for_servers(
+        [server], docker_client.get_tools_index
+    )
+    tools = tools_by_server[server]
+    page, next_cursor = paginate(tools, arguments.get("limit"), arguments.get("cursor"))
+    fields = get_fields(arguments)
 
-    return {
+    result = {
         "server": server,
         "tools_count": len(tools),
         "tools": [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.inputSchema,
-            }
-            for tool in tools
+            project(
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "inputSchema": tool.inputSchema,
+                },
+                fields,
+            )
+            for tool in page
         ],
     }
+
+    if wants_page(arguments):
+        result["next_cursor"] = next_cursor
+
+    return result
+
+
+register(get_tool, handle_tool, "docker_client", "cache")
@@ -4,8 +4,10 @@ from typing import Any
 
 from mcp.types import Tool
 
+from ...exceptions import AmbiguousToolError, ToolNotFoundError
 from ...models import CallToolResult
 from ...proxy import ToolProxy
+from ..registry import register
 
 
 def get_tool() -> Tool:
@@ -18,12 +20,22 @@ def get_tool() -> Tool:
             "properties": {
                 "tool_name": {
                     "type": "string",
-                    "description": "Name of the tool to call",
+                    "description": (
+                        "Name of the tool to call. "
+                        "Use server__tool if several active servers provide the same name"
+                    ),
                 },
                 "arguments": {
                     "type": "object",
                     "description": "Tool arguments (key-value pairs)",
                 },
+                "bypass_cache": {
+                    "type": "boolean",
+                    "description": (
+                        "Call the server even if a cached result exists (default: false)"
+                    ),
+                    "default": False,
+                },
             },
             "required": ["tool_name", "arguments"],
         },
@@ -55,18 +67,28 @@ async def handle_tool(
             "server": None,
         }
 
-    # Get server for tool
-    server = proxy.get_server_for_tool(tool_name)
-    if not server:
+    # Resolve server for tool (plain or qualified server__tool name)
+    try:
+        server, resolved_name = proxy.resolve_tool(tool_name)
+    except ToolNotFoundError:
         return {
             "status": "error",
             "error": f"Tool {tool_name} not found in any active server. Make sure the server is started.",
             "result": None,
             "server": None,
         }
+    except AmbiguousToolError as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "result": None,
+            "server": None,
+        }
 
     # Call tool through proxy
-    result, error = await proxy.call_tool(tool_name, tool_arguments)
+    result, error = await proxy.call_server_tool(
+        server, resolved_name, tool_arguments, bypass_cache=arguments.get("bypass_cache", False)
+    )
 
     if error:
         return {
@@ -82,3 +104,6 @@ async def handle_tool(
             "error": None,
             "server": server,
         }
+
+
+register(get_tool, handle_tool, "proxy")
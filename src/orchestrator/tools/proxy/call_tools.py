@@ -0,0 +1,180 @@
+"""Call multiple tools through proxy in one request."""
+
+import asyncio
+from typing import Any, Optional
+
+from mcp.types import Tool
+
+from ...exceptions import AmbiguousToolError, ToolNotFoundError
+from ...proxy import ToolProxy
+from ..registry import register
+
+
+def get_tool() -> Tool:
+    """Get call_tools tool definition."""
+    return Tool(
+        name="call_tools",
+        description=(
+            "Call several tools from active MCP servers concurrently in one request. "
+            "Results are returned in the order of the calls, each with its own status."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool_name": {
+                                "type": "string",
+                                "description": (
+                                    "Name of the tool to call (server__tool if ambiguous)"
+                                ),
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Tool arguments (key-value pairs)",
+                            },
+                        },
+                        "required": ["tool_name"],
+                    },
+                },
+                "fail_fast": {
+                    "type": "boolean",
+                    "description": (
+                        "Cancel remaining calls after the first failure (default: false)"
+                    ),
+                    "default": False,
+                },
+                "max_parallel": {
+                    "type": "integer",
+                    "description": "Max calls from this batch running at once (default: all)",
+                    "minimum": 1,
+                },
+                "bypass_cache": {
+                    "type": "boolean",
+                    "description": "Call the servers even if cached results exist (default: false)",
+                    "default": False,
+                },
+            },
+            "required": ["calls"],
+        },
+    )
+
+
+async def handle_tool(
+    arguments: dict[str, Any],
+    proxy: ToolProxy,
+) -> dict[str, Any]:
+    """
+    Handle call_tools tool call.
+
+    Args:
+        arguments: Tool arguments
+        proxy: Tool proxy
+
+    Returns:
+        Dictionary with per-call results in the original order
+    """
+    calls = arguments.get("calls") or []
+    fail_fast = bool(arguments.get("fail_fast", False))
+    max_parallel = arguments.get("max_parallel") or len(calls)
+    bypass_cache = bool(arguments.get("bypass_cache", False))
+
+    if not calls:
+        return {"status": "error", "error": "calls is required", "results": []}
+
+    results: list[Optional[dict[str, Any]]] = [None] * len(calls)
+    semaphore = asyncio.Semaphore(max(1, int(max_parallel)))
+    failed = asyncio.Event()
+
+    async def run_call(index: int, call: dict[str, Any]):
+        tool_name = call.get("tool_name") if isinstance(call, dict) else None
+        entry = {"index": index, "tool_name": tool_name, "server": None}
+
+        if not tool_name:
+            results[index] = {
+                **entry,
+                "status": "error",
+                "result": None,
+                "error": "tool_name is required",
+            }
+            failed.set()
+            return
+
+        try:
+            server, resolved_name = proxy.resolve_tool(tool_name)
+        except ToolNotFoundError:
+            results[index] = {
+                **entry,
+                "status": "error",
+                "result": None,
+                "error": (
+                    f"Tool {tool_name} not found in any active server. "
+                    "Make sure the server is started."
+                ),
+            }
+            failed.set()
+            return
+        except AmbiguousToolError as e:
+            results[index] = {**entry, "status": "error", "result": None, "error": str(e)}
+            failed.set()
+            return
+        entry["server"] = server
+
+        async with semaphore:
+            if fail_fast and failed.is_set():
+                results[index] = {**entry, "status": "cancelled", "result": None, "error": None}
+                return
+            result, error = await proxy.call_server_tool(
+                server, resolved_name, call.get("arguments") or {}, bypass_cache=bypass_cache
+            )
+
+        if error:
+            results[index] = {**entry, "status": "error", "result": None, "error": error}
+            failed.set()
+        else:
+            results[index] = {**entry, "status": "success", "result": result, "error": None}
+
+    tasks = [asyncio.create_task(run_call(i, call)) for i, call in enumerate(calls)]
+
+    if fail_fast:
+        pending = set(tasks)
+        while pending and not failed.is_set():
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    for index, call in enumerate(calls):
+        if results[index] is None:
+            results[index] = {
+                "index": index,
+                "tool_name": call.get("tool_name") if isinstance(call, dict) else None,
+                "server": None,
+                "status": "cancelled",
+                "result": None,
+                "error": None,
+            }
+
+    succeeded = sum(1 for r in results if r["status"] == "success")
+    if succeeded == len(calls):
+        status = "success"
+    elif succeeded:
+        status = "partial"
+    else:
+        status = "error"
+
+    return {
+        "status": status,
+        "total": len(calls),
+        "succeeded": succeeded,
+        "failed": sum(1 for r in results if r["status"] == "error"),
+        "cancelled": sum(1 for r in results if r["status"] == "cancelled"),
+        "results": results,
+    }
+
+
+register(get_tool, handle_tool, "proxy")
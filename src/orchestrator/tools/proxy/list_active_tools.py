@@ -5,6 +5,8 @@ from typing import Any
 from mcp.types import Tool
 
 from ...proxy import ToolProxy
+from ...utils import get_fields, paginate, pagination_schema, project, wants_page
+from ..registry import register
 
 
 def get_tool() -> Tool:
@@ -14,7 +16,9 @@ def get_tool() -> Tool:
         description="Get list of all available tools from all active MCP servers",
         inputSchema={
             "type": "object",
-            "properties": {},
+            "properties": {
+                **pagination_schema(),
+            },
         },
     )
 
@@ -33,32 +37,51 @@ async def handle_tool(
     Returns:
         Dictionary with active tools grouped by server
     """
-    all_tools = proxy.list_active_tools()
     servers = proxy.list_servers()
 
-    # Group tools by server
-    tools_by_server = {}
-    for server in servers:
-        server_tools = proxy.get_server_tools(server)
-        tools_by_server[server] = [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.inputSchema,
-            }
-            for tool in server_tools
-        ]
-
-    return {
-        "total_tools": len(all_tools),
+    # Flatten sorted by qualified name, so pages stay stable across registrations
+    entries = sorted(
+        ((server, tool) for server in servers for tool in proxy.get_server_tools(server)),
+        key=lambda entry: proxy.exposed_name(entry[0], entry[1].name),
+    )
+    page, next_cursor = paginate(entries, arguments.get("limit"), arguments.get("cursor"))
+    fields = get_fields(arguments)
+
+    # Group tools by server (legacy output lists every server, even empty ones)
+    tools_by_server = {} if wants_page(arguments) else {server: [] for server in servers}
+    for server, tool in page:
+        tools_by_server.setdefault(server, []).append(
+            project(
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "inputSchema": tool.inputSchema,
+                },
+                fields,
+            )
+        )
+
+    result = {
+        "total_tools": len(entries),
         "servers": servers,
         "tools_by_server": tools_by_server,
         "all_tools": [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "server": proxy.get_server_for_tool(tool.name),
-            }
-            for tool in all_tools
+            project(
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "server": server,
+                },
+                fields,
+            )
+            for server, tool in page
         ],
     }
+
+    if wants_page(arguments):
+        result["next_cursor"] = next_cursor
+
+    return result
+
+
+register(get_tool, handle_tool, "proxy")
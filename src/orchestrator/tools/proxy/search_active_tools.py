@@ -0,0 +1,79 @@
+"""Search active tools tool."""
+
+from typing import Any
+
+from mcp.types import Tool
+
+from ...proxy import ToolProxy
+from ..registry import register
+
+MAX_LIMIT = 50
+
+
+def get_tool() -> Tool:
+    """Get search_active_tools tool definition."""
+    return Tool(
+        name="search_active_tools",
+        description=(
+            "Search tools of all active MCP servers by name and description. Returns only "
+            "the best matches with their input schemas, use it instead of list_active_tools "
+            "when many servers are active."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g. 'create issue')",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": f"Max results to return (default: 10, max: {MAX_LIMIT})",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": MAX_LIMIT,
+                },
+            },
+            "required": ["query"],
+        },
+    )
+
+
+async def handle_tool(
+    arguments: dict[str, Any],
+    proxy: ToolProxy,
+) -> dict[str, Any]:
+    """
+    Handle search_active_tools tool call.
+
+    Args:
+        arguments: Tool arguments
+        proxy: Tool proxy
+
+    Returns:
+        Dictionary with ranked matching tools
+    """
+    query = arguments.get("query")
+    if not query:
+        return {"error": "Query is required"}
+
+    limit = max(1, min(int(arguments.get("limit", 10)), MAX_LIMIT))
+    matches = proxy.search_tools(query, limit=limit)
+
+    return {
+        "query": query,
+        "count": len(matches),
+        "tools": [
+            {
+                "name": tool.name,
+                "server": server,
+                "description": tool.description,
+                "inputSchema": tool.inputSchema,
+                "score": round(score, 3),
+            }
+            for server, tool, score in matches
+        ],
+    }
+
+
+register(get_tool, handle_tool, "proxy")
@@ -0,0 +1,119 @@
+"""Registry of orchestrator tools and their handlers."""
+
+import importlib
+import logging
+import pkgutil
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from mcp.types import Tool
+
+logger = logging.getLogger(__name__)
+
+# Tool packages in the order their tools are listed; other packages follow
+TOOL_PACKAGES = ("servers", "info", "config", "proxy")
+
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class ToolRegistration:
+    """A tool definition, its handler and the dependencies the handler needs."""
+
+    def __init__(self, tool: Tool, handler: Callable[..., Awaitable[Any]], deps: Tuple[str, ...]):
+        """
+        Initialize registration.
+
+        Args:
+            tool: Tool definition
+            handler: Async handler taking arguments plus the dependencies as keywords
+            deps: Names of dependencies passed to the handler
+        """
+        self.tool = tool
+        self.handler = handler
+        self.deps = deps
+
+    @property
+    def name(self) -> str:
+        """Tool name."""
+        return self.tool.name
+
+
+_registry: Dict[str, ToolRegistration] = {}
+
+
+def register(get_tool: Callable[[], Tool], handle_tool: Callable[..., Awaitable[Any]], *deps: str):
+    """
+    Register a tool module's definition and handler.
+
+    Called at the bottom of each tool module, e.g.
+    ``register(get_tool, handle_tool, "docker_client", "cache")``.
+
+    Args:
+        get_tool: Function returning the tool definition
+        handle_tool: Async handler taking arguments plus the named dependencies
+        *deps: Dependency names, matching the handler's parameter names
+
+    Raises:
+        ValueError: If a tool with the same name is already registered
+    """
+    tool = get_tool()
+    if tool.name in _registry:
+        raise ValueError(f"Tool {tool.name} is already registered")
+    _registry[tool.name] = ToolRegistration(tool, handle_tool, deps)
+
+
+def _tool_packages() -> List[str]:
+    """Get tool package names, known packages first."""
+    from .. import tools
+
+    found = [info.name for info in pkgutil.iter_modules(tools.__path__) if info.ispkg]
+    known = [p for p in TOOL_PACKAGES if p in found]
+    return known + sorted(p for p in found if p not in TOOL_PACKAGES)
+
+
+def load_tools() -> List[ToolRegistration]:
+    """
+    Import every tool module under tools/ so it registers itself.
+
+    Returns:
+        Registrations in listing order
+    """
+    order: List[str] = []
+    for package in _tool_packages():
+        module = importlib.import_module(f"{__package__}.{package}")
+        for info in pkgutil.iter_modules(module.__path__):
+            importlib.import_module(f"{module.__name__}.{info.name}")
+            order.append(f"{module.__name__}.{info.name}")
+
+    rank = {name: i for i, name in enumerate(order)}
+    return sorted(
+        _registry.values(), key=lambda r: rank.get(r.handler.__module__, len(rank))
+    )
+
+
+def bind_handlers(
+    registrations: List[ToolRegistration], deps: Dict[str, Any]
+) -> Dict[str, ToolHandler]:
+    """
+    Pre-bind handlers to their dependencies for one-lookup dispatch.
+
+    Args:
+        registrations: Tool registrations
+        deps: Available dependencies by name
+
+    Returns:
+        Dictionary of tool name to handler taking only arguments
+
+    Raises:
+        ValueError: If a handler needs a dependency that isn't available
+    """
+    handlers: Dict[str, ToolHandler] = {}
+    for registration in registrations:
+        missing = [dep for dep in registration.deps if dep not in deps]
+        if missing:
+            raise ValueError(f"Tool {registration.name} needs unknown dependencies: {missing}")
+        handlers[registration.name] = partial(
+            registration.handler, **{dep: deps[dep] for dep in registration.deps}
+        )
+    logger.debug(f"Bound {len(handlers)} tool handlers")
+    return handlers
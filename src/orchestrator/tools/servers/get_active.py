@@ -6,6 +6,8 @@ from mcp.types import Tool
 
 from ...docker_client import DockerMCPClient
 from ...proxy import ToolProxy
+from ...utils import get_fields, paginate, pagination_schema, project, wants_page
+from ..registry import register
 
 
 def get_tool() -> Tool:
@@ -15,7 +17,9 @@ def get_tool() -> Tool:
         description="Get list of currently active (running) MCP servers",
         inputSchema={
             "type": "object",
-            "properties": {},
+            "properties": {
+                **pagination_schema(),
+            },
         },
     )
 
@@ -42,23 +46,35 @@ async def handle_tool(
     # Also get servers registered in proxy
     proxy_servers = proxy.list_servers()
 
-    # Combine and deduplicate
-    all_active = list(set(active_servers + proxy_servers))
+    # Combine and deduplicate (sorted for stable pagination)
+    all_active = sorted(set(active_servers + proxy_servers))
+    page, next_cursor = paginate(all_active, arguments.get("limit"), arguments.get("cursor"))
+    fields = get_fields(arguments)
 
     # Get tools for each server
     result = {
-        "servers": all_active,
+        "servers": page,
         "servers_detail": [],
     }
 
-    for server in all_active:
+    for server in page:
         tools = proxy.get_server_tools(server)
         result["servers_detail"].append(
-            {
-                "name": server,
-                "tools_count": len(tools),
-                "tools": [tool.name for tool in tools],
-            }
+            project(
+                {
+                    "name": server,
+                    "tools_count": len(tools),
+                    "tools": [tool.name for tool in tools],
+                },
+                fields,
+            )
         )
 
+    if wants_page(arguments):
+        result["total"] = len(all_active)
+        result["next_cursor"] = next_cursor
+
     return result
+
+
+register(get_tool, handle_tool, "docker_client", "proxy")
@@ -6,6 +6,8 @@ from mcp.types import Tool
 
 from ...cache import MetadataCache
 from ...docker_client import DockerMCPClient
+from ...utils import get_fields, paginate, pagination_schema, project, wants_page
+from ..registry import register
 
 
 def get_tool() -> Tool:
@@ -20,7 +22,8 @@ def get_tool() -> Tool:
                     "type": "string",
                     "description": "Catalog name (default: docker-mcp)",
                     "default": "docker-mcp",
-                }
+                },
+                **pagination_schema(),
             },
         },
     )
@@ -30,7 +33,7 @@ async def handle_tool(
     arguments: dict[str, Any],
     docker_client: DockerMCPClient,
     cache: MetadataCache,
-) -> list[dict[str, Any]]:
+) -> list[dict[str, Any]] | dict[str, Any]:
     """
     Handle list_installed_servers tool call.
 
@@ -40,7 +43,8 @@ async def handle_tool(
         cache: Metadata cache
 
     Returns:
-        List of installed servers with metadata
+        List of installed servers with metadata, or a page of them with
+        total and next_cursor if limit or cursor is given
     """
     catalog = arguments.get("catalog", "docker-mcp")
 
@@ -48,18 +52,24 @@ async def handle_tool(
         return await docker_client.get_catalog_servers(catalog)
 
     servers = await cache.get_servers(catalog, fetch_servers)
+    page, next_cursor = paginate(servers, arguments.get("limit"), arguments.get("cursor"))
+    fields = get_fields(arguments)
 
     result = []
-    for server in servers:
-        result.append(
-            {
-                "name": server.name,
-                "description": server.description,
-                "version": server.version,
-                "keywords": server.keywords,
-                "tools_count": server.tools_count,
-                "tools_preview": server.tools_preview[:10],  # Limit preview
-            }
-        )
+    for server in page:
+        item = {
+            "name": server.name,
+            "description": server.description,
+            "version": server.version,
+            "keywords": server.keywords,
+            "tools_count": server.tools_count,
+            "tools_preview": server.tools_preview[:10],  # Limit preview
+        }
+        result.append(project(item, fields))
 
+    if wants_page(arguments):
+        return {"servers": result, "total": len(servers), "next_cursor": next_cursor}
     return result
+
+
+register(get_tool, handle_tool, "docker_client", "cache")
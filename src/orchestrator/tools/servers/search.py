@@ -0,0 +1,106 @@
+"""Search catalog servers tool."""
+
+from typing import Any
+
+from mcp.types import Tool
+
+from ...cache import MetadataCache
+from ...docker_client import DockerMCPClient
+from ...utils import paginate, pagination_schema
+from ..registry import register
+
+MAX_LIMIT = 50
+
+
+def get_tool() -> Tool:
+    """Get search_servers tool definition."""
+    return Tool(
+        name="search_servers",
+        description=(
+            "Search servers in Docker MCP Catalog by name, description, keywords and tool "
+            "names. Returns the best matches ranked by relevance instead of the whole catalog."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g. 'github issues', 'postgres database')",
+                },
+                "catalog": {
+                    "type": "string",
+                    "description": "Catalog name (default: docker-mcp)",
+                    "default": "docker-mcp",
+                },
+                "keywords": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Only return servers tagged with all of these keywords",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": f"Max results to return (default: 10, max: {MAX_LIMIT})",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": MAX_LIMIT,
+                },
+                "cursor": pagination_schema()["cursor"],
+            },
+            "required": ["query"],
+        },
+    )
+
+
+async def handle_tool(
+    arguments: dict[str, Any],
+    docker_client: DockerMCPClient,
+    cache: MetadataCache,
+) -> dict[str, Any]:
+    """
+    Handle search_servers tool call.
+
+    Args:
+        arguments: Tool arguments
+        docker_client: Docker MCP Client
+        cache: Metadata cache
+
+    Returns:
+        Dictionary with ranked matching servers
+    """
+    query = arguments.get("query")
+    if not query:
+        return {"error": "Query is required"}
+
+    catalog = arguments.get("catalog", "docker-mcp")
+    limit = arguments.get("limit", 10)
+    if isinstance(limit, int) and limit > MAX_LIMIT:
+        limit = MAX_LIMIT
+
+    async def fetch_servers():
+        return await docker_client.get_catalog_servers(catalog)
+
+    servers = await cache.get_servers(catalog, fetch_servers)
+    index = docker_client.index_catalog(catalog, servers)
+
+    matches = index.search(query, keywords=arguments.get("keywords"))
+    page, next_cursor = paginate(matches, limit, arguments.get("cursor"))
+
+    return {
+        "query": query,
+        "catalog": catalog,
+        "total": len(matches),
+        "next_cursor": next_cursor,
+        "results": [
+            {
+                "name": server.name,
+                "description": server.description,
+                "keywords": server.keywords,
+                "tools_preview": server.tools_preview[:10],
+                "score": round(score, 3),
+            }
+            for server, score in page
+        ],
+    }
+
+
+register(get_tool, handle_tool, "docker_client", "cache")
@@ -1,5 +1,6 @@
 """Start servers tool."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -7,10 +8,11 @@ from mcp.types import Tool
 
 from ...cache import MetadataCache
 from ...docker_client import DockerMCPClient
-from ...exceptions import CommandError, ServerNotFoundError
+from ...exceptions import CommandError
 from ...models import StartServersResult
 from ...prompt_manager import PromptManager
 from ...proxy import ToolProxy
+from ..registry import register
 
 logger = logging.getLogger(__name__)
 
@@ -85,38 +87,46 @@ async def handle_tool(
             "prompts": {},
         }
 
-    # Get tools for each server and register in proxy
+    # Prompts are fetched for all servers while tools are being listed,
+    # so start latency is bounded by the slowest phase instead of their sum
+    prompts_task = asyncio.create_task(prompt_manager.get_prompts_for_servers(servers))
+
+    # Get tools for all servers from one tools listing and register in proxy
     all_tools = []
     errors = {}
     successful_servers = []
 
-    for server in servers:
-        try:
-            # Get tools from server
-            async def fetch_tools():
-                return await docker_client.get_server_tools(server)
-
-            tools = await cache.get_server_tools(server, fetch_tools)
-
-            if tools:
-                # Register tools in proxy
-                proxy.register_tools(server, tools)
-                all_tools.extend(tools)
-                successful_servers.append(server)
-            else:
-                errors[server] = "No tools found or server not responding"
-        except ServerNotFoundError as e:
-            errors[server] = f"Server not found: {str(e)}"
-            logger.error(f"Server not found: {server}")
-        except CommandError as e:
-            errors[server] = f"Command error: {str(e)}"
-            logger.error(f"Command error for server {server}: {e}")
-        except Exception as e:
-            errors[server] = f"Unexpected error: {str(e)}"
-            logger.error(f"Error starting server {server}: {e}", exc_info=True)
-
-    # Get prompts for successful servers
-    prompts = await prompt_manager.get_prompts_for_servers(successful_servers)
+    try:
+        tools_by_server = await cache.get_tools_for_servers(
+            servers, docker_client.get_tools_index
+        )
+    except CommandError as e:
+        logger.error(f"Command error listing tools: {e}")
+        tools_by_server = {}
+        errors = {server: f"Command error: {str(e)}" for server in servers}
+    except Exception as e:
+        logger.error(f"Error listing tools: {e}", exc_info=True)
+        tools_by_server = {}
+        errors = {server: f"Unexpected error: {str(e)}" for server in servers}
+
+    for server, tools in tools_by_server.items():
+        if tools:
+            # Register tools in proxy
+            await proxy.register_server(server, tools)
+            all_tools.extend(tools)
+            successful_servers.append(server)
+        else:
+            errors[server] = "No tools found or server not responding"
+
+    # Keep prompts of successful servers only
+    try:
+        all_prompts = await prompts_task
+    except Exception as e:
+        logger.error(f"Error getting prompts: {e}", exc_info=True)
+        all_prompts = {}
+    prompts = {
+        server: all_prompts[server] for server in successful_servers if server in all_prompts
+    }
 
     # Format tools for response
     tools_data = [
@@ -139,3 +149,6 @@ async def handle_tool(
         result["errors"] = errors
 
     return result
+
+
+register(get_tool, handle_tool, "docker_client", "cache", "proxy", "prompt_manager")
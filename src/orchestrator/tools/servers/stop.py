@@ -1,5 +1,6 @@
 """Stop servers tool."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -8,6 +9,7 @@ from mcp.types import Tool
 from ...docker_client import DockerMCPClient
 from ...exceptions import CommandError
 from ...proxy import ToolProxy
+from ..registry import register
 
 logger = logging.getLogger(__name__)
 
@@ -51,9 +53,8 @@ async def handle_tool(
     if not servers:
         return {"status": "error", "error": "No servers specified", "servers": []}
 
-    # Unregister from proxy first
-    for server in servers:
-        proxy.unregister_server(server)
+    # Unregister from proxy first, draining in-flight calls of all servers at once
+    await asyncio.gather(*(proxy.unregister_server(server) for server in servers))
 
     # Disable servers through Docker MCP Toolkit
     try:
@@ -73,3 +74,6 @@ async def handle_tool(
             "error": f"Unexpected error: {str(e)}",
             "servers": servers,
         }
+
+
+register(get_tool, handle_tool, "docker_client", "proxy")
@@ -1,13 +1,237 @@
 """Utility functions for Orchestrator."""
 
 import asyncio
+import base64
+import hashlib
 import json
 import logging
-import subprocess
-from typing import Any, Dict, List, Optional
+import os
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+import aiofiles
+
+from .exceptions import InvalidArgumentError
+from .metrics import command_duration
 
 logger = logging.getLogger(__name__)
 
+# Name pattern of files holding spilled command output
+SPILL_PREFIX = "orchestrator-output-"
+SPILL_SUFFIX = ".out"
+
+
+def command_name(cmd: List[str]) -> str:
+    """
+    Get a short name of a command for metrics, e.g. "tools call" for docker mcp commands.
+
+    Args:
+        cmd: Command
+
+    Returns:
+        Command name
+    """
+    if cmd[:2] == ["docker", "mcp"]:
+        return " ".join(part for part in cmd[2:4] if not part.startswith("-"))
+    return cmd[0] if cmd else ""
+
+
+class CapturedOutput:
+    """Output of a command, read incrementally and capped in memory."""
+
+    def __init__(
+        self,
+        data: bytes,
+        total_bytes: int,
+        spill_path: Optional[str] = None,
+    ):
+        """
+        Initialize captured output.
+
+        Args:
+            data: Output kept in memory (a preview if the output was spilled)
+            total_bytes: Full output size in bytes
+            spill_path: Temp file holding the full output, if it exceeded the cap
+        """
+        self.data = data
+        self.total_bytes = total_bytes
+        self.spill_path = spill_path
+
+    @classmethod
+    def from_text(cls, text: str) -> "CapturedOutput":
+        """
+        Wrap a message, e.g. an error, as captured output.
+
+        Args:
+            text: Message
+
+        Returns:
+            Captured output holding the message
+        """
+        data = text.encode("utf-8")
+        return cls(data, len(data))
+
+    def discard(self):
+        """Delete the spill file, if any."""
+        if self.spill_path:
+            remove_file(self.spill_path)
+
+    @property
+    def truncated(self) -> bool:
+        """Whether only a preview of the output is kept in memory."""
+        return self.spill_path is not None
+
+    @property
+    def text(self) -> str:
+        """Output kept in memory, decoded as UTF-8."""
+        return self.data.decode("utf-8", errors="replace" if self.truncated else "strict")
+
+
+async def read_capped(
+    stream: asyncio.StreamReader,
+    max_bytes: int = 0,
+    preview_bytes: int = 65536,
+    spill_dir: Optional[str] = None,
+    chunk_size: int = 65536,
+) -> CapturedOutput:
+    """
+    Read a stream incrementally, spilling to a temp file past max_bytes.
+
+    At most max_bytes are held in memory while reading. Once the output
+    exceeds them, everything is written to a temp file and only the first
+    preview_bytes are kept.
+
+    Args:
+        stream: Stream to read until EOF
+        max_bytes: Max bytes held in memory (0 = unbounded)
+        preview_bytes: Bytes kept in memory once the output is spilled
+        spill_dir: Directory for spill files (system temp dir if None)
+        chunk_size: Read size in bytes
+
+    Returns:
+        Captured output
+    """
+    buffer = bytearray()
+    total = 0
+    spill = None
+    spill_path = None
+    try:
+        while True:
+            chunk = await stream.read(chunk_size)
+            if not chunk:
+                break
+            total += len(chunk)
+
+            if spill is None:
+                buffer += chunk
+                if not max_bytes or len(buffer) <= max_bytes:
+                    continue
+                spill, spill_path = await _open_spill_file(spill_dir)
+                await spill.write(buffer)
+                del buffer[preview_bytes:]
+                logger.warning(
+                    f"Command output exceeded {max_bytes} bytes, spilling to {spill_path}"
+                )
+            else:
+                await spill.write(chunk)
+    except BaseException:
+        if spill is not None:
+            await spill.close()
+            spill = None
+            remove_file(spill_path)
+        raise
+    finally:
+        if spill is not None:
+            await spill.close()
+
+    return CapturedOutput(bytes(buffer), total, spill_path)
+
+
+async def spill_output(
+    data: bytes, preview_bytes: int = 65536, spill_dir: Optional[str] = None
+) -> CapturedOutput:
+    """
+    Write output already held in memory to a spill file, keeping a preview.
+
+    Args:
+        data: Full output
+        preview_bytes: Bytes kept in memory
+        spill_dir: Directory for spill files (system temp dir if None)
+
+    Returns:
+        Captured output holding the preview and the spill file
+    """
+    spill, spill_path = await _open_spill_file(spill_dir)
+    try:
+        await spill.write(data)
+    except BaseException:
+        await spill.close()
+        remove_file(spill_path)
+        raise
+    await spill.close()
+    return CapturedOutput(data[:preview_bytes], len(data), spill_path)
+
+
+async def _open_spill_file(spill_dir: Optional[str] = None) -> tuple[Any, str]:
+    """Create a spill file, returning it open for binary writing and its path."""
+    fd, spill_path = tempfile.mkstemp(prefix=SPILL_PREFIX, suffix=SPILL_SUFFIX, dir=spill_dir)
+    os.close(fd)
+    opening = asyncio.ensure_future(aiofiles.open(spill_path, "wb"))
+    try:
+        return await asyncio.shield(opening), spill_path
+    except BaseException:
+        # Let a cancelled open finish first, so it can't recreate the file
+        await asyncio.wait({opening})
+        if opening.exception() is None:
+            await opening.result().close()
+        remove_file(spill_path)
+        raise
+
+
+def remove_file(path: str):
+    """
+    Delete a file, ignoring one that is already gone.
+
+    Args:
+        path: File path
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove {path}: {e}")
+
+
+def prune_spill_files(directory: Optional[str] = None, max_age: float = 3600) -> int:
+    """
+    Delete spill files older than max_age, e.g. left behind by earlier runs.
+
+    Args:
+        directory: Spill directory (system temp dir if None)
+        max_age: Max file age in seconds
+
+    Returns:
+        Number of files deleted
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+    try:
+        with os.scandir(directory or tempfile.gettempdir()) as entries:
+            for entry in entries:
+                if not (entry.name.startswith(SPILL_PREFIX) and entry.name.endswith(SPILL_SUFFIX)):
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        remove_file(entry.path)
+                        removed += 1
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.warning(f"Failed to prune spill files: {e}")
+    return removed
+
 
 async def run_command(
     cmd: List[str], timeout: int = 30, retries: int = 3, delay: int = 1
@@ -24,44 +248,129 @@ async def run_command(
     Returns:
         Tuple of (stdout, return_code)
     """
+    output, return_code = await run_command_output(cmd, timeout, retries, delay)
+    return output.text, return_code
+
+
+async def run_command_output(
+    cmd: List[str],
+    timeout: int = 30,
+    retries: int = 3,
+    delay: int = 1,
+    max_output_bytes: int = 0,
+    preview_bytes: int = 65536,
+    spill_dir: Optional[str] = None,
+) -> tuple[CapturedOutput, int]:
+    """
+    Run a command asynchronously with retry logic, streaming its output.
+
+    stdout is read incrementally; past max_output_bytes it spills to a temp
+    file instead of growing in memory (see read_capped). stderr is capped
+    at the same size and the rest discarded.
+
+    Args:
+        cmd: Command to run
+        timeout: Command timeout in seconds
+        retries: Number of retry attempts
+        delay: Delay between retries in seconds
+        max_output_bytes: Max stdout bytes held in memory (0 = unbounded)
+        preview_bytes: stdout bytes kept in memory once spilled
+        spill_dir: Directory for spill files (system temp dir if None)
+
+    Returns:
+        Tuple of (captured output, return_code); on failure, the output
+        holds the error message instead of stdout
+    """
+    name = command_name(cmd)
     for attempt in range(retries):
         try:
+            started = time.perf_counter()
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=timeout
+            reads = asyncio.gather(
+                read_capped(process.stdout, max_output_bytes, preview_bytes, spill_dir),
+                read_capped(process.stderr, max_output_bytes, preview_bytes, spill_dir),
+                process.wait(),
             )
+            try:
+                stdout, stderr, _ = await asyncio.wait_for(reads, timeout=timeout)
+            except BaseException:
+                # Timed out or cancelled: let the readers remove their spill
+                # files and retrieve their outcome
+                reads.cancel()
+                await asyncio.wait({reads})
+                if not reads.cancelled():
+                    reads.exception()
+                raise
+            finally:
+                # No return code yet means the command timed out
+                if process.returncode is None:
+                    status = "timeout"
+                    process.kill()
+                    await process.wait()
+                else:
+                    status = "ok" if process.returncode == 0 else "error"
+                command_duration.observe(
+                    time.perf_counter() - started, command=name, status=status
+                )
 
+            stderr.discard()
             if process.returncode == 0:
-                return stdout.decode("utf-8"), 0
+                return stdout, 0
             else:
-                error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
+                stdout.discard()
+                error_msg = stderr.text if stderr.data else "Unknown error"
                 logger.warning(
                     f"Command failed (attempt {attempt + 1}/{retries}): {error_msg}"
                 )
                 if attempt < retries - 1:
                     await asyncio.sleep(delay * (2 ** attempt))  # Exponential backoff
                 else:
-                    return error_msg, process.returncode
+                    return CapturedOutput.from_text(error_msg), process.returncode
 
         except asyncio.TimeoutError:
             logger.warning(f"Command timeout (attempt {attempt + 1}/{retries})")
             if attempt < retries - 1:
                 await asyncio.sleep(delay * (2 ** attempt))
             else:
-                return "Command timeout", -1
+                return CapturedOutput.from_text("Command timeout"), -1
 
         except Exception as e:
             logger.error(f"Error running command: {e}")
             if attempt < retries - 1:
                 await asyncio.sleep(delay * (2 ** attempt))
             else:
-                return str(e), -1
+                return CapturedOutput.from_text(str(e)), -1
 
-    return "Max retries exceeded", -1
+    return CapturedOutput.from_text("Max retries exceeded"), -1
+
+
+async def gather_limited(
+    funcs: Iterable[Callable[[], Awaitable[Any]]], limit: int = 4
+) -> List[Any]:
+    """
+    Run async functions concurrently with bounded fan-out.
+
+    Failures are isolated: an exception is returned in place of that
+    function's result instead of being raised.
+
+    Args:
+        funcs: Async functions to run
+        limit: Max functions running at once
+
+    Returns:
+        Results (or exceptions) in the order of funcs
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(func: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await func()
+
+    return await asyncio.gather(*(run(func) for func in funcs), return_exceptions=True)
 
 
 def parse_json_output(output: str) -> Optional[Dict[str, Any]]:
@@ -96,3 +405,158 @@ def find_tool_server(tool_name: str, servers: Dict[str, List[str]]) -> Optional[
         if tool_name in tools:
             return server
     return None
+
+
+def arguments_hash(arguments: Optional[Dict[str, Any]]) -> str:
+    """
+    Hash tool arguments canonically, independent of key order.
+
+    Args:
+        arguments: Tool arguments
+
+    Returns:
+        Hex digest
+    """
+    canonical = json.dumps(
+        arguments or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def pagination_schema() -> Dict[str, Any]:
+    """
+    Get input schema properties shared by list-style tools.
+
+    Returns:
+        Schema properties for limit, cursor and fields
+    """
+    return {
+        "limit": {
+            "type": "integer",
+            "description": "Max items per page (default: all items, no pagination)",
+            "minimum": 1,
+        },
+        "cursor": {
+            "type": "string",
+            "description": "Cursor from next_cursor of the previous page",
+        },
+        "fields": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Only return these fields of each item",
+        },
+    }
+
+
+def wants_page(arguments: Dict[str, Any]) -> bool:
+    """
+    Check whether a list-style tool call asks for pagination.
+
+    Args:
+        arguments: Tool arguments
+
+    Returns:
+        True if limit or cursor is given
+    """
+    return arguments.get("limit") is not None or arguments.get("cursor") is not None
+
+
+def encode_cursor(offset: int) -> str:
+    """
+    Encode a pagination cursor.
+
+    Args:
+        offset: Offset of the next page
+
+    Returns:
+        Opaque cursor string
+    """
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """
+    Decode a pagination cursor.
+
+    Args:
+        cursor: Cursor string, or None for the first page
+
+    Returns:
+        Offset of the page
+
+    Raises:
+        InvalidArgumentError: If the cursor is invalid
+    """
+    if not cursor:
+        return 0
+    try:
+        offset = json.loads(base64.urlsafe_b64decode(cursor.encode()))["offset"]
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise InvalidArgumentError("cursor", cursor, "not a next_cursor of a previous page") from e
+    if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+        raise InvalidArgumentError("cursor", cursor, "not a next_cursor of a previous page")
+    return offset
+
+
+def paginate(
+    items: Sequence[Any], limit: Optional[int] = None, cursor: Optional[str] = None
+) -> tuple[List[Any], Optional[str]]:
+    """
+    Get a page of items.
+
+    Args:
+        items: All items, in stable order
+        limit: Max items per page (None = all remaining)
+        cursor: Cursor of the page (None = first page)
+
+    Returns:
+        Tuple of (page items, cursor of the next page or None)
+
+    Raises:
+        InvalidArgumentError: If the cursor or limit is invalid
+    """
+    offset = decode_cursor(cursor)
+    if limit is None:
+        return list(items[offset:]), None
+    if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+        raise InvalidArgumentError("limit", limit, "must be an integer of at least 1")
+    end = offset + limit
+    next_cursor = encode_cursor(end) if end < len(items) else None
+    return list(items[offset:end]), next_cursor
+
+
+def get_fields(arguments: Dict[str, Any]) -> Optional[List[str]]:
+    """
+    Get the fields argument of a list-style tool call.
+
+    Args:
+        arguments: Tool arguments
+
+    Returns:
+        Field names to keep, or None for all fields
+
+    Raises:
+        InvalidArgumentError: If fields is not a list of strings
+    """
+    fields = arguments.get("fields")
+    if fields is None:
+        return None
+    if not isinstance(fields, list) or not all(isinstance(field, str) for field in fields):
+        raise InvalidArgumentError("fields", fields, "must be a list of field names")
+    return fields
+
+
+def project(item: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    Keep only selected fields of an item.
+
+    Args:
+        item: Item dictionary
+        fields: Fields to keep (None or empty = all)
+
+    Returns:
+        Projected item
+    """
+    if not fields:
+        return item
+    return {field: item[field] for field in fields if field in item}
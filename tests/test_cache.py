@@ -0,0 +1,125 @@
+"""Tests for MetadataCache."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.cache import LRUCacheMap, MetadataCache
+from orchestrator.exceptions import CommandError
+from orchestrator.models import CachedItem, ServerMetadata, Tool
+
+
+async def test_tools_index_drops_servers_absent_from_listing():
+    cache = MetadataCache(tools_ttl=3, tools_hard_ttl=30)
+
+    async def first_index():
+        return {"a": [], "gone": [Tool(name="old")]}
+
+    async def second_index():
+        return {"a": []}
+
+    await cache.get_tools_for_servers(["a", "gone"], first_index)
+    assert "gone" in cache._tools_cache
+
+    cache.invalidate_server_tools("a")
+    await cache.get_tools_for_servers(["a"], second_index)
+
+    assert "gone" not in cache._tools_cache
+    assert cache._refresher_age("tools_index") < 1
+
+
+async def test_concurrent_misses_share_one_fetch():
+    cache = MetadataCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [ServerMetadata(name="github")]
+
+    results = await asyncio.gather(*(cache.get_servers("docker-mcp", fetch) for _ in range(10)))
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert cache.get_stats()["coalesced"] == 9
+
+
+async def test_fetch_error_reaches_every_waiter_and_is_not_cached():
+    cache = MetadataCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise CommandError(["docker"], 1, stderr="boom")
+
+    results = await asyncio.gather(
+        *(cache.get_servers("docker-mcp", fetch) for _ in range(3)), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, CommandError) for result in results)
+    assert cache.get_stats()["inflight"] == 0
+
+    with pytest.raises(CommandError):
+        await cache.get_servers("docker-mcp", fetch)
+    assert calls == 2
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_fetch():
+    cache = MetadataCache()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return [ServerMetadata(name="github")]
+
+    first = asyncio.create_task(cache.get_servers("docker-mcp", fetch))
+    second = asyncio.create_task(cache.get_servers("docker-mcp", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert [server.name for server in await second] == ["github"]
+
+
+def test_lru_evicts_least_recently_used_by_count():
+    evicted = []
+    lru = LRUCacheMap(max_entries=2, on_evict=evicted.append)
+
+    lru["a"] = CachedItem(data="a")
+    lru["b"] = CachedItem(data="b")
+    lru.get("a")
+    lru["c"] = CachedItem(data="c")
+
+    assert lru.keys() == ["a", "c"]
+    assert evicted == ["b"]
+    assert lru.evictions == 1
+
+
+def test_lru_evicts_until_within_byte_budget():
+    lru = LRUCacheMap(max_bytes=25)
+
+    lru["a"] = CachedItem(data="x" * 10)
+    lru["b"] = CachedItem(data="x" * 10)
+    assert lru.bytes == 20
+
+    lru["c"] = CachedItem(data="x" * 20)
+
+    assert lru.keys() == ["c"]
+    assert lru.bytes == 20
+    assert lru.evictions == 2
+
+
+def test_lru_replacing_entry_updates_size():
+    lru = LRUCacheMap(max_bytes=25)
+
+    lru["a"] = CachedItem(data="x" * 20)
+    lru["a"] = CachedItem(data="x" * 5)
+    lru["b"] = CachedItem(data="x" * 20)
+
+    assert lru.keys() == ["a", "b"]
+    assert lru.bytes == 25
+    assert lru.evictions == 0
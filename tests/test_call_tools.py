@@ -0,0 +1,93 @@
+"""Tests for the call_tools batch tool."""
+
+import asyncio
+import time
+
+from orchestrator.exceptions import DockerMCPError
+from orchestrator.models import Tool
+from orchestrator.proxy import ToolProxy
+from orchestrator.tools.proxy.call_tools import handle_tool
+
+
+class StubPool:
+    """Pool whose calls sleep for arguments["delay"] and fail on arguments["fail"]."""
+
+    def __init__(self):
+        self.started = []
+
+    async def call_tool(self, tool_name, arguments, server, cli_fallback=True):
+        self.started.append(tool_name)
+        await asyncio.sleep(arguments.get("delay", 0))
+        if arguments.get("fail"):
+            raise DockerMCPError(f"{tool_name} failed")
+        return {"tool": tool_name}
+
+    async def invalidate_server_cache(self, server):
+        pass
+
+
+async def make_proxy():
+    pool = StubPool()
+    proxy = ToolProxy(pool)
+    await proxy.register_server("s", [Tool(name=name) for name in ("a", "b", "c")])
+    return pool, proxy
+
+
+async def test_results_keep_call_order():
+    _, proxy = await make_proxy()
+    calls = [
+        {"tool_name": "a", "arguments": {"delay": 0.05}},
+        {"tool_name": "b"},
+        {"tool_name": "missing"},
+        {"tool_name": "c", "arguments": {"delay": 0.02}},
+    ]
+
+    result = await handle_tool({"calls": calls}, proxy=proxy)
+
+    assert [r["index"] for r in result["results"]] == [0, 1, 2, 3]
+    assert [r["status"] for r in result["results"]] == ["success", "success", "error", "success"]
+    assert [r["result"] for r in result["results"]] == [
+        {"tool": "a"},
+        {"tool": "b"},
+        None,
+        {"tool": "c"},
+    ]
+    assert (result["status"], result["succeeded"], result["failed"]) == ("partial", 3, 1)
+
+
+async def test_calls_run_concurrently():
+    _, proxy = await make_proxy()
+    calls = [{"tool_name": name, "arguments": {"delay": 0.1}} for name in ("a", "b", "c")]
+
+    started = time.monotonic()
+    result = await handle_tool({"calls": calls}, proxy=proxy)
+
+    assert result["status"] == "success"
+    assert time.monotonic() - started < 0.25
+
+
+async def test_fail_fast_cancels_remaining_calls():
+    pool, proxy = await make_proxy()
+    calls = [
+        {"tool_name": "a", "arguments": {"fail": True}},
+        {"tool_name": "b", "arguments": {"delay": 5}},
+        {"tool_name": "c"},
+    ]
+
+    started = time.monotonic()
+    result = await handle_tool({"calls": calls, "fail_fast": True, "max_parallel": 2}, proxy=proxy)
+
+    assert time.monotonic() - started < 1
+    assert [r["status"] for r in result["results"]] == ["error", "cancelled", "cancelled"]
+    assert "c" not in pool.started
+    assert (result["status"], result["failed"], result["cancelled"]) == ("error", 1, 2)
+
+
+async def test_without_fail_fast_failures_are_isolated():
+    _, proxy = await make_proxy()
+    calls = [{"tool_name": "a", "arguments": {"fail": True}}, {"tool_name": "b"}]
+
+    result = await handle_tool({"calls": calls}, proxy=proxy)
+
+    assert [r["status"] for r in result["results"]] == ["error", "success"]
+    assert "a failed" in result["results"][0]["error"]
@@ -0,0 +1,91 @@
+"""Tests for the shared active-servers snapshot of MCPConnectionPool."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.connection_pool import MCPConnectionPool
+
+
+class StubDockerClient:
+    """Docker client whose `server ls` takes a while."""
+
+    def __init__(self, active, delay=0.0):
+        self.active = set(active)
+        self.delay = delay
+        self.listings = 0
+
+    async def get_active_servers(self):
+        self.listings += 1
+        active = list(self.active)
+        await asyncio.sleep(self.delay)
+        return active
+
+
+@pytest.fixture
+def docker_client():
+    return StubDockerClient({"github", "gitlab"})
+
+
+@pytest.fixture
+def pool(docker_client):
+    return MCPConnectionPool(docker_client, status_check_ttl=30, use_sessions=False)
+
+
+async def test_concurrent_reads_share_one_listing(pool, docker_client):
+    docker_client.delay = 0.01
+    servers = ["github", "gitlab", "jira"] * 5
+
+    infos = await asyncio.gather(*(pool.get_server_info(server) for server in servers))
+
+    assert docker_client.listings == 1
+    assert [info.is_active for info in infos] == [True, True, False] * 5
+
+
+async def test_snapshot_expires_after_ttl(pool, docker_client):
+    await pool.get_server_info("github")
+    await pool.get_server_info("gitlab")
+    assert docker_client.listings == 1
+
+    pool._active_snapshot.checked_at -= 31
+    docker_client.active.discard("github")
+
+    assert not (await pool.get_server_info("github")).is_active
+    assert docker_client.listings == 2
+
+
+async def test_invalidation_relists_only_for_invalidated_server(pool, docker_client):
+    await pool.get_server_info("github")
+    docker_client.active.add("jira")
+    await pool.invalidate_server_cache("jira")
+
+    # Other servers keep the unexpired snapshot
+    assert (await pool.get_server_info("github")).is_active
+    assert docker_client.listings == 1
+
+    assert (await pool.get_server_info("jira")).is_active
+    assert docker_client.listings == 2
+
+
+async def test_invalidation_during_listing_lists_again(pool, docker_client):
+    docker_client.delay = 0.01
+    first = asyncio.create_task(pool.get_server_info("jira"))
+    while not docker_client.listings:
+        await asyncio.sleep(0)
+
+    # Started after the running listing checked, which may miss it
+    docker_client.active.add("jira")
+    await pool.invalidate_server_cache("jira")
+
+    assert (await pool.get_server_info("jira")).is_active
+    assert docker_client.listings == 2
+    await first
+
+
+async def test_zero_ttl_lists_once_per_read(docker_client):
+    pool = MCPConnectionPool(docker_client, status_check_ttl=0, use_sessions=False)
+
+    await pool.get_server_info("github")
+    await pool.get_server_info("github")
+
+    assert docker_client.listings == 2
@@ -0,0 +1,101 @@
+"""Tests for sharing identical in-flight tool calls in ToolProxy."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.exceptions import DockerMCPError
+from orchestrator.models import Tool
+from orchestrator.proxy import ToolProxy
+from orchestrator.result_cache import ToolMatcher
+
+
+class StubPool:
+    """Connection pool whose tool calls block until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.calls = 0
+        self.fail = False
+
+    async def call_tool(self, tool_name, arguments, server, cli_fallback=True):
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise DockerMCPError("server unavailable")
+        return {"q": arguments.get("q")}
+
+    async def invalidate_server_cache(self, server):
+        pass
+
+
+@pytest.fixture
+async def setup():
+    pool = StubPool()
+    proxy = ToolProxy(pool, dedup=ToolMatcher(patterns=["github__search"]))
+    await proxy.register_server("github", [Tool(name="search"), Tool(name="create_issue")])
+    return pool, proxy
+
+
+async def release_when_started(pool, calls):
+    while pool.calls < calls:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+    pool.release.set()
+
+
+async def test_identical_calls_share_one_server_call(setup):
+    pool, proxy = setup
+
+    results = await asyncio.gather(
+        *(proxy.call_tool("search", {"q": "bug"}) for _ in range(5)),
+        proxy.call_tool("search", {"q": "docs"}),
+        release_when_started(pool, 2),
+    )
+
+    assert results[:5] == [({"q": "bug"}, None)] * 5
+    assert results[5] == ({"q": "docs"}, None)
+    assert pool.calls == 2
+    assert proxy.get_dedup_stats() == {"inflight": 0, "deduplicated": 4}
+
+
+async def test_unmatched_tools_are_not_shared(setup):
+    pool, proxy = setup
+
+    await asyncio.gather(
+        *(proxy.call_tool("create_issue", {"q": "bug"}) for _ in range(3)),
+        release_when_started(pool, 3),
+    )
+
+    assert pool.calls == 3
+
+
+async def test_error_is_shared_and_not_kept(setup):
+    pool, proxy = setup
+    pool.fail = True
+
+    results = await asyncio.gather(
+        *(proxy.call_tool("search", {"q": "bug"}) for _ in range(3)),
+        release_when_started(pool, 1),
+    )
+
+    assert pool.calls == 1
+    assert all(result is None and "server unavailable" in error for result, error in results[:3])
+
+    pool.fail = False
+    assert await proxy.call_tool("search", {"q": "bug"}) == ({"q": "bug"}, None)
+    assert pool.calls == 2
+
+
+async def test_cancelled_caller_does_not_cancel_shared_call(setup):
+    pool, proxy = setup
+
+    first = asyncio.create_task(proxy.call_tool("search", {"q": "bug"}))
+    second = asyncio.create_task(proxy.call_tool("search", {"q": "bug"}))
+    while pool.calls < 1:
+        await asyncio.sleep(0)
+    first.cancel()
+    pool.release.set()
+
+    assert await second == ({"q": "bug"}, None)
+    assert pool.calls == 1
@@ -0,0 +1,29 @@
+"""Tests for DiskCache."""
+
+from orchestrator.cache import MetadataCache
+from orchestrator.disk_cache import DiskCache
+from orchestrator.models import Tool
+
+
+async def test_refreshes_do_not_grow_file_without_bound(tmp_path):
+    disk_cache = DiskCache(str(tmp_path))
+    cache = MetadataCache(tools_ttl=600, disk_cache=disk_cache)
+
+    for refresh in range(50):
+        index = {
+            f"server{i}": [Tool(name=f"tool{refresh}", description="x" * 100)] for i in range(20)
+        }
+
+        async def fetch_index(index=index):
+            return index
+
+        cache.invalidate_server_tools("server0")
+        await cache.get_tools_for_servers(["server0"], fetch_index)
+        await cache.flush()
+
+    records = disk_cache.path.read_text().splitlines()
+    assert len(records) <= disk_cache.compact_ratio * 20 + 20
+
+    reloaded = await DiskCache(str(tmp_path)).load()
+    assert len(reloaded) == 20
+    assert reloaded[("tools", "server5")].data[0].name == "tool49"
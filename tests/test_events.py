@@ -0,0 +1,202 @@
+"""Tests for event-driven server status with a scripted event stream."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.connection_pool import MCPConnectionPool
+from orchestrator.events import ServerEvent, ServerEventWatcher, parse_docker_event
+from orchestrator.models import Tool
+from orchestrator.proxy import ToolProxy
+
+
+class QueueEventSource:
+    """Event source yielding scripted events; None ends the stream."""
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def __call__(self):
+        while True:
+            event = await self.queue.get()
+            if event is None:
+                self.queue.task_done()
+                return
+            yield event
+            # Resumed once the watcher has handled the event
+            self.queue.task_done()
+
+    async def send(self, event):
+        await self.queue.put(event)
+        await self.queue.join()
+
+
+class StubDockerClient:
+    """Docker client listing a mutable set of active servers."""
+
+    def __init__(self, active):
+        self.active = set(active)
+        self.listings = 0
+
+    async def get_active_servers(self):
+        self.listings += 1
+        return list(self.active)
+
+
+@pytest.fixture
+async def setup():
+    docker_client = StubDockerClient({"github"})
+    pool = MCPConnectionPool(docker_client, status_check_ttl=30, use_sessions=False)
+    proxy = ToolProxy(pool)
+    await proxy.register_server("github", [Tool(name="search")])
+
+    source = QueueEventSource()
+    watcher = ServerEventWatcher(source, reconnect_delay=60, stable_after=0)
+    watcher.subscribe(pool.handle_server_event, pool.handle_event_stream)
+    watcher.subscribe(proxy.handle_server_event)
+    watcher.start()
+    while not pool.status_from_events:
+        await asyncio.sleep(0)
+
+    yield docker_client, pool, proxy, source
+    await watcher.stop()
+
+
+async def test_status_served_from_memory_while_connected(setup):
+    docker_client, pool, _, _ = setup
+    await pool.get_server_info("github")
+    # Older than status_check_ttl, but events keep it current
+    pool._active_snapshot.checked_at -= 60
+
+    assert (await pool.get_server_info("github")).is_active
+    assert docker_client.listings == 1
+
+
+async def test_die_of_enabled_server_keeps_it_registered(setup):
+    _, pool, proxy, source = setup
+
+    await source.send(ServerEvent("github", "die", exit_code=137))
+
+    assert proxy.list_servers() == ["github"]
+    assert proxy.get_server_for_tool("search") == "github"
+    assert (await pool.get_server_info("github")).is_active
+
+
+async def test_stop_after_disable_unregisters_server(setup):
+    docker_client, pool, proxy, source = setup
+    await pool.get_server_info("github")
+
+    docker_client.active.discard("github")
+    await source.send(ServerEvent("github", "die", exit_code=143))
+
+    assert proxy.list_servers() == []
+    assert not (await pool.get_server_info("github")).is_active
+    result, error = await proxy.call_tool("search", {})
+    assert result is None and "not found" in error
+
+
+async def test_end_of_stream_falls_back_to_ttl_polling(setup):
+    docker_client, pool, _, source = setup
+    await pool.get_server_info("github")
+
+    await source.send(None)
+    while pool.status_from_events:
+        await asyncio.sleep(0)
+
+    pool._active_snapshot.checked_at -= 60
+    await pool.get_server_info("github")
+    assert docker_client.listings == 2
+
+
+async def test_clean_exit_and_known_start_do_not_relist(setup):
+    docker_client, pool, proxy, source = setup
+    await pool.get_server_info("github")
+
+    await source.send(ServerEvent("github", "die", exit_code=0))
+    await source.send(ServerEvent("github", "start"))
+
+    assert (await pool.get_server_info("github")).is_active
+    assert docker_client.listings == 1
+    assert proxy.list_servers() == ["github"]
+
+
+async def test_start_of_unknown_server_relists(setup):
+    docker_client, pool, _, source = setup
+    await pool.get_server_info("github")
+
+    docker_client.active.add("gitlab")
+    await source.send(ServerEvent("gitlab", "start"))
+
+    assert (await pool.get_server_info("gitlab")).is_active
+    assert docker_client.listings == 2
+
+
+class RecordingSubscriber:
+    """Subscriber recording connection state changes."""
+
+    def __init__(self):
+        self.states = []
+
+    async def on_event(self, event):
+        pass
+
+    async def on_connect(self, connected):
+        self.states.append(connected)
+
+
+async def test_failing_source_never_signals_connected():
+    attempts = 0
+
+    async def failing_source():
+        nonlocal attempts
+        attempts += 1
+        raise OSError("docker: command not found")
+        yield
+
+    subscriber = RecordingSubscriber()
+    watcher = ServerEventWatcher(failing_source, reconnect_delay=0.01, stable_after=0.05)
+    watcher.subscribe(subscriber.on_event, subscriber.on_connect)
+    watcher.start()
+    while attempts < 5:
+        await asyncio.sleep(0.01)
+    await watcher.stop()
+
+    assert subscriber.states == []
+
+
+async def test_connected_once_stream_is_stable():
+    source = QueueEventSource()
+    subscriber = RecordingSubscriber()
+    watcher = ServerEventWatcher(source, reconnect_delay=60, stable_after=0.05)
+    watcher.subscribe(subscriber.on_event, subscriber.on_connect)
+    watcher.start()
+
+    await asyncio.sleep(0.01)
+    assert subscriber.states == []
+    await asyncio.sleep(0.1)
+    assert subscriber.states == [True]
+
+    await source.send(None)
+    while watcher.connected:
+        await asyncio.sleep(0)
+    assert subscriber.states == [True, False]
+    await watcher.stop()
+
+
+def test_parse_docker_event():
+    line = (
+        '{"Type":"container","Action":"die","time":1700000000,'
+        '"Actor":{"Attributes":{"docker-mcp-name":"github","exitCode":"143"}}}'
+    )
+    event = parse_docker_event(line)
+    assert (event.server, event.action, event.exit_code, event.failed) == (
+        "github",
+        "die",
+        143,
+        True,
+    )
+    clean = line.replace('"143"', '"0"')
+    assert not parse_docker_event(clean).failed
+    assert parse_docker_event(line.replace('"die"', '"stop"')) is None
+    assert parse_docker_event('{"Action":"die","Actor":{"Attributes":{}}}') is None
+    assert parse_docker_event("not json") is None
@@ -0,0 +1,112 @@
+"""Tests for streaming, size-capped command output capture."""
+
+import asyncio
+import os
+import sys
+import time
+
+from mcp.types import CallToolResult, TextContent
+
+from orchestrator import utils
+from orchestrator.connection_pool import MCPConnectionPool
+from orchestrator.docker_client import DockerMCPClient
+from orchestrator.utils import CapturedOutput, prune_spill_files, run_command_output
+
+
+def python(script):
+    return [sys.executable, "-c", script]
+
+
+async def test_large_output_spills_to_file(tmp_path):
+    output, code = await run_command_output(
+        python("import sys; sys.stdout.write('x' * 100000)"),
+        max_output_bytes=1000,
+        preview_bytes=10,
+        spill_dir=str(tmp_path),
+    )
+    assert code == 0
+    assert output.truncated and output.text == "x" * 10
+    assert os.path.getsize(output.spill_path) == output.total_bytes == 100000
+
+
+async def test_failure_returns_captured_error(tmp_path):
+    output, code = await run_command_output(
+        python("import sys; print('x' * 5000); sys.exit('boom')"),
+        retries=1,
+        max_output_bytes=100,
+        spill_dir=str(tmp_path),
+    )
+    assert code == 1
+    assert isinstance(output, CapturedOutput) and output.text.strip() == "boom"
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_cancelled_command_removes_spill_file(tmp_path):
+    cmd = python(
+        "import sys, time; sys.stdout.write('x' * 100000); sys.stdout.flush(); time.sleep(30)"
+    )
+    task = asyncio.create_task(
+        run_command_output(cmd, max_output_bytes=1000, spill_dir=str(tmp_path))
+    )
+    while not list(tmp_path.iterdir()):
+        await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spill_files_are_bounded(tmp_path):
+    client = DockerMCPClient(spill_dir=str(tmp_path), spill_max_files=2, spill_max_age=60)
+    old = tmp_path / "orchestrator-output-old.out"
+    old.write_text("x")
+    os.utime(old, (time.time() - 120, time.time() - 120))
+    other = tmp_path / "unrelated.out"
+    other.write_text("x")
+
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"orchestrator-output-{i}.out"
+        path.write_text("x")
+        paths.append(path)
+        client._keep_spill_file(str(path))
+
+    assert not old.exists() and other.exists()
+    assert [p.exists() for p in paths] == [False, True, True]
+
+    client.cleanup_spill_files()
+    assert not any(p.exists() for p in paths)
+    assert prune_spill_files(str(tmp_path), 0) == 0
+
+
+async def test_failed_spill_open_removes_file(tmp_path, monkeypatch):
+    async def failing_open(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(utils.aiofiles, "open", failing_open)
+    output, code = await run_command_output(
+        python("import sys; sys.stdout.write('x' * 10000)"),
+        retries=1,
+        max_output_bytes=100,
+        spill_dir=str(tmp_path),
+    )
+    assert code == -1 and output.text == "disk full"
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_large_session_result_spills_to_file(tmp_path):
+    client = DockerMCPClient(
+        max_output_bytes=1000, output_preview_bytes=10, spill_dir=str(tmp_path)
+    )
+    pool = MCPConnectionPool(client, use_sessions=False)
+
+    large = CallToolResult(content=[TextContent(type="text", text="x" * 5000)])
+    result = await pool._parse_session_result("dump", "github", large)
+
+    assert result["truncated"] and result["result"] == "x" * 10
+    assert result["size_bytes"] == os.path.getsize(result["output_file"]) == 5000
+
+    small = CallToolResult(content=[TextContent(type="text", text='{"ok": true}')])
+    assert await pool._parse_session_result("dump", "github", small) == {"ok": True}
+
+    client.cleanup_spill_files()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,75 @@
+"""Tests for cursor pagination of list-style tools."""
+
+import pytest
+
+from orchestrator.exceptions import InvalidArgumentError
+from orchestrator.models import Tool
+from orchestrator.proxy import ToolProxy
+from orchestrator.tools.proxy import list_active_tools
+from orchestrator.utils import encode_cursor, get_fields, paginate
+
+
+class StubPool:
+    """Connection pool that only tracks invalidations."""
+
+    async def invalidate_server_cache(self, server):
+        pass
+
+
+def test_cursor_round_trips_through_all_pages():
+    items = list(range(7))
+    pages = []
+    cursor = None
+    while True:
+        page, cursor = paginate(items, 3, cursor)
+        pages.append(page)
+        if cursor is None:
+            break
+
+    assert pages == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_no_limit_returns_rest_without_cursor():
+    assert paginate(list(range(5)), cursor=encode_cursor(2)) == ([2, 3, 4], None)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(-1), "eyJmb28iOiAxfQ=="])
+def test_invalid_cursor_is_rejected_by_name(cursor):
+    with pytest.raises(InvalidArgumentError) as exc_info:
+        paginate([1, 2, 3], 1, cursor)
+
+    assert exc_info.value.argument == "cursor"
+    assert cursor in str(exc_info.value)
+
+
+@pytest.mark.parametrize("limit", [0, "2", True])
+def test_invalid_limit_is_rejected(limit):
+    with pytest.raises(InvalidArgumentError):
+        paginate([1, 2, 3], limit)
+
+
+@pytest.mark.parametrize("fields", ["name", ["name", 1]])
+def test_fields_must_be_list_of_strings(fields):
+    with pytest.raises(InvalidArgumentError):
+        get_fields({"fields": fields})
+
+    assert get_fields({"fields": ["name"]}) == ["name"]
+
+
+async def test_list_active_tools_pages_in_qualified_name_order():
+    proxy = ToolProxy(StubPool())
+    await proxy.register_server("zeta", [Tool(name="b"), Tool(name="a")])
+    await proxy.register_server("alpha", [Tool(name="c")])
+
+    names = []
+    cursor = None
+    while True:
+        result = await list_active_tools.handle_tool(
+            {"limit": 2, "cursor": cursor, "fields": ["name", "server"]}, proxy
+        )
+        names += [f"{tool['server']}__{tool['name']}" for tool in result["all_tools"]]
+        cursor = result["next_cursor"]
+        if cursor is None:
+            break
+
+    assert names == ["alpha__c", "zeta__a", "zeta__b"]
@@ -0,0 +1,163 @@
+"""Tests for ToolProxy server register/unregister with calls in flight."""
+
+import asyncio
+
+from orchestrator.models import Tool
+from orchestrator.proxy import ToolProxy
+from orchestrator.tools.servers import stop
+
+
+class StubPool:
+    """Connection pool whose tool calls block until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.events = []
+
+    async def call_tool(self, tool_name, arguments, server, cli_fallback=True):
+        self.events.append(("call", server, tool_name))
+        await self.release.wait()
+        self.events.append(("done", server, tool_name))
+        return {"server": server, "tool": tool_name}
+
+    async def invalidate_server_cache(self, server):
+        self.events.append(("invalidate", server))
+
+    async def close_session(self, server):
+        self.events.append(("close_session", server))
+
+
+def tools(*names):
+    return [Tool(name=name) for name in names]
+
+
+async def started(pool, count=1):
+    """Wait until count calls reached the pool."""
+    while sum(1 for event in pool.events if event[0] == "call") < count:
+        await asyncio.sleep(0)
+
+
+async def test_unregister_waits_for_inflight_calls():
+    pool = StubPool()
+    proxy = ToolProxy(pool, drain_timeout=5)
+    await proxy.register_server("github", tools("search"))
+
+    call = asyncio.create_task(proxy.call_tool("search", {}))
+    await started(pool)
+    unregister = asyncio.create_task(proxy.unregister_server("github"))
+    await asyncio.sleep(0.01)
+
+    assert not unregister.done()
+    assert ("close_session", "github") not in pool.events
+
+    pool.release.set()
+    assert await call == ({"server": "github", "tool": "search"}, None)
+    await unregister
+    assert pool.events.index(("done", "github", "search")) < pool.events.index(
+        ("close_session", "github")
+    )
+
+
+async def test_calls_after_unregister_are_rejected():
+    pool = StubPool()
+    pool.release.set()
+    proxy = ToolProxy(pool)
+    await proxy.register_server("github", tools("search"))
+    await proxy.unregister_server("github")
+
+    for name in ("search", "github__search"):
+        result, error = await proxy.call_tool(name, {})
+        assert result is None
+        assert "not found" in error
+    assert not [event for event in pool.events if event[0] == "call"]
+    assert proxy.list_servers() == []
+
+
+async def test_unregister_gives_up_after_drain_timeout():
+    pool = StubPool()
+    proxy = ToolProxy(pool, drain_timeout=0.05)
+    await proxy.register_server("github", tools("search"))
+
+    call = asyncio.create_task(proxy.call_tool("search", {}))
+    await started(pool)
+    await asyncio.wait_for(proxy.unregister_server("github"), timeout=1)
+
+    assert ("close_session", "github") in pool.events
+    assert not call.done()
+
+    pool.release.set()
+    await call
+
+
+async def test_register_other_server_during_inflight_call():
+    pool = StubPool()
+    proxy = ToolProxy(pool)
+    await proxy.register_server("github", tools("search"))
+
+    call = asyncio.create_task(proxy.call_tool("search", {}))
+    await started(pool)
+    await asyncio.wait_for(proxy.register_server("gitlab", tools("search")), timeout=1)
+
+    # The name is now ambiguous for new calls, the running call is unaffected
+    result, error = await proxy.call_tool("search", {})
+    assert result is None and "github__search" in error
+    pool.release.set()
+    assert await call == ({"server": "github", "tool": "search"}, None)
+    assert await proxy.call_tool("gitlab__search", {}) == (
+        {"server": "gitlab", "tool": "search"},
+        None,
+    )
+
+
+class StubDockerClient:
+    """Docker client recording disabled servers."""
+
+    def __init__(self):
+        self.disabled = []
+
+    async def disable_servers(self, servers):
+        self.disabled += servers
+
+
+async def test_stop_servers_drains_servers_concurrently():
+    pool = StubPool()
+    proxy = ToolProxy(pool, drain_timeout=0.2)
+    docker_client = StubDockerClient()
+    await proxy.register_server("github", tools("search"))
+    await proxy.register_server("gitlab", tools("issues"))
+
+    calls = [
+        asyncio.create_task(proxy.call_tool("search", {})),
+        asyncio.create_task(proxy.call_tool("issues", {})),
+    ]
+    await started(pool, count=2)
+    started_at = asyncio.get_running_loop().time()
+    result = await stop.handle_tool(
+        {"servers": ["github", "gitlab"]}, docker_client=docker_client, proxy=proxy
+    )
+    elapsed = asyncio.get_running_loop().time() - started_at
+
+    assert result["status"] == "success"
+    assert docker_client.disabled == ["github", "gitlab"]
+    assert 0.2 <= elapsed < 0.35
+    pool.release.set()
+    await asyncio.gather(*calls)
+
+
+async def test_register_is_not_blocked_by_drain():
+    pool = StubPool()
+    proxy = ToolProxy(pool, drain_timeout=5)
+    await proxy.register_server("github", tools("search"))
+
+    call = asyncio.create_task(proxy.call_tool("search", {}))
+    await started(pool)
+    unregister = asyncio.create_task(proxy.unregister_server("github"))
+    await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(proxy.register_server("gitlab", tools("issues")), timeout=1)
+    assert not unregister.done()
+
+    pool.release.set()
+    await call
+    await unregister
+    assert proxy.list_servers() == ["gitlab"]
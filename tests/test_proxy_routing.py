@@ -0,0 +1,68 @@
+"""Tests for ToolProxy name resolution."""
+
+import pytest
+
+from orchestrator.exceptions import AmbiguousToolError, ToolNotFoundError
+from orchestrator.models import Tool
+from orchestrator.proxy import ToolProxy
+
+
+class StubPool:
+    """Connection pool that only tracks lifecycle calls."""
+
+    async def invalidate_server_cache(self, server):
+        pass
+
+    async def close_session(self, server):
+        pass
+
+
+@pytest.fixture
+def proxy():
+    return ToolProxy(StubPool(), expose_tools=True)
+
+
+def exposed(proxy):
+    return {tool.name: tool.description for tool in proxy.get_exposed_tools()}
+
+
+async def test_shared_plain_name_needs_qualified_name(proxy):
+    await proxy.register_server("github", [Tool(name="search")])
+    await proxy.register_server("gitlab", [Tool(name="search")])
+
+    with pytest.raises(AmbiguousToolError) as exc_info:
+        proxy.resolve_tool("search")
+
+    assert exc_info.value.candidates == ["github__search", "gitlab__search"]
+    assert proxy.resolve_tool("github__search") == ("github", "search")
+    assert proxy.resolve_tool("gitlab__search") == ("gitlab", "search")
+    assert proxy.resolve_exposed_tool("gitlab__search") == ("gitlab", "search")
+
+
+async def test_colliding_qualified_names_are_ambiguous(proxy):
+    await proxy.register_server("a__b", [Tool(name="c", description="first")])
+    await proxy.register_server("a", [Tool(name="b__c", description="second")])
+
+    with pytest.raises(AmbiguousToolError) as exc_info:
+        proxy.resolve_tool("a__b__c")
+    with pytest.raises(AmbiguousToolError):
+        proxy.resolve_exposed_tool("a__b__c")
+
+    assert exc_info.value.details == {"servers": ["a__b", "a"]}
+    assert exposed(proxy) == {"a__b__c": "[a__b] first"}
+
+
+async def test_unregister_keeps_colliding_route_of_other_server(proxy):
+    await proxy.register_server("a__b", [Tool(name="c", description="first")])
+    await proxy.register_server("a", [Tool(name="b__c", description="second")])
+
+    await proxy.unregister_server("a__b")
+
+    assert proxy.resolve_tool("a__b__c") == ("a", "b__c")
+    assert exposed(proxy) == {"a__b__c": "[a] second"}
+
+    await proxy.unregister_server("a")
+
+    with pytest.raises(ToolNotFoundError):
+        proxy.resolve_tool("a__b__c")
+    assert exposed(proxy) == {}
@@ -0,0 +1,90 @@
+"""Tests for caching of tool results in ToolProxy."""
+
+import pytest
+
+from orchestrator.models import Tool
+from orchestrator.proxy import ToolProxy
+from orchestrator.result_cache import ResultCache
+
+
+class StubPool:
+    """Connection pool counting tool calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def call_tool(self, tool_name, arguments, server, cli_fallback=True):
+        self.calls += 1
+        return {"items": [arguments.get("q")], "call": self.calls}
+
+    async def invalidate_server_cache(self, server):
+        pass
+
+    async def close_session(self, server):
+        pass
+
+
+@pytest.fixture
+async def setup():
+    pool = StubPool()
+    proxy = ToolProxy(pool, result_cache=ResultCache(ttl=60, patterns=["github__list_*"]))
+    await proxy.register_server("github", [Tool(name="list_issues"), Tool(name="create_issue")])
+    return pool, proxy
+
+
+async def test_hit_and_miss_by_arguments(setup):
+    pool, proxy = setup
+
+    first, _ = await proxy.call_tool("list_issues", {"q": "bug"})
+    second, _ = await proxy.call_tool("list_issues", {"q": "bug"})
+    other, _ = await proxy.call_tool("list_issues", {"q": "docs"})
+
+    assert first == second == {"items": ["bug"], "call": 1}
+    assert other == {"items": ["docs"], "call": 2}
+    assert pool.calls == 2
+
+
+async def test_only_matching_tools_are_cached(setup):
+    pool, proxy = setup
+
+    await proxy.call_tool("create_issue", {"q": "bug"})
+    await proxy.call_tool("create_issue", {"q": "bug"})
+
+    assert pool.calls == 2
+
+
+async def test_bypass_cache_refreshes_entry(setup):
+    pool, proxy = setup
+
+    await proxy.call_tool("list_issues", {"q": "bug"})
+    fresh, _ = await proxy.call_tool("list_issues", {"q": "bug"}, bypass_cache=True)
+    cached, _ = await proxy.call_tool("list_issues", {"q": "bug"})
+
+    assert fresh == cached == {"items": ["bug"], "call": 2}
+
+
+@pytest.mark.parametrize("change", ["register", "unregister"])
+async def test_server_changes_invalidate_results(setup, change):
+    pool, proxy = setup
+    await proxy.call_tool("list_issues", {"q": "bug"})
+
+    if change == "register":
+        await proxy.register_server("github", [Tool(name="list_issues")])
+    else:
+        await proxy.unregister_server("github")
+        await proxy.register_server("github", [Tool(name="list_issues")])
+    result, _ = await proxy.call_tool("list_issues", {"q": "bug"})
+
+    assert result["call"] == 2
+
+
+async def test_cached_result_is_not_shared_with_callers(setup):
+    _, proxy = setup
+
+    first, _ = await proxy.call_tool("list_issues", {"q": "bug"})
+    first["items"].append("changed")
+    second, _ = await proxy.call_tool("list_issues", {"q": "bug"})
+    second["items"].append("changed again")
+    third, _ = await proxy.call_tool("list_issues", {"q": "bug"})
+
+    assert third == {"items": ["bug"], "call": 1}
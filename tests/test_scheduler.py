@@ -0,0 +1,54 @@
+"""Tests for ToolCallScheduler."""
+
+import asyncio
+import time
+
+from orchestrator.scheduler import ToolCallScheduler
+
+
+async def test_idle_server_not_blocked_by_saturated_server():
+    scheduler = ToolCallScheduler(max_concurrent=5, max_per_server=1, call_timeout=5)
+    release = asyncio.Event()
+
+    async def blocked():
+        await release.wait()
+
+    running = asyncio.create_task(scheduler.run("a", blocked))
+    queued = asyncio.create_task(scheduler.run("a", blocked))
+    await asyncio.sleep(0.01)
+    assert scheduler.get_stats()["waiting"] == 1
+
+    started = time.monotonic()
+
+    async def idle():
+        return "b"
+
+    assert await scheduler.run("b", idle) == "b"
+    assert time.monotonic() - started < 0.1
+
+    release.set()
+    await asyncio.gather(running, queued)
+    assert scheduler.get_stats()["active"] == 0
+
+
+async def test_cancelled_waiter_lets_next_waiter_start():
+    scheduler = ToolCallScheduler(max_concurrent=1, max_per_server=1, call_timeout=5)
+    release = asyncio.Event()
+
+    async def blocked():
+        await release.wait()
+
+    async def done():
+        return "ok"
+
+    running = asyncio.create_task(scheduler.run("a", blocked))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(scheduler.run("a", done))
+    waiting = asyncio.create_task(scheduler.run("a", done))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    release.set()
+
+    assert await waiting == "ok"
+    await running
+    assert scheduler.get_stats()["waiting"] == 0
@@ -0,0 +1,92 @@
+"""Tests for the published tool list of OrchestratorServer."""
+
+from types import SimpleNamespace
+
+import pytest
+import yaml
+from mcp.server.lowlevel.server import request_ctx
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from orchestrator.models import Tool
+from orchestrator.server import OrchestratorServer
+
+
+class StubSession:
+    """Client session counting tools/list_changed notifications."""
+
+    def __init__(self):
+        self.list_changed = 0
+
+    async def send_tool_list_changed(self):
+        self.list_changed += 1
+
+
+@pytest.fixture
+def server(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump({"orchestrator": {"proxy": {"expose_tools": True}}}))
+    return OrchestratorServer(str(config_path))
+
+
+@pytest.fixture
+def session():
+    session = StubSession()
+    token = request_ctx.set(SimpleNamespace(session=session))
+    yield session
+    request_ctx.reset(token)
+
+
+async def call(server, name, arguments=None):
+    """Call a tool through the MCP request handler."""
+    request = CallToolRequest(params=CallToolRequestParams(name=name, arguments=arguments or {}))
+    return (await server.server.request_handlers[CallToolRequest](request)).root
+
+
+def tool_names(server):
+    return [tool.name for tool in server._current_tools()]
+
+
+async def test_tools_version_bumps_only_when_published_list_changes(server):
+    assert server.tools_version == 0
+    assert "github__search" not in tool_names(server)
+
+    await server.proxy.register_server("github", [Tool(name="search")])
+    assert "github__search" in tool_names(server)
+    assert server.tools_version == 1
+
+    # Same tools again: the proxy version moves, the published list doesn't
+    await server.proxy.register_server("github", [Tool(name="search")])
+    tool_names(server)
+    assert server.tools_version == 1
+
+    await server.proxy.unregister_server("github")
+    assert "github__search" not in tool_names(server)
+    assert server.tools_version == 2
+
+
+async def test_list_changed_is_sent_once_per_change(server, session):
+    await call(server, "list_active_tools")
+    assert session.list_changed == 0
+
+    await server.proxy.register_server("github", [Tool(name="search")])
+    await call(server, "list_active_tools")
+    await call(server, "list_active_tools")
+    assert session.list_changed == 1
+
+    await server.proxy.unregister_server("github")
+    await call(server, "list_active_tools")
+    assert session.list_changed == 2
+
+
+async def test_pass_through_call_sends_pending_list_changed(server, session):
+    async def call_tool(tool_name, arguments, server, cli_fallback=True):
+        return {"server": server, "tool": tool_name}
+
+    server.connection_pool.call_tool = call_tool
+    await server.proxy.register_server("github", [Tool(name="search")])
+    tool_names(server)
+
+    result = await call(server, "github__search")
+
+    assert not result.isError
+    assert session.list_changed == 1